@@ -34,6 +34,14 @@ def run(
             help="Action to take if job currently running ['WAIT', 'CANCEL', 'FAIL']",
         ),
     ] = "WAIT",
+    select: Annotated[
+        str,
+        typer.Option(
+            "--select",
+            "-s",
+            help="Pipeline nodes selector such as 'node+' or '+node' (pipeline job only)",
+        ),
+    ] = None,
     environment: Annotated[
         str, typer.Option("--env", "-e", help="Name of the environment")
     ] = None,
@@ -58,6 +66,10 @@ def run(
         Action to take for currently running job or pipline.
     full_refresh:
         Full tables refresh (pipline only)
+    select:
+        Comma-separated pipeline nodes selectors. `node+` selects a node and
+        its downstream nodes and `+node` a node and its upstream nodes. Only
+        the tasks of the selected nodes are run (pipeline job only).
     environment:
         Name of the environment.
     filepath:
@@ -67,6 +79,7 @@ def run(
     --------
     ```cmd
     laktory run --env dev --dlt pl-stock-prices --full_refresh --action CANCEL
+    laktory run --env dev --job job-pl-stock-prices --select slv_stock_prices+
     ```
     """
 
@@ -75,6 +88,8 @@ def run(
         raise ValueError("Only one of `job` or `dlt` should be set.")
     if not (job or dlt):
         raise ValueError("One of `job` or `dlt` should be set.")
+    if select and not job:
+        raise ValueError("`select` is only supported with `job`.")
 
     # Set Dispatcher
     controller = CLIController(
@@ -90,6 +105,7 @@ def run(
             timeout=timeout,
             raise_exception=raise_exception,
             current_run_action=current_run_action,
+            select=select,
         )
 
     if dlt:
@@ -70,7 +70,7 @@ class Dispatcher:
 
             if pl.databricks_job is not None:
                 self.resources[pl.databricks_job.name] = JobRunner(
-                    dispatcher=self, name=pl.databricks_job.name
+                    dispatcher=self, name=pl.databricks_job.name, pipeline=pl
                 )
 
         for k, pl in self.stack.resources.databricks_dltpipelines.items():
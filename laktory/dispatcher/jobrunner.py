@@ -2,7 +2,11 @@ from __future__ import annotations
 
 import time
 from typing import TYPE_CHECKING
+from typing import Any
 from typing import Literal
+from typing import Union
+
+from pydantic import Field
 
 from laktory._logger import get_logger
 from laktory.dispatcher.dispatcherrunner import DispatcherRunner
@@ -17,8 +21,15 @@ logger = get_logger(__name__)
 class JobRunner(DispatcherRunner):
     """
     Job runner.
+
+    Attributes
+    ----------
+    pipeline:
+        Pipeline orchestrated by the job, if any. Required to run a selection
+        of the pipeline nodes.
     """
 
+    pipeline: Any = Field(default=None, exclude=True)
     _run_start: Wait = None
     _run: Run = None
 
@@ -37,6 +48,7 @@ class JobRunner(DispatcherRunner):
         timeout: int = 20 * 60,
         raise_exception: bool = False,
         current_run_action: Literal["WAIT", "CANCEL", "FAIL"] = "WAIT",
+        select: Union[str, list[str]] = None,
     ):
         """
         Run remote job and monitor failures.
@@ -56,6 +68,10 @@ class JobRunner(DispatcherRunner):
                 - WAIT: wait for the current run to complete
                 - CANCEL: cancel the current run
                 - FAIL: raise an exception
+        select:
+            Pipeline node selector(s) such as `node+` or `+node`. Only the
+            tasks of the selected nodes are run. Only supported for jobs
+            orchestrating a pipeline.
 
         Returns
         -------
@@ -65,6 +81,15 @@ class JobRunner(DispatcherRunner):
         from databricks.sdk.errors import OperationFailed
         from databricks.sdk.service.jobs import RunLifeCycleState
 
+        only = None
+        if select:
+            if self.pipeline is None:
+                raise ValueError(
+                    f"Job {self.name} does not orchestrate a pipeline. Nodes can't be selected."
+                )
+            only = ["node-" + n for n in self.pipeline.select_nodes(select)]
+            logger.info(f"Job {self.name} selected tasks: {only}")
+
         active_runs = list(self.wc.jobs.list_runs(job_id=self.id, active_only=True))
 
         if len(active_runs) > 0:
@@ -94,6 +119,7 @@ class JobRunner(DispatcherRunner):
         logger.info(f"Job {self.name} run started...")
         self._run_start = self.wc.jobs.run_now(
             job_id=self.id,
+            only=only,
         )
 
         pstates = {}
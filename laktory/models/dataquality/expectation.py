@@ -267,13 +267,7 @@ class DataQualityExpectation(BaseModel):
         )
 
         # Assign DataFrame type
-        dtype = str(type(df)).lower()
-        if "spark" in dtype:
-            self._dataframe_backend = "SPARK"
-        elif "polars" in dtype:
-            self._dataframe_backend = "POLARS"
-        else:
-            raise ValueError(f"DataFrame type '{dtype}' not supported")
+        self._dataframe_backend = self._get_dataframe_backend(df)
 
         # Run Check
         self._check = self._check_df(df)
@@ -283,59 +277,169 @@ class DataQualityExpectation(BaseModel):
 
         return self._check
 
-    def _check_df(self, df):
-        if self._dataframe_backend == "SPARK":
-            rows_count = df.count()
-        elif self._dataframe_backend == "POLARS":
-            import polars as pl
+    @classmethod
+    def run_checks(
+        cls,
+        expectations: list["DataQualityExpectation"],
+        df: AnyDataFrame,
+        raise_or_warn: bool = False,
+        node=None,
+    ) -> list[DataQualityCheck]:
+        """
+        Check multiple expectations against the same DataFrame and save
+        results. The rows count and the fails count of all `ROW` expectations
+        are computed in a single aggregation, scanning the DataFrame only
+        once.
 
-            rows_count = df.select(pl.len()).collect().item()
+        Parameters
+        ----------
+        expectations:
+            Expectations to check
+        df:
+            Input DataFrame for checking the expectations.
+        raise_or_warn:
+            Raise exception or issue warning if an expectation is not met.
+        node:
+            Pipeline Node
 
-        if rows_count == 0:
-            _check = DataQualityCheck(
-                fails_count=0,
-                status="PASS",
-                rows_count=0,
+        Returns
+        -------
+        output: list[DataQualityCheck]
+            Check result of each expectation.
+        """
+        if not expectations:
+            return []
+
+        dataframe_backend = cls._get_dataframe_backend(df)
+        for e in expectations:
+            logger.info(
+                f"Checking expectation '{e.name}' | {e.expr.value} (type: {e.type})"
             )
-            return _check
+            e._dataframe_backend = dataframe_backend
+
+        # Single pass for all row expectations
+        row_expectations = [e for e in expectations if e.type == "ROW"]
+        rows_count, fails_counts = cls._count_fails(
+            df, row_expectations, dataframe_backend
+        )
+        for e, fails_count in zip(row_expectations, fails_counts):
+            e._check = e._build_row_check(rows_count, fails_count)
+
+        for e in expectations:
+            if e.type != "ROW":
+                e._check = e._check_df(df, rows_count=rows_count)
+
+        if raise_or_warn:
+            for e in expectations:
+                e.raise_or_warn(node)
+
+        return [e.check for e in expectations]
+
+    @staticmethod
+    def _get_dataframe_backend(df) -> str:
+        dtype = str(type(df)).lower()
+        if "spark" in dtype:
+            return "SPARK"
+        elif "polars" in dtype:
+            return "POLARS"
+        raise ValueError(f"DataFrame type '{dtype}' not supported")
+
+    @staticmethod
+    def _count_fails(
+        df, expectations: list["DataQualityExpectation"], dataframe_backend: str
+    ) -> tuple[int, list[int]]:
+        """
+        Compute rows count and the fails count of each row expectation in a
+        single aggregation.
+        """
+        if dataframe_backend == "SPARK":
+            import pyspark.sql.functions as F
+
+            aggs = [F.count(F.lit(1))]
+            for e in expectations:
+                aggs += [F.sum(F.when(e.fail_filter, 1).otherwise(0))]
 
-        if self.type == "ROW":
             try:
-                df_fail = df.filter(self.fail_filter)
+                row = df.agg(*aggs).first()
             except Exception as e:
                 if "Rewrite the query to avoid window functions" in getattr(
                     e, "desc", ""
                 ):
-                    e.desc += f"\n{self.type_warning_msg}"
+                    msgs = [_e.type_warning_msg for _e in expectations]
+                    e.desc += "\n" + "\n".join([m for m in msgs if m])
                 raise e
+            counts = list(row)
+
+        elif dataframe_backend == "POLARS":
+            import polars as pl
+
+            exprs = [pl.len().alias("__rows_count")]
+            for i, e in enumerate(expectations):
+                exprs += [e.fail_filter.sum().alias(f"__fails_count_{i}")]
+            _df = df.select(exprs)
+            if isinstance(_df, pl.LazyFrame):
+                _df = _df.collect()
+            counts = list(_df.row(0))
+
+        else:
+            raise ValueError(f"DataFrame type '{dataframe_backend}' not supported")
+
+        rows_count = counts[0]
+        fails_counts = [c or 0 for c in counts[1:]]
+
+        return rows_count, fails_counts
+
+    def _build_row_check(self, rows_count: int, fails_count: int) -> DataQualityCheck:
+        if rows_count == 0:
+            return DataQualityCheck(
+                fails_count=0,
+                status="PASS",
+                rows_count=0,
+            )
+
+        status = "PASS"
+        if self.tolerance.abs is not None:
+            if fails_count > self.tolerance.abs:
+                status = "FAIL"
+        elif self.tolerance.rel is not None:
+            if rows_count > 0 and fails_count / rows_count > self.tolerance.rel:
+                status = "FAIL"
+
+        _check = DataQualityCheck(
+            fails_count=fails_count,
+            status=status,
+            rows_count=rows_count,
+        )
+        failure_str = f"({100 * _check.failure_rate:5.2f}%)"
+        if status == "PASS":
+            logger.info(f"Checking expectation '{self.name}' | status : {status}")
+        else:
+            logger.info(
+                f"Checking expectation '{self.name}' | status : {status} - failed rows : {fails_count} {failure_str}"
+            )
+        return _check
+
+    def _check_df(self, df, rows_count: int = None):
+        if self.type == "ROW":
+            rows_count, fails_counts = self._count_fails(
+                df, [self], self._dataframe_backend
+            )
+            return self._build_row_check(rows_count, fails_counts[0])
 
+        if rows_count is None:
             if self._dataframe_backend == "SPARK":
-                fails_count = df_fail.count()
+                rows_count = df.count()
             elif self._dataframe_backend == "POLARS":
                 import polars as pl
 
-                fails_count = df_fail.select(pl.len()).collect().item()
-
-            status = "PASS"
-            if self.tolerance.abs is not None:
-                if fails_count > self.tolerance.abs:
-                    status = "FAIL"
-            elif self.tolerance.rel is not None:
-                if rows_count > 0 and fails_count / rows_count > self.tolerance.rel:
-                    status = "FAIL"
+                rows_count = df.select(pl.len()).collect().item()
 
+        if rows_count == 0:
             _check = DataQualityCheck(
-                fails_count=fails_count,
-                status=status,
-                rows_count=rows_count,
+                fails_count=0,
+                status="PASS",
+                rows_count=0,
             )
-            failure_str = f"({100 * _check.failure_rate:5.2f}%)"
-            if status == "PASS":
-                logger.info(f"Checking expectation '{self.name}' | status : {status}")
-            else:
-                logger.info(
-                    f"Checking expectation '{self.name}' | status : {status} - failed rows : {fails_count} {failure_str}"
-                )
             return _check
 
         if self.type == "AGGREGATE":
@@ -1,7 +1,10 @@
 from typing import Union
 
 from .basedatasink import BaseDataSink
+from .basedatasink import DataSinkMaintenance
 from .basedatasink import DataSinkMergeCDCOptions
+from .basedatasink import DataSinkMetrics
+from .basedatasink import DataSinkTrigger
 from .filedatasink import FileDataSink
 from .tabledatasink import TableDataSink
 
@@ -1,4 +1,7 @@
+import datetime
 import hashlib
+import json
+import math
 import os
 import shutil
 import uuid
@@ -21,6 +24,115 @@ from laktory.typing import AnyDataFrame
 logger = get_logger(__name__)
 
 
+class DataSinkTrigger(BaseModel):
+    """
+    Trigger of the Spark structured streaming query writing a streaming
+    DataFrame.
+
+    Attributes
+    ----------
+    await_termination:
+        If `True`, execution waits for the streaming query to terminate. Set
+        to `False` for long-running queries, typically with `PROCESSING_TIME`
+        or `CONTINUOUS` triggers. The started query is available from the
+        sink (or node) `streaming_query` attribute.
+    interval:
+        Interval between micro-batches with `PROCESSING_TIME` trigger or
+        between checkpoints with `CONTINUOUS` trigger, e.g. "10 seconds".
+    type:
+        Trigger type.
+        - available_now: process all available data in multiple
+        micro-batches and stop
+        - once: process all available data in a single micro-batch and stop
+        - processing_time: run a micro-batch every `interval`
+        - continuous: low-latency continuous processing with checkpoints
+        every `interval`. Not supported with merge or expectations.
+
+    Examples
+    --------
+    ```py
+    from laktory import models
+
+    trigger = models.DataSinkTrigger(type="PROCESSING_TIME", interval="30 seconds")
+    print(trigger.kwargs)
+    # > {'processingTime': '30 seconds'}
+    ```
+
+    References
+    ----------
+    - [Structured Streaming triggers](https://spark.apache.org/docs/latest/structured-streaming-programming-guide.html#triggers)
+    """
+
+    await_termination: bool = True
+    interval: str = None
+    type: Literal["AVAILABLE_NOW", "ONCE", "PROCESSING_TIME", "CONTINUOUS"] = (
+        "AVAILABLE_NOW"
+    )
+
+    @model_validator(mode="after")
+    def interval_required(self) -> Any:
+        if self.type in ["PROCESSING_TIME", "CONTINUOUS"] and self.interval is None:
+            raise ValueError(f"`interval` is required with '{self.type}' trigger.")
+        return self
+
+    @property
+    def kwargs(self) -> dict[str, Any]:
+        """Keyword arguments for spark `DataStreamWriter.trigger`"""
+        if self.type == "ONCE":
+            return {"once": True}
+        if self.type == "PROCESSING_TIME":
+            return {"processingTime": self.interval}
+        if self.type == "CONTINUOUS":
+            return {"continuous": self.interval}
+        return {"availableNow": True}
+
+    def start(self, writer, for_each_batch=False, **kwargs):
+        """
+        Set trigger on a stream writer, start the query and await its
+        termination if `await_termination` is `True`.
+
+        Parameters
+        ----------
+        writer:
+            Spark DataStreamWriter
+        for_each_batch:
+            If `True`, writer is processed with `foreachBatch` which is not
+            supported by continuous trigger.
+        kwargs:
+            Keyword arguments passed to `writer.start`
+
+        Returns
+        -------
+        :
+            Streaming query
+        """
+        if for_each_batch and self.type == "CONTINUOUS":
+            raise ValueError(
+                "'CONTINUOUS' trigger is not supported with `foreachBatch` streams (merge, expectations)."
+            )
+
+        query = writer.trigger(**self.kwargs).start(**kwargs)
+        self.await_query(query)
+        return query
+
+    def await_query(self, query):
+        """
+        Await the termination of a streaming query if `await_termination` is
+        `True`.
+
+        Parameters
+        ----------
+        query:
+            Spark StreamingQuery
+        """
+        if self.await_termination:
+            query.awaitTermination()
+        else:
+            logger.info(
+                f"Streaming query {query.id} started with {self.type} trigger and not awaited"
+            )
+
+
 class DataSinkMergeCDCOptions(BaseModel):
     """
     Options for merging a change data capture (CDC).
@@ -39,6 +151,23 @@ class DataSinkMergeCDCOptions(BaseModel):
         used when using Databricks DLT which does not allow column rename.
     exclude_columns:
         A subset of columns to exclude in the target table.
+    hash_function:
+        Function used to match source and target rows on primary keys and,
+        with SCD type 2, to detect changes in the update columns.
+        - `SHA2`: hex string SHA-256 digest of the `~` separated values. Null
+          values are skipped. Default for compatibility with existing targets.
+        - `XXHASH64`: 64-bit long hash of the values and of their null flags.
+          The hash is used as the match key and distinct keys could collide,
+          which becomes plausible for tables with billions of keys.
+        - `MD5`: 16 bytes binary digest of the JSON encoded values.
+        - `NONE`: no hash column is stored and rows are matched (or compared)
+          on each column using null-safe equality.
+        Only `SHA2` and `NONE` are supported with Polars. Polars `SHA2` hashes
+        match Spark for string, integer, boolean, date and timestamp columns,
+        and for floats not rendered in scientific notation by Spark (below
+        1e-3 or from 1e7). They are computed natively when `polars-hash` is
+        installed. Changing the hash function of an existing target requires
+        a full refresh.
     ignore_null_updates:
         Allow ingesting updates containing a subset of the target columns.
         When a CDC event matches an existing row and ignore_null_updates is
@@ -49,6 +178,10 @@ class DataSinkMergeCDCOptions(BaseModel):
     include_columns:
         A subset of columns to include in the target table. Use
         `include_columns` to specify the complete list of columns to include.
+    merge_target_filter:
+        SQL predicate on the target columns added to the merge condition to
+        restrict the target rows (and files) scanned for matches. It must be
+        true for all target rows that can match a source row.
     order_by:
         The column name specifying the logical order of CDC events in the
         source data. Used to handle change events that arrive out of order.
@@ -56,6 +189,16 @@ class DataSinkMergeCDCOptions(BaseModel):
         The column or combination of columns that uniquely identify a row in
         the source data. This is used to identify which CDC events apply to
         specific records in the target table.
+    prune_columns:
+        Columns, typically the target partition or clustering columns, used
+        to derive pruning predicates from the source (micro-)batch and
+        allowing Delta to skip target files. For each column, the target is
+        restricted to the distinct source values, or to the source min/max
+        range when there are more than `prune_max_values` distinct values.
+        Values of these columns must not change for a given primary key.
+    prune_max_values:
+        Maximum number of distinct source values of a prune column for
+        which an `IN` predicate is used instead of a min/max range.
     scd_type:
         Whether to store records as SCD type 1 or SCD type 2.
     start_at_column_name:
@@ -73,10 +216,14 @@ class DataSinkMergeCDCOptions(BaseModel):
     delete_where: str = None
     end_at_column_name: str = "__end_at"
     exclude_columns: list[str] = None
+    hash_function: Literal["SHA2", "XXHASH64", "MD5", "NONE"] = "SHA2"
     ignore_null_updates: bool = False
     include_columns: list[str] = None
+    merge_target_filter: str = None
     order_by: str = None
     primary_keys: list[str] = None
+    prune_columns: list[str] = None
+    prune_max_values: int = 20
     scd_type: Literal[1, 2] = 1
     start_at_column_name: str = "__start_at"
     # track_history_columns: Union[list[str], None] = None
@@ -162,9 +309,31 @@ class DataSinkMergeCDCOptions(BaseModel):
     def hash_cols(self):
         return "__hash_cols"
 
+    @property
+    def key_columns(self):
+        if self.hash_function == "NONE":
+            return self.primary_keys
+        return [self.hash_keys]
+
+    @property
+    def compare_columns(self):
+        if self.hash_function == "NONE":
+            return self.update_columns
+        return [self.hash_cols]
+
+    @property
+    def hash_type(self):
+        import pyspark.sql.types as T
+
+        return {
+            "SHA2": T.StringType(),
+            "XXHASH64": T.LongType(),
+            "MD5": T.BinaryType(),
+        }[self.hash_function]
+
     @property
     def source_columns(self):
-        return [f.name for f in self._source_schema]
+        return self._source_columns
 
     @property
     def update_columns(self):
@@ -178,9 +347,13 @@ class DataSinkMergeCDCOptions(BaseModel):
 
     @property
     def extra_columns(self):
-        cols = [self.hash_keys]
+        cols = []
+        if self.hash_function != "NONE":
+            cols += [self.hash_keys]
         if self.scd_type == 2:
-            cols += [self.start_at, self.end_at, self.hash_cols]
+            cols += [self.start_at, self.end_at]
+            if self.hash_function != "NONE":
+                cols += [self.hash_cols]
         return cols
 
     @property
@@ -199,6 +372,10 @@ class DataSinkMergeCDCOptions(BaseModel):
     def source_delete_where(self):
         return self._add_alias(self.delete_where)
 
+    @property
+    def target_merge_target_filter(self):
+        return self._add_alias(self.merge_target_filter, prefix="target")
+
     # ----------------------------------------------------------------------- #
     # Methods                                                                 #
     # ----------------------------------------------------------------------- #
@@ -254,21 +431,137 @@ class DataSinkMergeCDCOptions(BaseModel):
 
         return new_expr
 
+    def _hash(self, columns: list[str]):
+        import pyspark.sql.functions as F
+
+        if self.hash_function == "SHA2":
+            return F.sha2(F.concat_ws("~", *columns), 256)
+
+        if self.hash_function == "XXHASH64":
+            # Null flags prevent collisions between values shifted by a null
+            cols = []
+            for c in columns:
+                cols += [F.col(c), F.col(c).isNull()]
+            return F.xxhash64(*cols)
+
+        if self.hash_function == "MD5":
+            # Null fields are omitted from the JSON object, keyed by position
+            struct = F.struct(*[F.col(c).alias(str(i)) for i, c in enumerate(columns)])
+            return F.unhex(F.md5(F.to_json(struct)))
+
+        raise ValueError(f"Hash function '{self.hash_function}' is not supported.")
+
+    def _keys_condition(self, left="target", right="source"):
+        import pyspark.sql.functions as F
+
+        condition = None
+        for c in self.key_columns:
+            _condition = F.col(f"{left}.{c}").eqNullSafe(F.col(f"{right}.{c}"))
+            if condition is None:
+                condition = _condition
+            else:
+                condition = condition & _condition
+        return condition
+
+    def _get_prune_filters(self, source: SparkDataFrame) -> list:
+        """
+        Build pruning predicates for the target from the values of the prune
+        columns in the source.
+
+        Parameters
+        ----------
+        source:
+            Source DataFrame to merge into target
+
+        Returns
+        -------
+        :
+            List of (target-aliased, non-aliased) predicate pairs
+        """
+        import pyspark.sql.functions as F
+
+        filters = []
+
+        if self.merge_target_filter:
+            filters += [
+                (
+                    F.expr(self.target_merge_target_filter),
+                    F.expr(self.merge_target_filter),
+                )
+            ]
+
+        if not self.prune_columns:
+            return filters
+
+        # Source stats in a single pass
+        aggs = []
+        for c in self.prune_columns:
+            aggs += [
+                F.min(c).alias(f"{c}_min"),
+                F.max(c).alias(f"{c}_max"),
+                F.count_distinct(c).alias(f"{c}_count"),
+                F.max(F.col(c).isNull()).alias(f"{c}_has_null"),
+            ]
+        stats = source.agg(*aggs).collect()[0]
+
+        for c in self.prune_columns:
+            _min = stats[f"{c}_min"]
+            _max = stats[f"{c}_max"]
+            count = stats[f"{c}_count"]
+            has_null = stats[f"{c}_has_null"]
+
+            if count == 0:
+                # Empty source or only nulls
+                values = None
+            elif count <= self.prune_max_values:
+                rows = (
+                    source.select(c).filter(F.col(c).isNotNull()).distinct().collect()
+                )
+                values = sorted([row[0] for row in rows])
+            else:
+                values = None
+
+            _filters = []
+            for col in [F.col(f"target.{c}"), F.col(c)]:
+                if count == 0:
+                    _filter = F.lit(False)
+                elif values is not None:
+                    _filter = col.isin(values)
+                else:
+                    _filter = col.between(F.lit(_min), F.lit(_max))
+                if has_null:
+                    _filter = _filter | col.isNull()
+                _filters += [_filter]
+
+            logger.info(f"Pruning merge target with {_filters[1]}")
+            filters += [tuple(_filters)]
+
+        return filters
+
     def _init_target(self, source):
         import pyspark.sql.types as T
 
         spark = source.sparkSession
         logger.info(f"Merge target not found. Creating empty table at {self.target_id}")
         schema = source.select(self.primary_keys + self.update_columns).schema
-        schema.add(T.StructField(self.hash_keys, T.StringType(), True))
+        if self.hash_function != "NONE":
+            schema.add(T.StructField(self.hash_keys, self.hash_type, True))
         if self.scd_type == 2:
-            schema.add(T.StructField(self.hash_cols, T.StringType(), True))
+            if self.hash_function != "NONE":
+                schema.add(T.StructField(self.hash_cols, self.hash_type, True))
             schema.add(T.StructField(self.start_at, self.index_type, True))
             schema.add(T.StructField(self.end_at, self.index_type, True))
 
         df = spark.createDataFrame(data=[], schema=schema)
 
+        if self.sink.cluster_by:
+            self.sink._create_clustered_table(df)
+            return
+
         writer = df.write.format("delta").mode("OVERWRITE")
+        writer = writer.options(**self.sink._commit_metadata)
+        if self.sink.partition_by:
+            writer = writer.partitionBy(*self.sink.partition_by)
         if self.target_path:
             writer.save(self.target_path)
         else:
@@ -288,19 +581,20 @@ class DataSinkMergeCDCOptions(BaseModel):
         if self.delete_where:
             logger.info(f"with delete on {self.delete_where}")
 
+        # Target pruning predicates
+        prune_filters = self._get_prune_filters(source)
+
         # Add internal columns
-        source = source.withColumn(
-            self.hash_keys, F.lit(F.sha2(F.concat_ws("~", *self.primary_keys), 256))
-        )
+        if self.hash_function != "NONE":
+            source = source.withColumn(self.hash_keys, self._hash(self.primary_keys))
         if self.scd_type == 2:
-            source = (
-                source.withColumn(self.start_at, F.col(self.index))
-                .withColumn(self.end_at, F.lit(None).cast(self.index_type))
-                .withColumn(
-                    self.hash_cols,
-                    F.lit(F.sha2(F.concat_ws("~", *self.update_columns), 256)),
-                )
+            source = source.withColumn(self.start_at, F.col(self.index)).withColumn(
+                self.end_at, F.lit(None).cast(self.index_type)
             )
+            if self.hash_function != "NONE":
+                source = source.withColumn(
+                    self.hash_cols, self._hash(self.update_columns)
+                )
 
         # Process History
         if self.index:
@@ -336,9 +630,12 @@ class DataSinkMergeCDCOptions(BaseModel):
                 not_delete_condition = ~delete_condition
 
             # Define merge
+            condition = self._keys_condition()
+            for _filter, _ in prune_filters:
+                condition = condition & _filter
             merge = table_target.alias("target").merge(
                 source.alias("source"),
-                condition=f"source.{self.hash_keys} = target.{self.hash_keys}",
+                condition=condition,
             )
 
             # Update
@@ -378,69 +675,476 @@ class DataSinkMergeCDCOptions(BaseModel):
 
             logger.info("Executing merge...")
             merge.execute()
+            self._add_merge_version(table_target)
 
         elif self.scd_type == 2:
-            delete_condition = F.coalesce(F.expr(self.delete_where), F.lit(False))
-            not_delete_condition = ~delete_condition
+            delete_condition = F.lit(False)
+            if self.delete_where:
+                delete_condition = F.coalesce(F.expr(self.delete_where), F.lit(False))
+            source = source.withColumn("__to_delete", delete_condition)
 
-            # Only select rows that have been updated
+            # Current target rows for keys present in the batch
             if self.target_path:
                 target = spark.read.format("delta").load(self.target_path)
             else:
                 target = spark.read.table(self.target_name)
-            upsert_or_delete = source.withColumn("__to_delete", delete_condition).join(
-                other=target.withColumn("__to_delete", F.lit(False)),
-                on=[self.hash_cols, self.hash_keys, "__to_delete"],
-                how="leftanti",
+            target = target.filter(F.col(self.end_at).isNull())
+            for _, _filter in prune_filters:
+                target = target.filter(_filter)
+            target_columns = self.key_columns + self.compare_columns
+            target = target.select(
+                *[F.col(c).alias(f"__target_{c}") for c in target_columns],
+                F.lit(True).alias("__is_current"),
+            )
+            join_condition = None
+            for c in self.key_columns:
+                _condition = F.col(c).eqNullSafe(F.col(f"__target_{c}"))
+                if join_condition is None:
+                    join_condition = _condition
+                else:
+                    join_condition = join_condition & _condition
+            source = source.join(target, on=join_condition, how="left")
+
+            # Only keep rows that differ from current target rows
+            unchanged = F.coalesce(F.col("__is_current"), F.lit(False))
+            unchanged = unchanged & ~F.col("__to_delete")
+            for c in self.compare_columns:
+                unchanged = unchanged & F.col(c).eqNullSafe(F.col(f"__target_{c}"))
+            upsert_or_delete = source.filter(~unchanged).drop(
+                *[f"__target_{c}" for c in target_columns]
             )
 
+            # Staged union: latest rows of existing keys expire the current row
+            # and new versions are inserted.
+            expire = upsert_or_delete.filter(
+                F.col(self.end_at).isNull() & F.col("__is_current")
+            ).withColumn("__is_expire", F.lit(True))
+            insert = upsert_or_delete.filter(~F.col("__to_delete")).withColumn(
+                "__is_expire", F.lit(False)
+            )
+            staged = expire.unionByName(insert)
+
             # Merge
-            condition = F.expr(f"source.{self.hash_keys} = target.{self.hash_keys}")
+            condition = self._keys_condition() & F.col("source.__is_expire")
             condition = condition & F.expr(f"target.{self.end_at} IS NULL")
+            for _filter, _ in prune_filters:
+                condition = condition & _filter
             merge = table_target.alias("target").merge(
-                upsert_or_delete.filter(F.col(self.end_at).isNull()).alias("source"),
+                staged.alias("source"),
                 condition=condition,
             )
 
             # Expire the current record
             _set = {f"target.{self.end_at}": f"source.{self.index_fist}"}
             merge = merge.whenMatchedUpdate(set=_set)
-            #
-            # # TODO: Review if required
-            # if not self.delete_where:
-            #     _set = {f"target.{self.end_at}": f"source.{self.order_by}"}
-            #     merge = merge.whenMatchedUpdate(set=_set)
-            # else:
-            #     where = F.expr(self.source_delete_where)
-            #     # deleting
-            #     # _set = {f"target.{self.end_at}": "NULL"}
-            #     _set = {f"target.{self.end_at}": f"source.{self.order_by}"}
-            #     merge = merge.whenMatchedUpdate(set=_set, condition=where)
-            #
-            #     # updating
-            #     _set = {f"target.{self.end_at}": f"source.{self.order_by}"}
-            #     merge = merge.whenMatchedUpdate(set=_set, condition=~where)
+
+            # Insert new records
+            merge = merge.whenNotMatchedInsert(
+                values={f"target.{c}": f"source.{c}" for c in self.write_columns},
+                condition=~F.col("source.__is_expire"),
+            )
 
             logger.info("Executing merge...")
             merge.execute()
+            self._add_merge_version(table_target)
+
+        else:
+            raise ValueError(f"SCD Type {self.scd_type} is not supported.")
+
+    def _add_merge_version(self, table_target) -> None:
+        """
+        Record the version committed by a Spark merge for the sink metrics.
+
+        Spark merges can't be tagged with user metadata and the last commit
+        version of the session is shared with concurrent writers. The merge
+        commit is instead identified from the table history as the first
+        untagged MERGE commit following the version read before the write.
+        """
+        sink = self.sink
+        if sink is None or sink._write_version is None:
+            return
+
+        latest = table_target.history(1).select("version").collect()[0][0]
+        limit = latest - sink._write_version
+        if limit <= 0:
+            return
+
+        rows = (
+            table_target.history(limit)
+            .select("version", "operation", "userMetadata")
+            .collect()
+        )
+        versions = [
+            row["version"]
+            for row in rows
+            if row["version"] > sink._write_version
+            and row["operation"] == "MERGE"
+            and not row["userMetadata"]
+            and row["version"] not in sink._merge_versions
+        ]
+        if versions:
+            sink._merge_versions += [min(versions)]
 
-            # Append rows
-            upsert = upsert_or_delete
+    # ----------------------------------------------------------------------- #
+    # Polars                                                                  #
+    # ----------------------------------------------------------------------- #
+
+    @staticmethod
+    def _sql_literal(value) -> str:
+        if isinstance(value, bool):
+            return str(value).upper()
+        if isinstance(value, float) and not math.isfinite(value):
+            # Non-finite values are not SQL numeric literals
+            if math.isnan(value):
+                value = "NaN"
+            else:
+                value = "Infinity" if value > 0 else "-Infinity"
+            return f"CAST('{value}' AS DOUBLE)"
+        if isinstance(value, (int, float)):
+            return repr(value)
+        if isinstance(value, (datetime.date, datetime.datetime)):
+            value = value.isoformat()
+        value = str(value).replace("'", "''")
+        return f"'{value}'"
+
+    def _keys_predicate(self) -> list[str]:
+        if self.hash_function == "NONE":
+            return [
+                f"target.{c} IS NOT DISTINCT FROM source.{c}" for c in self.key_columns
+            ]
+        return [f"target.{c} = source.{c}" for c in self.key_columns]
+
+    def _get_prune_filters_polars(self, source: PolarsLazyFrame) -> list:
+        """
+        Build pruning predicates for the target from the values of the prune
+        columns in the source.
+
+        Parameters
+        ----------
+        source:
+            Source DataFrame to merge into target
+
+        Returns
+        -------
+        :
+            List of (target-aliased SQL, Polars expression) predicate pairs
+        """
+        import polars as pl
+
+        filters = []
+
+        if self.merge_target_filter:
+            filters += [
+                (
+                    self.target_merge_target_filter,
+                    pl.sql_expr(self.merge_target_filter),
+                )
+            ]
+
+        if not self.prune_columns:
+            return filters
+
+        # Source stats in a single pass
+        aggs = []
+        for c in self.prune_columns:
+            aggs += [
+                pl.col(c).drop_nulls().unique().sort().implode().alias(f"{c}_values"),
+                pl.col(c).min().alias(f"{c}_min"),
+                pl.col(c).max().alias(f"{c}_max"),
+                pl.col(c).is_null().any().alias(f"{c}_has_null"),
+            ]
+        stats = source.select(aggs).collect().row(0, named=True)
+
+        for c in self.prune_columns:
+            values = stats[f"{c}_values"]
+            _min = stats[f"{c}_min"]
+            _max = stats[f"{c}_max"]
+            has_null = stats[f"{c}_has_null"]
+
+            col = pl.col(c)
+            if len(values) == 0:
+                # Empty source or only nulls
+                _filter = pl.lit(False)
+                _sql = "FALSE"
+            elif len(values) <= self.prune_max_values:
+                _filter = col.is_in(values)
+                _values = ", ".join([self._sql_literal(v) for v in values])
+                _sql = f"target.{c} IN ({_values})"
+            else:
+                _filter = col.is_between(_min, _max)
+                _sql = f"target.{c} BETWEEN {self._sql_literal(_min)} AND {self._sql_literal(_max)}"
+            if has_null:
+                _filter = _filter | col.is_null()
+                _sql = f"({_sql} OR target.{c} IS NULL)"
+
+            logger.info(f"Pruning merge target with {_sql}")
+            filters += [(_sql, _filter)]
+
+        return filters
+
+    @staticmethod
+    def _sha256_polars(s):
+        import polars as pl
+
+        return pl.Series(
+            [hashlib.sha256(v.encode()).hexdigest() for v in s.to_list()],
+            dtype=pl.String,
+        )
+
+    def _hash_polars(self, columns: list[str]):
+        import polars as pl
+
+        if self.hash_function != "SHA2":
+            raise ValueError(
+                f"Hash function '{self.hash_function}' is not supported with Polars."
+            )
+
+        # Values are cast to string as Spark `concat_ws` does
+        values = []
+        for c in columns:
+            col = pl.col(c)
+            if self._source_schema[c] == pl.Datetime:
+                # Spark drops trailing zeros of the fractional seconds
+                col = col.dt.strftime("%Y-%m-%d %H:%M:%S%.f").str.replace(
+                    r"(\.\d*[1-9])0+$", "${1}"
+                )
+            values += [col.cast(pl.String)]
+        value = pl.concat_str(values, separator="~", ignore_nulls=True)
+
+        try:
+            import polars_hash  # noqa: F401
+
+            return value.chash.sha2_256()
+        except ModuleNotFoundError:
+            # Polars has no native SHA-256 so each batch is digested in Python
+            return value.map_batches(self._sha256_polars, return_dtype=pl.String)
+
+    def _init_target_polars(self, source: PolarsLazyFrame):
+        import polars as pl
+        from deltalake import DeltaTable
+
+        logger.info(f"Merge target not found. Creating empty table at {self.target_id}")
+        df = source.select(self.primary_keys + self.update_columns).clear().collect()
+        columns = []
+        if self.hash_function != "NONE":
+            columns += [pl.lit(None, dtype=pl.String).alias(self.hash_keys)]
+        if self.scd_type == 2:
+            if self.hash_function != "NONE":
+                columns += [pl.lit(None, dtype=pl.String).alias(self.hash_cols)]
+            index_type = self._source_schema[self.index]
+            columns += [
+                pl.lit(None, dtype=index_type).alias(self.start_at),
+                pl.lit(None, dtype=index_type).alias(self.end_at),
+            ]
+        schema = df.with_columns(columns).to_arrow().schema
+        DeltaTable.create(
+            self.target_path,
+            schema=schema,
+            partition_by=self.sink.partition_by,
+            custom_metadata=self.sink._commit_metadata,
+        )
+
+    def _execute_polars(self, source: PolarsLazyFrame):
+        import polars as pl
+        from deltalake import CommitProperties
+        from deltalake import DeltaTable
+
+        if self.target_path is None:
+            raise ValueError("Polars merge is only supported for `FileDataSink`.")
+
+        logger.info(
+            f"Executing merge on {self.target_id} with primary keys {self.primary_keys} and scd type {self.scd_type}"
+        )
+
+        if self.delete_where:
+            logger.info(f"with delete on {self.delete_where}")
+
+        source = source.lazy()
+
+        if not DeltaTable.is_deltatable(self.target_path):
+            self._init_target_polars(source)
+
+        # Target pruning predicates
+        prune_filters = self._get_prune_filters_polars(source)
+
+        # Add internal columns
+        if self.hash_function != "NONE":
+            source = source.with_columns(
+                self._hash_polars(self.primary_keys).alias(self.hash_keys)
+            )
+        if self.scd_type == 2:
+            index_type = self._source_schema[self.index]
+            source = source.with_columns(
+                pl.col(self.index).alias(self.start_at),
+                pl.lit(None, dtype=index_type).alias(self.end_at),
+            )
+            if self.hash_function != "NONE":
+                source = source.with_columns(
+                    self._hash_polars(self.update_columns).alias(self.hash_cols)
+                )
+
+        # Process History
+        if self.index:
+            source = source.sort(self.index, descending=True, nulls_last=True)
+            if self.scd_type == 1:
+                # Drop Duplicates
+                logger.info(
+                    f"Dropping duplicates using {self.primary_keys} and '{self.order_by}' as sequencing index"
+                )
+                source = source.unique(
+                    subset=self.primary_keys, keep="first", maintain_order=True
+                )
+            elif self.scd_type == 2:
+                # Assign previous index to ends_at
+                source = source.with_columns(
+                    pl.col(self.index)
+                    .shift(1)
+                    .over(self.primary_keys)
+                    .alias(self.end_at),
+                    pl.col(self.index)
+                    .min()
+                    .over(self.primary_keys)
+                    .alias(self.index_fist),
+                )
+        else:
+            logger.info(f"Dropping duplicates using {self.primary_keys}")
+            source = source.unique(subset=self.primary_keys)
+
+        merge_options = {
+            "source_alias": "source",
+            "target_alias": "target",
+            "commit_properties": CommitProperties(
+                custom_metadata=self.sink._commit_metadata
+            ),
+        }
+
+        if self.scd_type == 1:
             if self.delete_where:
-                upsert = upsert.filter(not_delete_condition)
-            writer = (
-                upsert.select(self.write_columns).write.mode("APPEND").format("DELTA")
+                delete_condition = f"COALESCE({self.source_delete_where}, FALSE)"
+                not_delete_condition = f"NOT {delete_condition}"
+
+            # Define merge
+            predicate = self._keys_predicate() + [f for f, _ in prune_filters]
+            merge = source.collect().write_delta(
+                self.target_path,
+                mode="merge",
+                delta_merge_options={
+                    "predicate": " AND ".join([f"({p})" for p in predicate]),
+                    **merge_options,
+                },
             )
-            logger.info("Appending new rows...")
-            if self.target_path:
-                writer.save(self.target_path)
-            else:
-                writer.saveAsTable(self.target_name)
+
+            # Update
+            _set = {c: f"source.{c}" for c in self.update_columns}
+            if self.ignore_null_updates:
+                _set = {
+                    c: f"COALESCE(source.{c}, target.{c})" for c in self.update_columns
+                }
+
+            predicate = []
+            if self.delete_where:
+                predicate += [not_delete_condition]
+            if self.order_by:
+                predicate += [f"source.{self.order_by} > target.{self.order_by}"]
+            merge = merge.when_matched_update(
+                updates=_set, predicate=" AND ".join(predicate) or None
+            )
+
+            # Insert
+            predicate = None
+            if self.delete_where:
+                predicate = not_delete_condition
+            merge = merge.when_not_matched_insert(
+                updates={c: f"source.{c}" for c in self.write_columns},
+                predicate=predicate,
+            )
+
+            # Delete
+            if self.delete_where:
+                merge = merge.when_matched_delete(predicate=delete_condition)
+
+            logger.info("Executing merge...")
+            merge.execute()
+
+        elif self.scd_type == 2:
+            delete_condition = pl.lit(False)
+            if self.delete_where:
+                delete_condition = pl.sql_expr(self.delete_where).fill_null(False)
+            source = source.with_columns(delete_condition.alias("__to_delete"))
+
+            # Current target rows for keys present in the batch
+            target = pl.scan_delta(self.target_path)
+            target = target.filter(pl.col(self.end_at).is_null())
+            for _, _filter in prune_filters:
+                target = target.filter(_filter)
+            target_columns = self.key_columns + self.compare_columns
+            target = target.select(
+                *[pl.col(c).alias(f"__target_{c}") for c in target_columns],
+                pl.lit(True).alias("__is_current"),
+            )
+            source = source.join(
+                target,
+                left_on=self.key_columns,
+                right_on=[f"__target_{c}" for c in self.key_columns],
+                how="left",
+                join_nulls=True,
+                coalesce=False,
+            )
+
+            # Only keep rows that differ from current target rows
+            unchanged = pl.col("__is_current").fill_null(False)
+            unchanged = unchanged & ~pl.col("__to_delete")
+            for c in self.compare_columns:
+                unchanged = unchanged & pl.col(c).eq_missing(pl.col(f"__target_{c}"))
+            upsert_or_delete = source.filter(~unchanged).drop(
+                [f"__target_{c}" for c in target_columns]
+            )
+
+            # Staged union: latest rows of existing keys expire the current row
+            # and new versions are inserted.
+            expire = upsert_or_delete.filter(
+                pl.col(self.end_at).is_null() & pl.col("__is_current")
+            ).with_columns(pl.lit(True).alias("__is_expire"))
+            insert = upsert_or_delete.filter(~pl.col("__to_delete")).with_columns(
+                pl.lit(False).alias("__is_expire")
+            )
+            staged = pl.concat([expire, insert]).collect()
+
+            # Merge
+            predicate = self._keys_predicate()
+            predicate += ["source.__is_expire", f"target.{self.end_at} IS NULL"]
+            predicate += [f for f, _ in prune_filters]
+            merge = staged.write_delta(
+                self.target_path,
+                mode="merge",
+                delta_merge_options={
+                    "predicate": " AND ".join([f"({p})" for p in predicate]),
+                    **merge_options,
+                },
+            )
+
+            # Expire the current record
+            merge = merge.when_matched_update(
+                updates={self.end_at: f"source.{self.index_fist}"}
+            )
+
+            # Insert new records
+            merge = merge.when_not_matched_insert(
+                updates={c: f"source.{c}" for c in self.write_columns},
+                predicate="NOT source.__is_expire",
+            )
+
+            logger.info("Executing merge...")
+            merge.execute()
 
         else:
             raise ValueError(f"SCD Type {self.scd_type} is not supported.")
 
-    def execute(self, source: SparkDataFrame):
+    # ----------------------------------------------------------------------- #
+    # Execution                                                               #
+    # ----------------------------------------------------------------------- #
+
+    def execute(self, source: AnyDataFrame):
         """
         Merge source into target delta from sink
 
@@ -450,9 +1154,16 @@ class DataSinkMergeCDCOptions(BaseModel):
             Source DataFrame to merge into target (sink).
         """
 
+        if is_polars_dataframe(source):
+            self._source_schema = source.collect_schema()
+            self._source_columns = self._source_schema.names()
+            self._execute_polars(source=source)
+            return
+
         from delta.tables import DeltaTable
 
         self._source_schema = source.schema
+        self._source_columns = source.columns
         spark = source.sparkSession
 
         if self.target_path:
@@ -473,33 +1184,450 @@ class DataSinkMergeCDCOptions(BaseModel):
                     f"Checkpoint location not specified for sink '{self.sink}'"
                 )
 
-            query = (
-                source.writeStream.foreachBatch(
-                    lambda batch_df, batch_id: self._execute(source=batch_df)
-                )
-                .trigger(availableNow=True)
-                .options(
-                    checkpointLocation=self.sink._checkpoint_location,
-                )
-                .start()
+            writer = source.writeStream.foreachBatch(
+                lambda batch_df, batch_id: self._execute(source=batch_df)
+            ).options(
+                checkpointLocation=self.sink._checkpoint_location,
+            )
+            self.sink._streaming_query = self.sink._trigger.start(
+                writer, for_each_batch=True
             )
-            query.awaitTermination()
 
         else:
             self._execute(source=source)
 
 
+class DataSinkMetrics(BaseModel):
+    """
+    Metrics of a data sink write (or merge) operation. Row and file counts
+    are collected from the Delta commits `operationMetrics`, the streaming
+    query progress or the Polars DataFrame and are `None` when not available
+    for the sink format. Delta commits of the operation are identified by a
+    write id stored as commit `userMetadata` (setting `userMetadata` in the
+    sink `write_options` disables them) or, for Spark merges, by the version
+    committed by the Spark session.
+
+    Attributes
+    ----------
+    bytes_written:
+        Size of the data files written
+    commits:
+        Number of Delta commits created by the operation
+    end_at:
+        Operation end time (UTC)
+    files_added:
+        Number of data files added
+    files_removed:
+        Number of data files removed
+    micro_batches:
+        Number of micro-batches processed by the streaming query
+    mode:
+        Write mode
+    rows_copied:
+        Number of unchanged target rows re-written by a merge because they
+        share a data file with a matched row. A high number of copied rows
+        compared to inserted, updated and deleted rows denotes merge
+        amplification.
+    rows_deleted:
+        Number of target rows deleted
+    rows_inserted:
+        Number of rows inserted (or written)
+    rows_updated:
+        Number of target rows updated
+    sink_id:
+        Identifier of the sink (path or table full name)
+    source_rows:
+        Number of rows of the source DataFrame or micro-batches
+    start_at:
+        Operation start time (UTC)
+    """
+
+    bytes_written: int = None
+    commits: int = None
+    end_at: datetime.datetime = None
+    files_added: int = None
+    files_removed: int = None
+    micro_batches: int = None
+    mode: Union[str, None] = None
+    rows_copied: int = None
+    rows_deleted: int = None
+    rows_inserted: int = None
+    rows_updated: int = None
+    sink_id: str = None
+    source_rows: int = None
+    start_at: datetime.datetime = None
+
+    @property
+    def duration(self) -> Union[float, None]:
+        """Operation duration in seconds"""
+        if self.start_at is None or self.end_at is None:
+            return None
+        return (self.end_at - self.start_at).total_seconds()
+
+    def add_operation_metrics(self, operation_metrics: dict[str, Any]) -> None:
+        """
+        Add the `operationMetrics` of a Delta commit, written by Spark or by
+        delta-rs.
+
+        Parameters
+        ----------
+        operation_metrics:
+            Delta commit operation metrics
+        """
+        # Operation-specific keys (merge) first
+        keys = {
+            "bytes_written": ["numTargetBytesAdded", "numOutputBytes", "numAddedBytes"],
+            "files_added": [
+                "numTargetFilesAdded",
+                "num_target_files_added",
+                "numFiles",
+                "numAddedFiles",
+                "num_added_files",
+            ],
+            "files_removed": [
+                "numTargetFilesRemoved",
+                "num_target_files_removed",
+                "numRemovedFiles",
+                "num_removed_files",
+            ],
+            "rows_copied": [
+                "numTargetRowsCopied",
+                "num_target_rows_copied",
+                "numCopiedRows",
+                "num_copied_rows",
+            ],
+            "rows_deleted": [
+                "numTargetRowsDeleted",
+                "num_target_rows_deleted",
+                "numDeletedRows",
+                "num_deleted_rows",
+            ],
+            "rows_inserted": [
+                "numTargetRowsInserted",
+                "num_target_rows_inserted",
+                "numOutputRows",
+                "num_added_rows",
+            ],
+            "rows_updated": [
+                "numTargetRowsUpdated",
+                "num_target_rows_updated",
+                "numUpdatedRows",
+                "num_updated_rows",
+            ],
+            "source_rows": ["numSourceRows", "num_source_rows"],
+        }
+
+        if operation_metrics is None:
+            operation_metrics = {}
+
+        for name, _keys in keys.items():
+            for k in _keys:
+                if k in operation_metrics:
+                    value = int(operation_metrics[k])
+                    setattr(self, name, (getattr(self, name) or 0) + value)
+                    break
+
+        self.commits = (self.commits or 0) + 1
+
+
+class DataSinkMaintenance(BaseModel):
+    """
+    Delta table maintenance applied after each write to the sink. OPTIMIZE
+    and VACUUM are throttled using the table history: they only run once
+    enough writes or files have been committed since the last OPTIMIZE, so
+    that small files are compacted without paying the maintenance cost on
+    every run or micro-batch. Commits since the last OPTIMIZE are counted in
+    memory and only the commits written since the previous write are read
+    from the history (at least the last 100 commits on the first write).
+
+    Attributes
+    ----------
+    auto_compact:
+        Value of the `delta.autoOptimize.autoCompact` table property. When
+        enabled, Databricks compacts small files right after each write.
+    optimize_every_n_runs:
+        OPTIMIZE the table once this number of writes have been committed
+        since the last OPTIMIZE.
+    optimize_min_files:
+        OPTIMIZE the table once this number of data files have been added
+        since the last OPTIMIZE.
+    optimize_write:
+        Value of the `delta.autoOptimize.optimizeWrite` table property. When
+        enabled, Databricks writes fewer and larger files.
+    vacuum_retention_hours:
+        If set, VACUUM the table after each OPTIMIZE, deleting unreferenced
+        data files older than the retention period.
+    zorder_by:
+        Columns used to Z-ORDER the data files when optimizing the table. If
+        `None`, data files are only compacted.
+
+    Examples
+    --------
+    ```py
+    from laktory import models
+
+    sink = models.FileDataSink(
+        path="/Volumes/sources/landing/events/yahoo-finance/stock_price",
+        format="DELTA",
+        mode="APPEND",
+        maintenance={
+            "optimize_every_n_runs": 10,
+            "zorder_by": ["symbol"],
+            "vacuum_retention_hours": 168,
+            "optimize_write": True,
+        },
+    )
+    ```
+    """
+
+    auto_compact: bool = None
+    optimize_every_n_runs: int = None
+    optimize_min_files: int = None
+    optimize_write: bool = None
+    vacuum_retention_hours: int = None
+    zorder_by: list[str] = None
+    _commits: DataSinkMetrics = None
+    _parent: Any = None
+    _version: int = None
+
+    # ----------------------------------------------------------------------- #
+    # Properties                                                              #
+    # ----------------------------------------------------------------------- #
+
+    @property
+    def sink(self):
+        return self._parent
+
+    @property
+    def is_throttled(self) -> bool:
+        """`True` if OPTIMIZE depends on the commits since the last OPTIMIZE"""
+        return (
+            self.optimize_every_n_runs is not None
+            or self.optimize_min_files is not None
+        )
+
+    @property
+    def table_properties(self) -> dict[str, str]:
+        """Delta table properties set by the maintenance policy"""
+        properties = {}
+        if self.optimize_write is not None:
+            properties["delta.autoOptimize.optimizeWrite"] = str(
+                self.optimize_write
+            ).lower()
+        if self.auto_compact is not None:
+            properties["delta.autoOptimize.autoCompact"] = str(
+                self.auto_compact
+            ).lower()
+        return properties
+
+    # ----------------------------------------------------------------------- #
+    # Methods                                                                 #
+    # ----------------------------------------------------------------------- #
+
+    def get_history_limit(self, version: int) -> int:
+        """
+        Number of commits to read from the table history: the commits
+        written since the last execution or, on the first execution, a window
+        of at least 100 commits.
+
+        Parameters
+        ----------
+        version:
+            Current table version
+
+        Returns
+        -------
+        :
+            Number of commits
+        """
+        if self._version is None or version < self._version:
+            self._commits = None
+            return max(100, 2 * (self.optimize_every_n_runs or 0))
+        return version - self._version
+
+    def add_commits(self, history: list[dict], version: int) -> None:
+        """
+        Add the commits written since the last execution to the commits
+        counted since the last OPTIMIZE.
+
+        Parameters
+        ----------
+        history:
+            Delta commits (operation and operation metrics), most recent first
+        version:
+            Current table version
+        """
+        metrics = DataSinkMetrics(commits=0, files_added=0)
+        optimized = False
+        for commit in history:
+            operation = commit["operation"]
+            if operation == "OPTIMIZE":
+                optimized = True
+                break
+            if operation.startswith("VACUUM") or operation in [
+                "CREATE TABLE",
+                "SET TBLPROPERTIES",
+            ]:
+                continue
+            metrics.add_operation_metrics(commit.get("operationMetrics"))
+
+        if not optimized and self._commits is not None:
+            metrics.commits += self._commits.commits
+            metrics.files_added += self._commits.files_added
+
+        self._commits = metrics
+        self._version = version
+
+    def is_optimize_due(self) -> bool:
+        """
+        Check if the table needs to be optimized given the commits written
+        since the last OPTIMIZE.
+
+        Returns
+        -------
+        :
+            `True` if the table needs to be optimized
+        """
+        if not self.is_throttled or self._commits is None:
+            return False
+
+        if self.optimize_every_n_runs is not None:
+            if self._commits.commits >= self.optimize_every_n_runs:
+                return True
+
+        if self.optimize_min_files is not None:
+            if self._commits.files_added >= self.optimize_min_files:
+                return True
+
+        return False
+
+    def _execute_spark(self, spark) -> None:
+        from delta.tables import DeltaTable
+
+        path = getattr(self.sink, "path", None)
+        if path:
+            table = DeltaTable.forPath(spark, path)
+            identifier = f"delta.`{path}`"
+        else:
+            table = DeltaTable.forName(spark, self.sink.full_name)
+            identifier = self.sink.full_name
+
+        # Table properties
+        properties = self.table_properties
+        if properties:
+            current = table.detail().select("properties").collect()[0][0]
+            properties = {k: v for k, v in properties.items() if current.get(k) != v}
+        if properties:
+            logger.info(f"Setting table properties {properties} on {self.sink._id}")
+            _properties = ", ".join([f"'{k}' = '{v}'" for k, v in properties.items()])
+            spark.sql(f"ALTER TABLE {identifier} SET TBLPROPERTIES ({_properties})")
+
+        if not self.is_throttled:
+            return
+
+        # Commits since last execution
+        version = table.history(1).select("version").collect()[0][0]
+        limit = self.get_history_limit(version)
+        history = []
+        if limit > 0:
+            history = table.history(limit).select(
+                "version", "operation", "operationMetrics"
+            )
+            history = [row.asDict() for row in history.collect()]
+        self.add_commits(history, version)
+
+        if not self.is_optimize_due():
+            return
+
+        logger.info(f"Optimizing {self.sink._id} (z-order by {self.zorder_by})")
+        if self.zorder_by:
+            table.optimize().executeZOrderBy(*self.zorder_by)
+        else:
+            table.optimize().executeCompaction()
+
+        if self.vacuum_retention_hours is not None:
+            logger.info(
+                f"Vacuuming {self.sink._id} with {self.vacuum_retention_hours} hours retention"
+            )
+            table.vacuum(self.vacuum_retention_hours)
+
+    def _execute_polars(self) -> None:
+        from deltalake import DeltaTable
+
+        path = getattr(self.sink, "path", None)
+        if path is None:
+            raise ValueError(
+                "Delta maintenance with Polars is only supported for sinks with a `path`"
+            )
+        table = DeltaTable(path)
+
+        # Table properties
+        properties = self.table_properties
+        if properties:
+            current = table.metadata().configuration
+            properties = {k: v for k, v in properties.items() if current.get(k) != v}
+        if properties:
+            logger.info(f"Setting table properties {properties} on {self.sink._id}")
+            table.alter.set_table_properties(properties, raise_if_not_exists=False)
+
+        if not self.is_throttled:
+            return
+
+        # Commits since last execution
+        version = table.version()
+        limit = self.get_history_limit(version)
+        history = table.history(limit) if limit > 0 else []
+        self.add_commits(history, version)
+
+        if not self.is_optimize_due():
+            return
+
+        logger.info(f"Optimizing {self.sink._id} (z-order by {self.zorder_by})")
+        if self.zorder_by:
+            table.optimize.z_order(self.zorder_by)
+        else:
+            table.optimize.compact()
+
+        if self.vacuum_retention_hours is not None:
+            logger.info(
+                f"Vacuuming {self.sink._id} with {self.vacuum_retention_hours} hours retention"
+            )
+            table.vacuum(retention_hours=self.vacuum_retention_hours, dry_run=False)
+
+    def execute(self, df: AnyDataFrame) -> None:
+        """
+        Apply maintenance policy to the sink Delta table.
+
+        Parameters
+        ----------
+        df:
+            DataFrame written to the sink, used to select the backend.
+        """
+        if is_polars_dataframe(df):
+            self._execute_polars()
+        else:
+            self._execute_spark(df.sparkSession)
+
+
 class BaseDataSink(BaseModel, PipelineChild):
     """
     Base class for building data sink
 
     Attributes
     ----------
+    cluster_by:
+        Liquid clustering columns of the Delta table. Applied when the table
+        is created, including merge targets. Can't be combined with
+        `partition_by`.
     is_primary:
         A primary sink will be used to read data for downstream nodes when
         moving from stream to batch. Don't apply for quarantine sinks.
     is_quarantine:
         Sink used to store quarantined results from node expectations.
+    maintenance:
+        Delta table maintenance (OPTIMIZE, Z-ORDER, VACUUM and
+        auto-optimize properties) applied after each write. Only
+        supported with `DELTA` format.
     merge_cdc_options:
         Merge options to handle input DataFrames that are Change Data Capture
         (CDC). Only used when `merge` mode is selected.
@@ -512,6 +1640,22 @@ class BaseDataSink(BaseModel, PipelineChild):
         - complete: Overwrite for streaming dataframes
         - merge: Append, update and optionally delete records. Requires
         cdc specification.
+        - overwrite_partitions: Overwrite only the partitions present in the
+        dataframe (or the data matching `replace_where`), leaving the other
+        partitions unchanged. Requires `partition_by` or `replace_where`.
+    partition_by:
+        Partition columns of the written data (hive-style partitioning).
+        Applied to Spark static and streaming writes, Polars Parquet and
+        Delta writes and merge target creation.
+    replace_where:
+        SQL predicate selecting the data replaced by an `OVERWRITE` or
+        `OVERWRITE_PARTITIONS` write. With `OVERWRITE_PARTITIONS` mode, the
+        predicate is otherwise computed from the `partition_by` values
+        found in the dataframe. Only supported with `DELTA` format.
+    trigger:
+        Trigger of the streaming query when writing a streaming DataFrame.
+        If `None`, the trigger of the parent pipeline node is used, and
+        all available data is processed by default.
     write_options:
         Other options passed to `spark.write.options`
     """
@@ -519,14 +1663,31 @@ class BaseDataSink(BaseModel, PipelineChild):
     is_quarantine: bool = False
     is_primary: bool = True
     checkpoint_location: str = None
+    cluster_by: list[str] = None
+    maintenance: DataSinkMaintenance = None
     merge_cdc_options: DataSinkMergeCDCOptions = None  # TODO: Review parameter name
     mode: Union[
         Literal[
-            "OVERWRITE", "APPEND", "IGNORE", "ERROR", "COMPLETE", "UPDATE", "MERGE"
+            "OVERWRITE",
+            "OVERWRITE_PARTITIONS",
+            "APPEND",
+            "IGNORE",
+            "ERROR",
+            "COMPLETE",
+            "UPDATE",
+            "MERGE",
         ],
         None,
     ] = None
+    partition_by: list[str] = None
+    replace_where: str = None
+    trigger: DataSinkTrigger = None
     write_options: dict[str, str] = {}
+    _merge_versions: list[int] = []
+    _metrics: DataSinkMetrics = None
+    _streaming_query: Any = None
+    _write_id: str = None
+    _write_version: int = None
 
     @model_validator(mode="after")
     def merge_has_options(self) -> Any:
@@ -540,6 +1701,46 @@ class BaseDataSink(BaseModel, PipelineChild):
 
         return self
 
+    @model_validator(mode="after")
+    def partition_or_cluster(self) -> Any:
+        if self.cluster_by:
+            if self.partition_by:
+                raise ValueError(
+                    "`cluster_by` and `partition_by` can't be used together"
+                )
+            if getattr(self, "format", "DELTA") != "DELTA":
+                raise ValueError("`cluster_by` is only supported for 'DELTA' `format`")
+            if self.maintenance is not None and self.maintenance.zorder_by:
+                raise ValueError(
+                    "Maintenance `zorder_by` can't be used with `cluster_by`. Clustered tables are clustered by OPTIMIZE."
+                )
+
+        return self
+
+    @model_validator(mode="after")
+    def overwrite_partitions_predicate(self) -> Any:
+        if self.mode == "OVERWRITE_PARTITIONS":
+            if not (self.partition_by or self.replace_where):
+                raise ValueError(
+                    "If 'OVERWRITE_PARTITIONS' `mode` is selected, `partition_by` or `replace_where` must be specified."
+                )
+        if self.replace_where is not None:
+            if getattr(self, "format", "DELTA") != "DELTA":
+                raise ValueError(
+                    "`replace_where` is only supported for 'DELTA' `format`"
+                )
+
+        return self
+
+    @model_validator(mode="after")
+    def maintenance_is_delta(self) -> Any:
+        if self.maintenance is not None:
+            if getattr(self, "format", "DELTA") != "DELTA":
+                raise ValueError("`maintenance` is only supported for 'DELTA' `format`")
+            self.maintenance._parent = self
+
+        return self
+
     # ----------------------------------------------------------------------- #
     # Properties                                                              #
     # ----------------------------------------------------------------------- #
@@ -568,6 +1769,162 @@ class BaseDataSink(BaseModel, PipelineChild):
 
         return None
 
+    @property
+    def _trigger(self) -> DataSinkTrigger:
+        if self.trigger:
+            return self.trigger
+
+        node = self.parent_pipeline_node
+        if node and node.trigger:
+            return node.trigger
+
+        return DataSinkTrigger()
+
+    @property
+    def streaming_query(self):
+        """Last streaming query started when writing to the sink"""
+        return self._streaming_query
+
+    # ----------------------------------------------------------------------- #
+    # Metrics                                                                 #
+    # ----------------------------------------------------------------------- #
+
+    @property
+    def metrics(self) -> Union[DataSinkMetrics, None]:
+        """Metrics of the last write operation"""
+        return self._metrics
+
+    @property
+    def _is_delta(self) -> bool:
+        return getattr(self, "format", None) == "DELTA"
+
+    @property
+    def _commit_metadata(self) -> dict[str, str]:
+        """Delta commit user metadata identifying the commits of the current
+        write"""
+        if self._write_id is None:
+            return {}
+        return {"userMetadata": self._write_id}
+
+    def _is_write_commit(self, commit: dict) -> bool:
+        """Whether a Delta commit was created by the current write. Spark
+        merges can't be tagged with user metadata and are identified by the
+        version they committed instead."""
+        if self._write_id and commit.get("userMetadata") == self._write_id:
+            return True
+        return (
+            commit.get("operation") == "MERGE"
+            and commit["version"] in self._merge_versions
+        )
+
+    def _get_delta_history(
+        self, df, limit: int = None, since_version: int = None
+    ) -> list[dict]:
+        """Delta commits (version, operation, operation metrics and user
+        metadata) of the sink, most recent first. Empty if the sink is not an
+        existing Delta table. With `since_version`, only the commits following
+        that version are read from the log."""
+
+        if since_version is not None and limit is None:
+            latest = self._get_delta_history(df, limit=1)
+            if not latest:
+                return []
+            limit = latest[0]["version"] - since_version
+            if limit <= 0:
+                return []
+
+        path = getattr(self, "path", None)
+
+        if is_polars_dataframe(df):
+            from deltalake import DeltaTable
+
+            if path is None or not DeltaTable.is_deltatable(path):
+                return []
+            history = DeltaTable(path).history(limit)
+            if since_version is not None:
+                history = [c for c in history if c["version"] > since_version]
+            return history
+
+        from delta.tables import DeltaTable
+
+        spark = df.sparkSession
+        if path:
+            if not DeltaTable.isDeltaTable(spark, path):
+                return []
+            table = DeltaTable.forPath(spark, path)
+        else:
+            if not spark.catalog.tableExists(self.full_name):
+                return []
+            table = DeltaTable.forName(spark, self.full_name)
+
+        history = table.history(limit) if limit else table.history()
+        if since_version is not None:
+            history = history.filter(history["version"] > since_version)
+        rows = history.select(
+            "version", "operation", "operationMetrics", "userMetadata"
+        ).collect()
+        return [row.asDict() for row in rows]
+
+    def _get_delta_version(self, df) -> Union[int, None]:
+        if not self._is_delta or not (
+            is_spark_dataframe(df) or is_polars_dataframe(df)
+        ):
+            return None
+
+        try:
+            history = self._get_delta_history(df, limit=1)
+        except Exception as e:
+            logger.warning(f"Delta version of sink {self._id} not available: {e}")
+            return None
+
+        if not history:
+            return -1
+        return history[0]["version"]
+
+    def _set_metrics(self, df, mode, start_at, version) -> None:
+        metrics = DataSinkMetrics(
+            sink_id=self._id,
+            mode=mode,
+            start_at=start_at,
+            end_at=datetime.datetime.now(datetime.timezone.utc),
+        )
+
+        try:
+            # Delta commits created by the operation. Commits from concurrent
+            # writers are excluded.
+            if version is not None:
+                history = self._get_delta_history(df, since_version=version)
+                for commit in history:
+                    if self._is_write_commit(commit):
+                        metrics.add_operation_metrics(commit.get("operationMetrics"))
+
+            # Streaming query progress
+            query = self._streaming_query
+            if query is not None and not query.isActive:
+                progress = query.recentProgress
+                metrics.micro_batches = len(progress)
+                metrics.source_rows = sum([p["numInputRows"] for p in progress])
+
+            # Polars DataFrame
+            if is_polars_dataframe(df) and not isinstance(df, PolarsLazyFrame):
+                if metrics.source_rows is None:
+                    metrics.source_rows = df.height
+                if not self._is_delta and metrics.rows_inserted is None:
+                    metrics.rows_inserted = df.height
+            path = getattr(self, "path", None)
+            if is_polars_dataframe(df) and not self._is_delta and path:
+                if os.path.isfile(path):
+                    metrics.bytes_written = os.path.getsize(path)
+
+        except Exception as e:
+            logger.warning(f"Metrics of sink {self._id} could not be collected: {e}")
+
+        self._metrics = metrics
+        record = metrics.model_dump(mode="json", exclude_none=True)
+        logger.info(
+            f"Sink metrics: {json.dumps(record)}", extra={"sink_metrics": record}
+        )
+
     # ----------------------------------------------------------------------- #
     # CDC                                                                     #
     # ----------------------------------------------------------------------- #
@@ -653,6 +2010,13 @@ class BaseDataSink(BaseModel, PipelineChild):
         if mode is None:
             mode = self.mode
 
+        start_at = datetime.datetime.now(datetime.timezone.utc)
+        version = self._get_delta_version(df)
+        self._streaming_query = None
+        self._write_id = str(uuid.uuid4())
+        self._write_version = version
+        self._merge_versions = []
+
         if is_spark_dataframe(df):
             self._write_spark(df=df, mode=mode)
         elif is_polars_dataframe(df=df):
@@ -661,10 +2025,133 @@ class BaseDataSink(BaseModel, PipelineChild):
             raise ValueError(f"DataFrame type '{type(df)}' not supported")
 
         logger.info("Write completed.")
+        self._set_metrics(df, mode=mode, start_at=start_at, version=version)
+
+        # Maintenance is skipped while a streaming query is still running
+        query = self._streaming_query
+        if self.maintenance and not (query is not None and query.isActive):
+            self.maintenance.execute(df)
+
+    def _get_replace_where(self, df: AnyDataFrame, mode: str) -> Union[str, None]:
+        """
+        Predicate selecting the data replaced by a partial overwrite:
+        `replace_where` or, with `OVERWRITE_PARTITIONS` mode, the partitions
+        found in the DataFrame. `None` for other writes.
+        """
+        if mode is None:
+            return None
+        mode = mode.upper()
+
+        if mode == "OVERWRITE":
+            return self.replace_where
+
+        if mode != "OVERWRITE_PARTITIONS":
+            return None
+
+        if getattr(df, "isStreaming", False):
+            raise ValueError(
+                "'OVERWRITE_PARTITIONS' mode is not supported for streaming DataFrames"
+            )
+
+        if self.replace_where:
+            return self.replace_where
+
+        if not self.partition_by:
+            raise ValueError(
+                "'OVERWRITE_PARTITIONS' mode requires `partition_by` or `replace_where`"
+            )
+
+        # Distinct partition values
+        if is_polars_dataframe(df):
+            rows = df.lazy().select(self.partition_by).unique().collect().rows()
+        else:
+            rows = df.select(*self.partition_by).distinct().collect()
+            rows = [tuple(row) for row in rows]
+
+        def _condition(c, v):
+            if v is None:
+                return f"{c} IS NULL"
+            return f"{c} = {DataSinkMergeCDCOptions._sql_literal(v)}"
+
+        if not rows:
+            predicate = "FALSE"
+        elif len(self.partition_by) == 1:
+            c = self.partition_by[0]
+            values = [v for (v,) in rows if v is not None]
+            conditions = []
+            if values:
+                _values = ", ".join(
+                    [DataSinkMergeCDCOptions._sql_literal(v) for v in values]
+                )
+                conditions += [f"{c} IN ({_values})"]
+            if len(values) < len(rows):
+                conditions += [f"{c} IS NULL"]
+            predicate = " OR ".join(conditions)
+        else:
+            predicate = " OR ".join(
+                [
+                    "("
+                    + " AND ".join(
+                        [_condition(c, v) for c, v in zip(self.partition_by, row)]
+                    )
+                    + ")"
+                    for row in rows
+                ]
+            )
+
+        logger.info(f"Overwriting {self._id} partitions where {predicate}")
+        return predicate
+
+    def _get_spark_overwrite_options(
+        self, df: SparkDataFrame, mode: str
+    ) -> dict[str, str]:
+        """Spark writer options of a partial overwrite"""
+        if mode is None:
+            return {}
+
+        # Non-Delta formats rely on Spark dynamic partitions overwrite
+        is_delta = getattr(self, "format", "DELTA") == "DELTA"
+        if mode.upper() == "OVERWRITE_PARTITIONS" and not is_delta:
+            if df.isStreaming:
+                raise ValueError(
+                    "'OVERWRITE_PARTITIONS' mode is not supported for streaming DataFrames"
+                )
+            if not self.partition_by:
+                raise ValueError("'OVERWRITE_PARTITIONS' mode requires `partition_by`")
+            return {"partitionOverwriteMode": "dynamic"}
+
+        replace_where = self._get_replace_where(df, mode)
+        if replace_where is None:
+            return {}
+        return {"replaceWhere": replace_where}
 
     def _write_spark(self, df: SparkDataFrame, mode: str = mode) -> None:
         raise NotImplementedError("Not implemented for Spark dataframe")
 
+    def _create_clustered_table(self, df: SparkDataFrame) -> None:
+        """Create the sink Delta table with its liquid clustering columns if
+        it does not exist yet."""
+        from delta.tables import DeltaTable
+
+        spark = df.sparkSession
+        full_name = getattr(self, "full_name", None)
+        path = getattr(self, "path", None) or self.write_options.get("path", None)
+
+        if full_name:
+            if spark.catalog.tableExists(full_name):
+                return
+        elif path and DeltaTable.isDeltaTable(spark, path):
+            return
+
+        builder = DeltaTable.createIfNotExists(spark)
+        if full_name:
+            builder = builder.tableName(full_name)
+        if path:
+            builder = builder.location(path)
+
+        logger.info(f"Creating {self._id} Delta table clustered by {self.cluster_by}")
+        builder.addColumns(df.schema).clusterBy(*self.cluster_by).execute()
+
     def _write_spark_view(self, view_definition: str, spark) -> None:
         raise NotImplementedError(
             f"View creation with spark is not implemented for type '{type(self)}'"
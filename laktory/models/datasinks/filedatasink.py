@@ -31,6 +31,10 @@ class FileDataSink(BaseDataSink):
         Format of the data files
     path:
         Path to which the DataFrame needs to be written.
+    streaming_chunk_size:
+        Number of rows processed at once by Polars streaming engine when
+        writing CSV, PARQUET or JSONL files. If `None`, the chunk size is
+        determined by Polars.
 
     Examples
     ---------
@@ -71,8 +75,11 @@ class FileDataSink(BaseDataSink):
     """
 
     checkpoint_location: Union[str, None] = None
-    format: Literal["CSV", "PARQUET", "DELTA", "JSON", "EXCEL"] = "DELTA"
+    format: Literal["CSV", "PARQUET", "DELTA", "JSON", "JSONL", "NDJSON", "EXCEL"] = (
+        "DELTA"
+    )
     path: str
+    streaming_chunk_size: int = None
 
     @field_validator("path", mode="before")
     @classmethod
@@ -111,15 +118,27 @@ class FileDataSink(BaseDataSink):
         if mode is None:
             mode = self.mode
 
+        _format = self.format.lower()
+        if self.format in ["JSONL", "NDJSON"]:
+            _format = "json"
+
         if mode.lower() == "merge":
             self.merge_cdc_options.execute(source=df)
             return
 
+        # Partial overwrite
+        _overwrite_options = self._get_spark_overwrite_options(df, mode)
+        if mode.upper() == "OVERWRITE_PARTITIONS":
+            mode = "OVERWRITE"
+
         # Default Options
         _options = {"mergeSchema": "true", "overwriteSchema": "false"}
-        if mode in ["OVERWRITE", "COMPLETE"]:
+        if mode in ["OVERWRITE", "COMPLETE"] and not _overwrite_options:
             _options["mergeSchema"] = "false"
             _options["overwriteSchema"] = "true"
+        _options.update(_overwrite_options)
+        if self._is_delta:
+            _options.update(self._commit_metadata)
         if df.isStreaming:
             _options["checkpointLocation"] = self._checkpoint_location
 
@@ -127,29 +146,27 @@ class FileDataSink(BaseDataSink):
         for k, v in self.write_options.items():
             _options[k] = v
 
+        # Liquid clustering is defined at table creation
+        if self.cluster_by:
+            self._create_clustered_table(df)
+
         if df.isStreaming:
             logger.info(
                 f"Writing df as stream {self.format} to {self.path} with mode {mode} and options {_options}"
             )
-            query = (
-                df.writeStream.format(self.format.lower())
-                .outputMode(mode)
-                .trigger(availableNow=True)  # TODO: Add option for trigger?
-                .options(**_options)
-                .start(self.path)
-            )
-            query.awaitTermination()
+            writer = df.writeStream.format(_format).outputMode(mode).options(**_options)
+            if self.partition_by:
+                writer = writer.partitionBy(*self.partition_by)
+            self._streaming_query = self._trigger.start(writer, path=self.path)
 
         else:
             logger.info(
                 f"Writing df as static {self.format} to {self.path} with mode {mode} and options {_options}"
             )
-            (
-                df.write.mode(mode)
-                .format(self.format.lower())
-                .options(**_options)
-                .save(self.path)
-            )
+            writer = df.write.mode(mode).format(_format).options(**_options)
+            if self.partition_by:
+                writer = writer.partitionBy(*self.partition_by)
+            writer.save(self.path)
 
     def _write_polars(self, df: PolarsDataFrame, mode=None) -> None:
         isStreaming = False
@@ -160,6 +177,18 @@ class FileDataSink(BaseDataSink):
         else:
             logger.info(f"Writing df as static {self.format} to {self.path}")
 
+        if self.cluster_by:
+            raise ValueError("`cluster_by` is not supported with Polars")
+
+        if self.partition_by and self.format not in ["PARQUET", "DELTA"]:
+            raise ValueError(
+                "`partition_by` with Polars is only supported by 'PARQUET' and 'DELTA' formats"
+            )
+
+        if mode and mode.lower() == "merge":
+            self.merge_cdc_options.execute(source=df)
+            return
+
         if self.format != "DELTA":
             if mode:
                 raise ValueError(
@@ -171,19 +200,97 @@ class FileDataSink(BaseDataSink):
                     "'mode' configuration required with Polars 'DELTA' format"
                 )
 
+        # Polars file writers don't create missing parent directories
+        if self.format != "DELTA" and "://" not in self.path:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        # Stream lazy plan to file without collecting the full DataFrame.
+        # Partitioned writes are not supported by Polars streaming engine.
+        is_sinkable = self.format in ["CSV", "PARQUET", "JSONL", "NDJSON"]
+        if isinstance(df, PolarsLazyFrame) and is_sinkable and not self.partition_by:
+            import polars as pl
+
+            try:
+                self._sink_polars(df)
+                return
+            except pl.exceptions.InvalidOperationError:
+                logger.info(
+                    "Lazy frame plan not supported by Polars streaming engine. Collecting before writing."
+                )
+
         if isinstance(df, PolarsLazyFrame):
             df = df.collect()
 
+        # Partial overwrite
+        replace_where = self._get_replace_where(df, mode)
+        if mode and mode.upper() == "OVERWRITE_PARTITIONS":
+            mode = "OVERWRITE"
+
         if self.format.lower() == "csv":
             df.write_csv(self.path, **self.write_options)
         elif self.format.lower() == "delta":
-            df.write_delta(self.path, mode=mode, **self.write_options)
+            # deltalake can't append an empty DataFrame
+            if df.height == 0 and mode.upper() == "APPEND":
+                self._append_empty_delta_polars(df)
+                return
+            from deltalake import CommitProperties
+
+            options = dict(self.write_options)
+            delta_write_options = {
+                "commit_properties": CommitProperties(
+                    custom_metadata=self._commit_metadata
+                )
+            }
+            if self.partition_by:
+                delta_write_options["partition_by"] = self.partition_by
+            if replace_where:
+                delta_write_options["predicate"] = replace_where
+            options["delta_write_options"] = {
+                **delta_write_options,
+                **options.get("delta_write_options", {}),
+            }
+            df.write_delta(self.path, mode=mode, **options)
         elif self.format.lower() == "excel":
             df.write_excel(self.path, **self.write_options)
         elif self.format.lower() == "json":
             df.write_json(self.path, **self.write_options)
+        elif self.format.lower() in ["jsonl", "ndjson"]:
+            df.write_ndjson(self.path, **self.write_options)
         elif self.format.lower() == "parquet":
-            df.write_parquet(self.path, **self.write_options)
+            if self.partition_by:
+                df.write_parquet(
+                    self.path, partition_by=self.partition_by, **self.write_options
+                )
+            else:
+                df.write_parquet(self.path, **self.write_options)
+
+    def _append_empty_delta_polars(self, df: PolarsDataFrame) -> None:
+        from deltalake import DeltaTable
+
+        if DeltaTable.is_deltatable(self.path):
+            logger.info(f"No rows to append to {self.path}")
+            return
+
+        logger.info(f"Creating empty Delta table at {self.path}")
+        DeltaTable.create(
+            self.path,
+            schema=df.to_arrow().schema,
+            partition_by=self.partition_by,
+            custom_metadata=self._commit_metadata,
+        )
+
+    def _sink_polars(self, df: PolarsLazyFrame) -> None:
+        import polars as pl
+
+        logger.info(f"Streaming lazy frame to {self.format} file {self.path}")
+
+        with pl.Config(streaming_chunk_size=self.streaming_chunk_size):
+            if self.format == "CSV":
+                df.sink_csv(self.path, **self.write_options)
+            elif self.format == "PARQUET":
+                df.sink_parquet(self.path, **self.write_options)
+            else:
+                df.sink_ndjson(self.path, **self.write_options)
 
     # ----------------------------------------------------------------------- #
     # Purge                                                                   #
@@ -181,11 +181,19 @@ class TableDataSink(BaseDataSink):
             self.merge_cdc_options.execute(source=df)
             return
 
+        # Partial overwrite
+        _overwrite_options = self._get_spark_overwrite_options(df, mode)
+        if mode.upper() == "OVERWRITE_PARTITIONS":
+            mode = "OVERWRITE"
+
         # Default Options
         _options = {"mergeSchema": "true", "overwriteSchema": "false"}
-        if mode in ["OVERWRITE", "COMPLETE"]:
+        if mode in ["OVERWRITE", "COMPLETE"] and not _overwrite_options:
             _options["mergeSchema"] = "false"
             _options["overwriteSchema"] = "true"
+        _options.update(_overwrite_options)
+        if self._is_delta:
+            _options.update(self._commit_metadata)
         if df.isStreaming:
             _options["checkpointLocation"] = self._checkpoint_location
 
@@ -193,29 +201,33 @@ class TableDataSink(BaseDataSink):
         for k, v in self.write_options.items():
             _options[k] = v
 
+        # Liquid clustering is defined at table creation
+        if self.cluster_by:
+            self._create_clustered_table(df)
+
         if df.isStreaming:
             logger.info(
                 f"Writing {self._id} {self.format}  as stream with mode {mode} and options {_options}"
             )
-            query = (
+            writer = (
                 df.writeStream.outputMode(mode)
                 .format(self.format.lower())
-                .trigger(availableNow=True)  # TODO: Add option for trigger?
+                .trigger(**self._trigger.kwargs)
                 .options(**_options)
-            ).toTable(self.full_name)
-
-            query.awaitTermination()
+            )
+            if self.partition_by:
+                writer = writer.partitionBy(*self.partition_by)
+            self._streaming_query = writer.toTable(self.full_name)
+            self._trigger.await_query(self._streaming_query)
 
         else:
             logger.info(
                 f"Writing {self._id} {self.format}  as static with mode {mode} and options {_options}"
             )
-            (
-                df.write.format(self.format.lower())
-                .mode(mode)
-                .options(**_options)
-                .saveAsTable(self.full_name)
-            )
+            writer = df.write.format(self.format.lower()).mode(mode).options(**_options)
+            if self.partition_by:
+                writer = writer.partitionBy(*self.partition_by)
+            writer.saveAsTable(self.full_name)
 
     # ----------------------------------------------------------------------- #
     # Purge                                                                   #
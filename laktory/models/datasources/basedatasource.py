@@ -1,4 +1,8 @@
+import json
+import os
+from pathlib import Path
 from typing import Any
+from typing import Callable
 from typing import Literal
 from typing import Union
 
@@ -60,6 +64,25 @@ class BaseDataSource(BaseModel, PipelineChild):
         List of columns to drop
     filter:
         SQL expression used to select specific rows from the source table
+    incremental:
+        If `True`, a batch read only returns the rows changed since the last
+        Delta table version processed by the pipeline node, read from the
+        table Change Data Feed. The processed version is tracked in the
+        checkpoint of the node primary sink and committed once the node sinks
+        have been written. The table is fully read on the first run, when the
+        table has been vacuumed since the last processed version or when its
+        Change Data Feed is not available. Rows are returned with
+        `_change_type`, `_commit_version` and `_commit_timestamp` columns and
+        update pre-images are excluded. Only supported by Delta sources and
+        by nodes without `APPEND` sinks, since a full read returns every row
+        as an insert.
+    max_bytes_per_trigger:
+        Soft maximum amount of data, e.g. "10g", processed in each
+        micro-batch when reading as stream.
+    max_files_per_trigger:
+        Maximum number of new files processed in each micro-batch when
+        reading as stream. With Polars incremental file reads, maximum
+        number of new files processed in each run.
     renames:
         Mapping between the source table column names and new column names
     selects:
@@ -74,12 +97,22 @@ class BaseDataSource(BaseModel, PipelineChild):
     dataframe_backend: Literal["SPARK", "POLARS"] = None
     drops: Union[list, None] = None
     filter: Union[str, None] = None
+    incremental: bool = False
     limit: Union[int, None] = None
+    max_bytes_per_trigger: Union[str, None] = None
+    max_files_per_trigger: Union[int, None] = None
     mock_df: Any = Field(default=None, exclude=True)
     renames: Union[dict[str, str], None] = None
     sample: Union[DataFrameSample, None] = None
     selects: Union[list[str], dict[str, str], None] = None
     watermark: Union[Watermark, None] = None
+    _pending_version: int = None
+
+    @model_validator(mode="after")
+    def incremental_options(self) -> Any:
+        if self.incremental and self.as_stream:
+            raise ValueError("`incremental` read is not supported as stream.")
+        return self
 
     @model_validator(mode="after")
     def options(self) -> Any:
@@ -121,6 +154,16 @@ class BaseDataSource(BaseModel, PipelineChild):
 
         return pl.is_orchestrator_dlt
 
+    @property
+    def _rate_limit_options(self) -> dict[str, Any]:
+        """Streaming read options limiting the size of each micro-batch"""
+        options = {}
+        if self.max_files_per_trigger is not None:
+            options["maxFilesPerTrigger"] = self.max_files_per_trigger
+        if self.max_bytes_per_trigger is not None:
+            options["maxBytesPerTrigger"] = self.max_bytes_per_trigger
+        return options
+
     # ----------------------------------------------------------------------- #
     # Readers                                                                 #
     # ----------------------------------------------------------------------- #
@@ -163,6 +206,195 @@ class BaseDataSource(BaseModel, PipelineChild):
     def _read_polars(self) -> PolarsDataFrame:
         raise NotImplementedError()
 
+    def commit(self) -> None:
+        """
+        Commit the progress of an incremental read once the data has been
+        written to the sinks. Only used by sources tracking their progress
+        outside a Spark streaming query.
+        """
+        if self._pending_version is None:
+            return
+
+        self._write_checkpoint("delta.json", {"version": self._pending_version})
+        logger.info(
+            f"Committed processed version {self._pending_version} of {self._id}"
+        )
+        self._pending_version = None
+
+    # ----------------------------------------------------------------------- #
+    # Incremental Read                                                        #
+    # ----------------------------------------------------------------------- #
+
+    @property
+    def _checkpoint_dir(self) -> Path:
+        node = self.parent_pipeline_node
+        if node is not None and node.source is not self:
+            raise ValueError(
+                f"Incremental read of {self._id} is only supported for the source of a pipeline node. Sources of node transformers are not committed once the sinks are written."
+            )
+
+        location = None
+        if node is not None and node.primary_sink:
+            location = node.primary_sink._checkpoint_location
+
+        if location is None:
+            raise ValueError(
+                f"Incremental read of {self._id} requires the source to be read by a pipeline node with a primary sink checkpoint location."
+            )
+
+        return Path(location) / "sources"
+
+    def _read_checkpoint(self, name: str) -> dict[str, Any]:
+        path = self._checkpoint_dir / name
+        if not path.exists():
+            return {}
+        with open(path) as fp:
+            return json.load(fp)
+
+    def _write_checkpoint(self, name: str, data: dict[str, Any]) -> None:
+        path = self._checkpoint_dir / name
+
+        # Atomic checkpoint update
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w") as fp:
+            json.dump(data, fp, indent=4)
+        os.replace(tmp_path, path)
+
+    def _get_changes_start_version(
+        self, version: int, get_history: Callable[[int], list[dict]]
+    ) -> Union[int, None]:
+        """
+        First Delta version to read from the Change Data Feed. `None` if the
+        table needs to be fully read.
+
+        Parameters
+        ----------
+        version:
+            Current table version, committed as processed once the node sinks
+            have been written.
+        get_history:
+            Function returning the `limit` most recent commits of the table
+            history as a list of commits with `version` and `operation`. Only
+            the commits following the last processed version are requested.
+
+        Returns
+        -------
+        :
+            Starting version
+        """
+        last_version = self._read_checkpoint("delta.json").get("version", None)
+        self._pending_version = version
+
+        if last_version is None:
+            logger.info(f"No processed version for {self._id}. Reading full table.")
+            return None
+
+        start = last_version + 1
+        if start > version:
+            return start
+
+        history = get_history(version - last_version)
+        versions = [h["version"] for h in history]
+        if versions and min(versions) > start:
+            logger.info(
+                f"History of {self._id} is not available from version {start}. Reading full table."
+            )
+            return None
+
+        for h in history:
+            if h["version"] > last_version and h["operation"].startswith("VACUUM"):
+                logger.info(
+                    f"{self._id} vacuumed since version {last_version}. Reading full table."
+                )
+                return None
+
+        logger.info(f"Reading {self._id} changes from version {start} to {version}")
+        return start
+
+    def _read_delta_incremental_spark(
+        self, spark, table: str, load: Callable
+    ) -> SparkDataFrame:
+        """
+        Incremental read of a Delta table with Spark.
+
+        Parameters
+        ----------
+        spark:
+            Spark context
+        table:
+            Table identifier used to fetch the table history
+        load:
+            Function loading the table from a `DataFrameReader`
+
+        Returns
+        -------
+        :
+            Changes DataFrame
+        """
+        import pyspark.sql.functions as F
+
+        def get_history(limit):
+            return [
+                {"version": row["version"], "operation": row["operation"]}
+                for row in spark.sql(
+                    f"DESCRIBE HISTORY {table} LIMIT {limit}"
+                ).collect()
+            ]
+
+        version = get_history(1)[0]["version"]
+        start = self._get_changes_start_version(version, get_history)
+        no_changes = start is not None and start > version
+
+        if start is not None and not no_changes:
+            reader = (
+                spark.read.format("delta")
+                .option("readChangeFeed", "true")
+                .option("startingVersion", start)
+                .option("endingVersion", version)
+            )
+            try:
+                df = load(reader)
+                return df.filter(F.col("_change_type") != "update_preimage")
+            except Exception as e:
+                logger.warning(
+                    f"Could not read changes of {self._id}: {e}. Reading full table."
+                )
+
+        df = load(spark.read.format("delta").option("versionAsOf", version))
+        df = df.select(
+            "*",
+            F.lit("insert").alias("_change_type"),
+            F.lit(version).cast("long").alias("_commit_version"),
+            F.lit(None).cast("timestamp").alias("_commit_timestamp"),
+        )
+        if no_changes:
+            df = df.limit(0)
+
+        return df
+
+    # ----------------------------------------------------------------------- #
+    # Fingerprint                                                             #
+    # ----------------------------------------------------------------------- #
+
+    def get_fingerprint(self, spark=None) -> Union[str, None]:
+        """
+        Fingerprint of the data currently available from the source, used to
+        detect if the source has changed since a previous pipeline run.
+        Sources for which a change can't be detected return `None`.
+
+        Parameters
+        ----------
+        spark:
+            Spark context
+
+        Returns
+        -------
+        :
+            Fingerprint or `None` if unknown
+        """
+        return None
+
     def _post_read_spark(self, df: SparkDataFrame) -> SparkDataFrame:
         import pyspark.sql.functions as F
 
@@ -1,3 +1,5 @@
+import glob
+import hashlib
 import json
 import os.path
 from pathlib import Path
@@ -25,6 +27,12 @@ class FileDataSource(BaseDataSource):
 
     Attributes
     ----------
+    as_stream:
+        If `True` source is read as a streaming DataFrame. With Polars, only
+        the files not yet processed are read (incremental ingestion). The
+        processed files are tracked in the checkpoint of the node primary
+        sink and committed once the node sinks have been written. Only
+        supported for the source of the node, not for transformer sources.
     format:
         Format of the data files
     read_options:
@@ -83,6 +91,7 @@ class FileDataSource(BaseDataSource):
     read_options: dict[str, Any] = {}
     schema_definition: Union[str, dict, list] = Field(None, validation_alias="schema")
     schema_location: str = None
+    _pending_files: dict[str, dict] = None
 
     @field_validator("path", "schema_location", mode="before")
     @classmethod
@@ -93,6 +102,9 @@ class FileDataSource(BaseDataSource):
 
     @model_validator(mode="after")
     def options(self) -> Any:
+        if self.incremental and self.format != "DELTA":
+            raise ValueError("`incremental` read is only supported for 'DELTA' format")
+
         if self.dataframe_backend == "SPARK":
             if self.format in [
                 "EXCEL",
@@ -149,6 +161,13 @@ class FileDataSource(BaseDataSource):
     # ----------------------------------------------------------------------- #
 
     def _read_spark(self, spark) -> SparkDataFrame:
+        if self.incremental:
+            return self._read_delta_incremental_spark(
+                spark,
+                table=f"delta.`{self.path}`",
+                load=lambda reader: reader.options(**self.read_options).load(self.path),
+            )
+
         _options = {}
         _mode = "stream"
 
@@ -170,10 +189,13 @@ class FileDataSource(BaseDataSource):
 
             if _format == "DELTA":
                 reader = spark.readStream.format(_format.lower())
+                _options.update(self._rate_limit_options)
 
             else:
                 reader = spark.readStream.format("cloudFiles")
                 _options["cloudFiles.format"] = _format
+                for k, v in self._rate_limit_options.items():
+                    _options[f"cloudFiles.{k}"] = v
 
                 if self._schema:
                     reader = reader.schema(self._schema)
@@ -219,34 +241,320 @@ class FileDataSource(BaseDataSource):
         import polars as pl
 
         if self.as_stream:
-            raise ValueError(
-                "Streaming read not supported with Pandas DataFrame. Please switch to Spark"
-            )
+            return self._read_polars_incremental()
+
+        if self.format not in [
+            "CSV",
+            "DELTA",
+            "EXCEL",
+            "JSON",
+            "JSONL",
+            "NDJSON",
+            "PARQUET",
+        ]:
+            raise ValueError(f"Format '{self.format}' is not supported.")
 
         logger.info(f"Reading {self._id} as static")
 
-        if self.format.lower() == "csv":
-            df = pl.scan_csv(self.path, **self.read_options)
+        # Source filter, selects and limit applied by `_post_read_polars` are
+        # pushed down to the lazy scans by Polars optimizer.
+        if self.format == "DELTA":
+            if self.incremental:
+                return self._read_polars_delta_incremental()
+            return pl.scan_delta(self.path, **self.read_options)
 
-        elif self.format.lower() == "delta":
-            df = pl.scan_delta(self.path, **self.read_options)
+        # Parquet scanner natively supports hive partitions, including
+        # partitions pruning
+        if self.format == "PARQUET":
+            options = dict(self.read_options)
+            if glob.has_magic(self.path):
+                options["hive_partitioning"] = options.get("hive_partitioning", True)
+            return pl.scan_parquet(self.path, **options)
 
-        elif self.format.lower() == "excel":
-            df = pl.read_excel(self.path, **self.read_options)
+        # Remote storage
+        files = self._list_data_files()
+        if files is None:
+            return self._scan_files_polars([self.path])
 
-        elif self.format.lower() == "json":
-            df = pl.read_json(self.path, **self.read_options)
+        if not files:
+            raise ValueError(f"No files found for {self._id}")
 
-        elif self.format.lower() in ["jsonl", "ndjson"]:
-            df = pl.scan_ndjson(self.path, **self.read_options)
+        if Path(self.path).is_dir():
+            return self._scan_hive_polars(files, root=Path(self.path))
 
-        elif self.format.lower() == "parquet":
-            df = pl.scan_parquet(self.path, **self.read_options)
+        return self._scan_files_polars([str(f) for f in files])
 
+    def _scan_files_polars(self, files: list[str]) -> PolarsLazyFrame:
+        import polars as pl
+
+        if self.format == "CSV":
+            return pl.scan_csv(files, **self.read_options)
+        elif self.format in ["JSONL", "NDJSON"]:
+            return pl.scan_ndjson(files, **self.read_options)
+        elif self.format == "PARQUET":
+            return pl.scan_parquet(files, **self.read_options)
+
+        # Polars has no lazy scanner for JSON and EXCEL files
+        if self.format == "JSON":
+            dfs = [pl.read_json(f, **self.read_options) for f in files]
         else:
-            raise ValueError(f"Format '{self.format}' is not supported.")
+            dfs = [pl.read_excel(f, **self.read_options) for f in files]
+
+        return pl.concat(dfs, how="diagonal_relaxed").lazy()
+
+    def _scan_hive_polars(self, files: list[Path], root: Path) -> PolarsLazyFrame:
+        """
+        Scan files stored in hive partitions (`key=value` directories) for
+        formats not natively supported by Polars hive partitioning. Each
+        partition is scanned separately and partitions not matching the
+        source `filter` are skipped.
+        """
+        import polars as pl
+
+        # Files grouped by partition
+        groups = {}
+        for f in files:
+            dirs = f.relative_to(root).parent.parts
+            values = tuple(tuple(d.split("=", 1)) for d in dirs if "=" in d)
+            groups[values] = groups.get(values, []) + [str(f)]
+
+        keys = {tuple(k for k, _ in values) for values in groups}
+        if len(keys) != 1 or keys == {()}:
+            return self._scan_files_polars([str(f) for f in files])
+        keys = list(keys)[0]
+
+        # Partitions values with inferred types
+        def _infer_type(s):
+            for cast in [
+                lambda s: s.cast(pl.Int64),
+                lambda s: s.cast(pl.Float64),
+                lambda s: s.str.to_date(),
+            ]:
+                try:
+                    return cast(s)
+                except pl.exceptions.PolarsError:
+                    pass
+            return s
+
+        partitions = pl.DataFrame(
+            [[v for _, v in values] for values in groups],
+            schema=keys,
+            orient="row",
+        )
+        partitions = partitions.select([_infer_type(partitions[k]) for k in keys])
+        partitions = partitions.with_columns(
+            __files=pl.Series(list(groups.values()), dtype=pl.List(pl.String))
+        )
+
+        # Partitions pruning, when the filter only references partition columns
+        if self.filter:
+            try:
+                partitions = partitions.filter(pl.Expr.laktory.sql_expr(self.filter))
+            except pl.exceptions.PolarsError:
+                pass
+            logger.info(f"Reading {partitions.height} of {len(groups)} partitions")
+
+        def _scan(row):
+            _files = row.pop("__files")
+            return self._scan_files_polars(_files).with_columns(
+                [pl.lit(v, dtype=partitions.schema[k]).alias(k) for k, v in row.items()]
+            )
+
+        rows = list(partitions.iter_rows(named=True))
+        if not rows:
+            row = {k: None for k in keys}
+            row["__files"] = list(groups.values())[0]
+            return _scan(row).clear()
+
+        return pl.concat([_scan(row) for row in rows], how="diagonal_relaxed")
+
+    # ----------------------------------------------------------------------- #
+    # Incremental Read                                                        #
+    # ----------------------------------------------------------------------- #
 
-        if isinstance(df, pl.DataFrame):
-            df = df.lazy()
+    def _list_files(self) -> Union[list[Path], None]:
+        """Source files sorted by path, `None` if path is not found on the
+        local file system."""
+        path = Path(self.path)
+
+        files = None
+        if glob.has_magic(self.path):
+            files = sorted(Path(p) for p in glob.glob(self.path, recursive=True))
+            files = [f for f in files if f.is_file()]
+        elif path.is_dir():
+            files = sorted(p for p in path.rglob("*") if p.is_file())
+        elif path.exists():
+            files = [path]
+
+        return files
+
+    def _list_data_files(self) -> Union[list[Path], None]:
+        """Source files, excluding hidden and metadata files (_SUCCESS, .crc,
+        etc.) from directories and glob patterns."""
+        files = self._list_files()
+        if files is None or Path(self.path).is_file():
+            return files
+        return [f for f in files if not f.name.startswith(("_", "."))]
+
+    def _read_files_checkpoint(self) -> dict[str, dict]:
+        return self._read_checkpoint("files.json").get("files", {})
+
+    def _read_polars_incremental(self) -> PolarsLazyFrame:
+        if self.format not in ["CSV", "JSONL", "NDJSON", "PARQUET"]:
+            raise ValueError(
+                f"Streaming read with Polars is not supported for '{self.format}' format"
+            )
+
+        files = self._list_data_files()
+        if not files:
+            raise ValueError(f"No files found for {self._id}")
+
+        # Files added or modified since their last processing
+        processed = self._read_files_checkpoint()
+        states = {}
+        for f in files:
+            stat = f.stat()
+            states[str(f)] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+        new_files = {f: v for f, v in states.items() if processed.get(f) != v}
+
+        # Oldest files first
+        paths = sorted(new_files, key=lambda f: (new_files[f]["mtime_ns"], f))
+        if self.max_files_per_trigger is not None:
+            paths = paths[: self.max_files_per_trigger]
+        self._pending_files = {f: new_files[f] for f in paths}
+
+        logger.info(
+            f"Reading {self._id} incrementally: {len(paths)} new files out of {len(files)}"
+        )
+
+        # Empty DataFrame with the schema of the most recent file
+        if not paths:
+            latest = max(states, key=lambda f: (states[f]["mtime_ns"], f))
+            return self._scan_new_files_polars([latest]).clear()
+
+        return self._scan_new_files_polars(paths)
+
+    def _scan_new_files_polars(self, paths: list[str]) -> PolarsLazyFrame:
+        """Scan a subset of the source files with the hive partition columns
+        of a static read."""
+        import polars as pl
+
+        if self.format == "PARQUET":
+            options = dict(self.read_options)
+            if Path(self.path).is_dir() or glob.has_magic(self.path):
+                options["hive_partitioning"] = options.get("hive_partitioning", True)
+            return pl.scan_parquet(paths, **options)
+
+        if Path(self.path).is_dir():
+            return self._scan_hive_polars(
+                [Path(p) for p in paths], root=Path(self.path)
+            )
+
+        return self._scan_files_polars(paths)
+
+    def _read_polars_delta_incremental(self) -> PolarsLazyFrame:
+        import polars as pl
+        from deltalake import DeltaTable
+
+        dt = DeltaTable(
+            self.path, storage_options=self.read_options.get("storage_options", None)
+        )
+
+        def get_history(limit):
+            return [
+                {"version": h["version"], "operation": h["operation"]}
+                for h in dt.history(limit)
+            ]
+
+        version = dt.version()
+        start = self._get_changes_start_version(version, get_history)
+        no_changes = start is not None and start > version
+
+        if start is not None and not no_changes:
+            try:
+                changes = dt.load_cdf(starting_version=start, ending_version=version)
+                df = pl.from_arrow(changes.read_all()).lazy()
+                df = df.with_columns(
+                    pl.col("_commit_timestamp").cast(pl.Datetime("us"))
+                )
+                return df.filter(pl.col("_change_type") != "update_preimage")
+            except Exception as e:
+                logger.warning(
+                    f"Could not read changes of {self._id}: {e}. Reading full table."
+                )
+
+        df = pl.scan_delta(self.path, version=version, **self.read_options)
+        df = df.with_columns(
+            _change_type=pl.lit("insert"),
+            _commit_version=pl.lit(version, dtype=pl.Int64),
+            _commit_timestamp=pl.lit(None, dtype=pl.Datetime("us")),
+        )
+        if no_changes:
+            df = df.clear()
 
         return df
+
+    def commit(self) -> None:
+        """
+        Record the files read incrementally with Polars or the Delta version
+        read incrementally as processed in the source checkpoint.
+        """
+        super().commit()
+
+        if not self._pending_files:
+            return
+
+        processed = self._read_files_checkpoint()
+        processed.update(self._pending_files)
+        self._write_checkpoint("files.json", {"files": processed})
+
+        logger.info(
+            f"Committed {len(self._pending_files)} processed files of {self._id}"
+        )
+        self._pending_files = None
+
+    # ----------------------------------------------------------------------- #
+    # Fingerprint                                                             #
+    # ----------------------------------------------------------------------- #
+
+    def get_fingerprint(self, spark=None) -> Union[str, None]:
+        """
+        Fingerprint built from the listing, size and modification time of the
+        source files, including glob patterns. When the path is not available
+        on the local file system (e.g. cloud storage), the version of a Delta
+        table is used instead.
+
+        Parameters
+        ----------
+        spark:
+            Spark context
+
+        Returns
+        -------
+        :
+            Fingerprint or `None` if unknown
+        """
+        files = self._list_files()
+        if files:
+            h = hashlib.sha256()
+            for f in files:
+                stat = f.stat()
+                h.update(f"{f}|{stat.st_size}|{stat.st_mtime_ns};".encode())
+            return h.hexdigest()
+
+        if self.format != "DELTA":
+            return None
+
+        try:
+            if self.df_backend == "SPARK":
+                row = spark.sql(f"DESCRIBE HISTORY delta.`{self.path}` LIMIT 1").first()
+                version = row["version"]
+            else:
+                from deltalake import DeltaTable
+
+                version = DeltaTable(self.path).version()
+        except Exception as e:
+            logger.info(f"Could not get Delta version of {self._id}: {e}")
+            return None
+
+        return f"delta-version-{version}"
@@ -1,3 +1,7 @@
+import hashlib
+import json
+import sys
+import threading
 from typing import Any
 from typing import Union
 
@@ -12,6 +16,25 @@ from laktory.spark import is_spark_dataframe
 
 logger = get_logger(__name__)
 
+# Guards the Spark session Arrow conf while it is enabled for a conversion
+_arrow_conf_lock = threading.Lock()
+
+
+def _is_arrow_data(df: Any) -> bool:
+    """Check if data is a pyarrow Table or RecordBatch"""
+    pa = sys.modules.get("pyarrow", None)
+    if pa is None:
+        return False
+    return isinstance(df, (pa.Table, pa.RecordBatch))
+
+
+def _is_pandas_dataframe(df: Any) -> bool:
+    """Check if data is a pandas DataFrame"""
+    pd = sys.modules.get("pandas", None)
+    if pd is None:
+        return False
+    return isinstance(df, pd.DataFrame)
+
 
 class MemoryDataSource(BaseDataSource):
     """
@@ -23,7 +46,17 @@ class MemoryDataSource(BaseDataSource):
     data:
         Serialized data to build input DataFrame
     df:
-        Input DataFrame
+        Input DataFrame. Spark and Polars DataFrames are used as is. pyarrow
+        Tables and RecordBatches and pandas DataFrames are converted to the
+        DataFrame backend: wrapped without copy by Polars and converted with
+        Arrow by Spark, whatever the value of the session
+        `spark.sql.execution.arrow.pyspark.enabled` conf.
+    spark_chunk_size:
+        Maximum number of rows converted at once when building a Spark
+        DataFrame from a pyarrow Table or RecordBatch, limiting the size of
+        the intermediate copy held by the Python process. The whole data is
+        still sent to the Spark driver. If `None`, the data is converted in a
+        single chunk.
 
     Examples
     ---------
@@ -70,6 +103,7 @@ class MemoryDataSource(BaseDataSource):
 
     data: Union[dict[str, list[Any]], list[dict[str, Any]]] = None
     df: Any = None
+    spark_chunk_size: Union[int, None] = None
 
     @model_validator(mode="after")
     def validate_input(self) -> Any:
@@ -84,8 +118,12 @@ class MemoryDataSource(BaseDataSource):
                 dataframe_backend = "SPARK"
             elif is_polars_dataframe(self.df):
                 dataframe_backend = "POLARS"
+            elif _is_arrow_data(self.df) or _is_pandas_dataframe(self.df):
+                dataframe_backend = self.dataframe_backend
             else:
-                raise ValueError("DataFrame must be of type Spark or Polars")
+                raise ValueError(
+                    "DataFrame must be of type Spark, Polars, pandas or pyarrow"
+                )
 
             with self.validate_assignment_disabled():
                 self.dataframe_backend = dataframe_backend
@@ -108,6 +146,9 @@ class MemoryDataSource(BaseDataSource):
     def _read_spark(self, spark) -> SparkDataFrame:
         logger.info(f"Reading {self._id} from memory")
 
+        if _is_arrow_data(self.df) or _is_pandas_dataframe(self.df):
+            return self._arrow_to_spark(spark)
+
         if self.df is not None:
             return self.df
 
@@ -122,7 +163,102 @@ class MemoryDataSource(BaseDataSource):
 
         import polars as pl
 
+        # Arrow buffers are wrapped without copy
+        if _is_arrow_data(self.df):
+            return pl.from_arrow(self.df, rechunk=False).lazy()
+
+        if _is_pandas_dataframe(self.df):
+            return pl.from_pandas(self.df).lazy()
+
         if self.df is not None:
             return self.df
 
         return pl.LazyFrame(self.data)
+
+    def _arrow_to_spark(self, spark) -> SparkDataFrame:
+        import pyarrow as pa
+        from pyspark.sql.pandas.types import from_arrow_schema
+
+        if _is_pandas_dataframe(self.df):
+            return self._create_spark_dataframe(spark, self.df)
+
+        table = self.df
+        if isinstance(table, pa.RecordBatch):
+            table = pa.Table.from_batches([table])
+        schema = from_arrow_schema(table.schema)
+
+        # Each chunk is converted and sent to Spark separately so that a
+        # single chunk copy is held by the Python process at a time.
+        chunk_size = self.spark_chunk_size
+        if chunk_size is None or table.num_rows <= chunk_size:
+            return self._create_spark_dataframe(spark, table, schema=schema)
+
+        batches = table.to_batches(max_chunksize=chunk_size)
+        logger.info(f"Converting {len(batches)} chunks of Arrow data to Spark")
+        dfs = [
+            self._create_spark_dataframe(
+                spark, pa.Table.from_batches([batch]), schema=schema
+            )
+            for batch in batches
+        ]
+
+        # Balanced union to keep the plan depth logarithmic in the number of
+        # chunks
+        while len(dfs) > 1:
+            _dfs = [dfs[i].unionByName(dfs[i + 1]) for i in range(0, len(dfs) - 1, 2)]
+            if len(dfs) % 2:
+                _dfs += [dfs[-1]]
+            dfs = _dfs
+        return dfs[0]
+
+    @staticmethod
+    def _create_spark_dataframe(spark, data, schema=None) -> SparkDataFrame:
+        """
+        Spark DataFrame from a pyarrow Table or a pandas DataFrame, converted
+        with Arrow. Spark 4 natively creates DataFrames from pyarrow Tables.
+        Otherwise, Arrow is enabled on the session for the conversion only,
+        under a lock shared by concurrent conversions.
+        """
+        import pyspark
+
+        if _is_arrow_data(data):
+            if int(pyspark.__version__.split(".")[0]) >= 4:
+                return spark.createDataFrame(data, schema=schema)
+            data = data.to_pandas()
+
+        conf = "spark.sql.execution.arrow.pyspark.enabled"
+        with _arrow_conf_lock:
+            arrow_enabled = spark.conf.get(conf, None)
+            spark.conf.set(conf, "true")
+            try:
+                return spark.createDataFrame(data, schema=schema)
+            finally:
+                if arrow_enabled is None:
+                    spark.conf.unset(conf)
+                else:
+                    spark.conf.set(conf, arrow_enabled)
+
+    # ----------------------------------------------------------------------- #
+    # Fingerprint                                                             #
+    # ----------------------------------------------------------------------- #
+
+    def get_fingerprint(self, spark=None) -> Union[str, None]:
+        """
+        Fingerprint built from the hash of the data. In-memory DataFrames
+        can't be fingerprinted and return `None`.
+
+        Parameters
+        ----------
+        spark:
+            Spark context
+
+        Returns
+        -------
+        :
+            Fingerprint or `None` if unknown
+        """
+        if self.data is None:
+            return None
+
+        data = json.dumps(self.data, sort_keys=True, default=str)
+        return hashlib.sha256(data.encode()).hexdigest()
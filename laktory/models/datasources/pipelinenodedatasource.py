@@ -66,7 +66,7 @@ class PipelineNodeDataSource(BaseDataSource):
         if pl is None:
             raise ValueError(f"Source '{self.node_name}' is not attached to a pipeline")
 
-        if self.node_name not in pl.sorted_node_names:
+        if self.node_name not in pl.nodes_dict:
             raise ValueError(
                 f"Node '{self.node_name}' does not exists in pipeline '{pl.name}'"
             )
@@ -88,11 +88,55 @@ class PipelineNodeDataSource(BaseDataSource):
             )
         return node.primary_sink.full_name
 
+    # ----------------------------------------------------------------------- #
+    # Fingerprint                                                             #
+    # ----------------------------------------------------------------------- #
+
+    def get_fingerprint(self, spark=None) -> Union[str, None]:
+        """
+        Fingerprint of the upstream node, as computed during the current
+        pipeline execution.
+
+        Parameters
+        ----------
+        spark:
+            Spark context
+
+        Returns
+        -------
+        :
+            Fingerprint or `None` if unknown
+        """
+        pl = self.parent_pipeline
+        if pl is None:
+            return None
+
+        return pl._node_fingerprints.get(self.node_name, None)
+
     # ----------------------------------------------------------------------- #
     # Readers                                                                 #
     # ----------------------------------------------------------------------- #
 
+    def _read_cached(self, read):
+        pl = self.parent_pipeline
+        if pl is None:
+            return read()
+        key = (
+            self.node_name,
+            self.as_stream,
+            self.df_backend,
+            self.max_files_per_trigger,
+            self.max_bytes_per_trigger,
+        )
+        return pl._cached_read(key, read)
+
     def _read_spark(self, spark) -> SparkDataFrame:
+        return self._read_cached(lambda: self._read_node_spark(spark))
+
+    def _read_polars(self) -> PolarsDataFrame:
+        return self._read_cached(self._read_node_polars)
+
+    def _read_node_spark(self, spark) -> SparkDataFrame:
         stream_to_batch = not self.as_stream and self.node.source.as_stream
         is_dlt = False
         if self.is_orchestrator_dlt:
@@ -113,7 +157,10 @@ class PipelineNodeDataSource(BaseDataSource):
 
         elif stream_to_batch or self.node.output_df is None:
             logger.info(f"Reading pipeline node {self._id} from primary sink")
-            df = self.node.primary_sink.read(spark=spark, as_stream=self.as_stream)
+            source = self.node.primary_sink.as_source(as_stream=self.as_stream)
+            source.max_bytes_per_trigger = self.max_bytes_per_trigger
+            source.max_files_per_trigger = self.max_files_per_trigger
+            df = source.read(spark=spark)
 
         elif self.node.output_df is not None:
             logger.info(f"Reading pipeline node {self._id} from output DataFrame")
@@ -124,7 +171,7 @@ class PipelineNodeDataSource(BaseDataSource):
 
         return df
 
-    def _read_polars(self) -> PolarsDataFrame:
+    def _read_node_polars(self) -> PolarsDataFrame:
         # Read from node output DataFrame (if available)
         if self.node.output_df is not None:
             logger.info(f"Reading pipeline node {self._id} from output DataFrame")
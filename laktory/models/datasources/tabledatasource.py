@@ -89,10 +89,46 @@ class TableDataSource(BaseDataSource):
 
     def _read_spark_databricks(self, spark) -> SparkDataFrame:
         if self.as_stream:
-            logger.info(f"Reading {self._id} as stream")
-            df = spark.readStream.table(self.full_name)
+            _options = self._rate_limit_options
+            logger.info(f"Reading {self._id} as stream with options {_options}")
+            df = spark.readStream.options(**_options).table(self.full_name)
+        elif self.incremental:
+            df = self._read_delta_incremental_spark(
+                spark,
+                table=self.full_name,
+                load=lambda reader: reader.table(self.full_name),
+            )
         else:
             logger.info(f"Reading {self._id} as static")
             df = spark.read.table(self.full_name)
 
         return df
+
+    # ----------------------------------------------------------------------- #
+    # Fingerprint                                                             #
+    # ----------------------------------------------------------------------- #
+
+    def get_fingerprint(self, spark=None) -> Union[str, None]:
+        """
+        Fingerprint built from the table (Delta) version.
+
+        Parameters
+        ----------
+        spark:
+            Spark context
+
+        Returns
+        -------
+        :
+            Fingerprint or `None` if unknown
+        """
+        if spark is None or self.full_name is None:
+            return None
+
+        try:
+            row = spark.sql(f"DESCRIBE HISTORY {self.full_name} LIMIT 1").first()
+        except Exception as e:
+            logger.info(f"Could not get table version of {self._id}: {e}")
+            return None
+
+        return f"delta-version-{row['version']}"
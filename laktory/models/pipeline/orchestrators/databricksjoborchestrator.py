@@ -73,16 +73,14 @@ class DatabricksJobOrchestrator(Job, PipelineChild):
         if notebook_path is None:
             notebook_path = f"{settings.workspace_laktory_root}jobs/job_laktory_pl.py"
 
-        self.tasks = []
-
         # Sorting Node Names to prevent job update trigger with Pulumi
-        node_names = [node.name for node in pl.nodes]
-        node_names.sort()
-        for node_name in node_names:
-            node = pl.nodes_dict[node_name]
+        dag = pl.dag
+        node_names = sorted(dag.nodes)
 
+        tasks = []
+        for node_name in node_names:
             depends_on = []
-            for edge in pl.dag.in_edges(node.name):
+            for edge in dag.in_edges(node_name):
                 depends_on += [{"task_key": "node-" + edge[0]}]
 
             libraries = []
@@ -92,21 +90,21 @@ class DatabricksJobOrchestrator(Job, PipelineChild):
                     for d in pl._dependencies
                 ]
 
-            self.tasks += [
-                JobTask(
-                    task_key="node-" + node.name,
-                    notebook_task={
-                        "base_parameters": {"node_name": node.name},
-                        "notebook_path": notebook_path,
-                    },
-                    libraries=libraries,
-                    depends_ons=depends_on,
-                )
-            ]
-            self.sort_tasks(self.tasks)
-
+            task = JobTask(
+                task_key="node-" + node_name,
+                notebook_task={
+                    "base_parameters": {"node_name": node_name},
+                    "notebook_path": notebook_path,
+                },
+                libraries=libraries,
+                depends_ons=depends_on,
+            )
             if cluster_found:
-                self.tasks[-1].job_cluster_key = "node-cluster"
+                task.job_cluster_key = "node-cluster"
+            tasks += [task]
+
+        # Tasks are assigned (and validated) once for all nodes
+        self.tasks = tasks
 
         # Config file
         self.config_file.update_from_parent()
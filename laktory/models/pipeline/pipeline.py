@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import threading
+from datetime import datetime
+from datetime import timezone
 from pathlib import Path
 from typing import TYPE_CHECKING
 from typing import Any
+from typing import Callable
 from typing import Literal
 from typing import Union
 
@@ -13,6 +17,7 @@ from laktory._logger import get_logger
 from laktory._settings import settings
 from laktory.models.basemodel import BaseModel
 from laktory.models.dataquality.check import DataQualityCheck
+from laktory.models.datasinks import DataSinkMetrics
 from laktory.models.pipeline.orchestrators.databricksdltorchestrator import (
     DatabricksDLTOrchestrator,
 )
@@ -55,6 +60,78 @@ class PipelineUDF(BaseModel):
     module_path: str = None
 
 
+class PipelineNodeResult(BaseModel):
+    """
+    Execution result of a pipeline node.
+
+    Attributes
+    ----------
+    node_name:
+        Name of the pipeline node
+    status:
+        Execution status of the node.
+        `SUCCEEDED`: Node executed successfully.
+        `FAILED`: Node execution raised an exception.
+        `CANCELLED`: Node was not executed, or was interrupted, because
+        another node failed.
+        `SKIPPED`: Node was not executed because its fingerprint did not
+        change since its last successful execution.
+    start_at:
+        Execution start time (UTC)
+    end_at:
+        Execution end time (UTC)
+    error:
+        Error message when node execution failed.
+    sinks_metrics:
+        Write (or merge) metrics of each sink written by the node.
+    """
+
+    node_name: str
+    status: Literal["SUCCEEDED", "FAILED", "CANCELLED", "SKIPPED"] = None
+    start_at: datetime = None
+    end_at: datetime = None
+    error: str = None
+    sinks_metrics: list[DataSinkMetrics] = []
+
+    @property
+    def duration(self) -> Union[float, None]:
+        """Execution duration in seconds"""
+        if self.start_at is None or self.end_at is None:
+            return None
+        return (self.end_at - self.start_at).total_seconds()
+
+
+class PipelineNodeRunState(BaseModel):
+    """
+    State of a pipeline node after its last successful execution.
+
+    Attributes
+    ----------
+    fingerprint:
+        Node fingerprint, combining configuration and data sources
+        fingerprints.
+    run_at:
+        Execution end time (UTC)
+    """
+
+    fingerprint: str
+    run_at: datetime = None
+
+
+class PipelineRunState(BaseModel):
+    """
+    Run state store of a pipeline, used to skip nodes that are unchanged
+    since their last successful execution.
+
+    Attributes
+    ----------
+    nodes:
+        State of each node, keyed by node name.
+    """
+
+    nodes: dict[str, PipelineNodeRunState] = {}
+
+
 # --------------------------------------------------------------------------- #
 # Main Class                                                                  #
 # --------------------------------------------------------------------------- #
@@ -76,6 +153,10 @@ class Pipeline(BaseModel, PulumiResource, TerraformResource, PipelineChild):
 
     Attributes
     ----------
+    cache_policy:
+        Default persistence of nodes Spark stage DataFrame consumed more than
+        once. Options are `NONE`, `AUTO`, `MEMORY`, `DISK` and `DELTA`. See
+        `PipelineNode.cache_policy` for details.
     databricks_job:
         Defines the Databricks Job specifications when DATABRICKS_JOB is
         selected as the orchestrator. Requires to add the supporting
@@ -341,6 +422,7 @@ class Pipeline(BaseModel, PulumiResource, TerraformResource, PipelineChild):
 
     """
 
+    cache_policy: Literal["NONE", "AUTO", "MEMORY", "DISK", "DELTA"] = "NONE"
     databricks_job: Union[DatabricksJobOrchestrator, None] = None
     databricks_dlt: Union[DatabricksDLTOrchestrator, None] = None
     dataframe_backend: Literal["SPARK", "POLARS"] = None
@@ -350,6 +432,16 @@ class Pipeline(BaseModel, PulumiResource, TerraformResource, PipelineChild):
     orchestrator: Literal["DATABRICKS_DLT", "DATABRICKS_JOB", None] = None
     udfs: list[PipelineUDF] = []
     root_path: str = None
+    _node_results: dict[str, PipelineNodeResult] = {}
+    _node_fingerprints: dict[str, Union[str, None]] = {}
+    _run_state: PipelineRunState = None
+    _nodes_cache: dict[str, Any] = {}
+    _nodes_cache_key: tuple = None
+    _pending_downstreams: dict[str, set[str]] = {}
+    _collect_all: bool = False
+    _read_cache: dict[tuple, Any] = None
+    _read_cache_lock: Any = None
+    _read_cache_key_locks: dict[tuple, Any] = None
 
     @field_validator("root_path", mode="before")
     @classmethod
@@ -471,6 +563,11 @@ class Pipeline(BaseModel, PulumiResource, TerraformResource, PipelineChild):
 
         return Path(settings.laktory_root) / "pipelines" / self.safe_name
 
+    @property
+    def run_state_path(self) -> Path:
+        """Path of the run state store used to skip unchanged nodes."""
+        return self._root_path / "run_state.json"
+
     # ----------------------------------------------------------------------- #
     # Expectations                                                            #
     # ----------------------------------------------------------------------- #
@@ -486,6 +583,37 @@ class Pipeline(BaseModel, PulumiResource, TerraformResource, PipelineChild):
     # Nodes                                                                   #
     # ----------------------------------------------------------------------- #
 
+    @property
+    def _nodes_key(self) -> tuple:
+        """
+        Cheap signature of the nodes used to invalidate cached graph objects.
+        It changes when nodes are assigned, added, removed, renamed or when
+        their source or transformer is re-assigned.
+        """
+        return tuple(
+            (id(n), n.name, id(n.source), id(n.transformer)) for n in self.nodes
+        )
+
+    def _get_nodes_cache(self, key: str, build: Callable) -> Any:
+        nodes_key = self._nodes_key
+        if nodes_key != self._nodes_cache_key:
+            self._nodes_cache = {}
+            self._nodes_cache_key = nodes_key
+        if key not in self._nodes_cache:
+            self._nodes_cache[key] = build()
+        return self._nodes_cache[key]
+
+    def clear_nodes_cache(self) -> None:
+        """
+        Clear cached nodes dictionary, DAG and topological order. Cache is
+        automatically invalidated when nodes are assigned, added, removed or
+        renamed, but not when the dependencies of an existing node are updated
+        in place (e.g. a transformer node argument). Call this method after
+        such an update.
+        """
+        self._nodes_cache = {}
+        self._nodes_cache_key = None
+
     @property
     def nodes_dict(self) -> dict[str, PipelineNode]:
         """
@@ -496,43 +624,46 @@ class Pipeline(BaseModel, PulumiResource, TerraformResource, PipelineChild):
         :
             Nodes
         """
-        return {n.name: n for n in self.nodes}
+        return self._get_nodes_cache(
+            "nodes_dict", lambda: {n.name: n for n in self.nodes}
+        )
 
     @property
     def dag(self) -> nx.DiGraph:
         """
         Networkx Directed Acyclic Graph representation of the pipeline. Useful
-        to identify interdependencies between nodes.
+        to identify interdependencies between nodes. The graph is built once
+        and re-built only when nodes change.
 
         Returns
         -------
         :
             Directed Acyclic Graph
         """
-        import networkx as nx
+        return self._get_nodes_cache("dag", self._build_dag)
 
-        # TODO: Review if this needs to be computed dynamically or if we can
-        #       compute it only after initialization. It depends if we believe
-        #       that the nodes will be changed after initialization.
+    def _build_dag(self) -> nx.DiGraph:
+        import networkx as nx
 
         dag = nx.DiGraph()
+        nodes_dict = self.nodes_dict
 
         # Build nodes
         for n in self.nodes:
             dag.add_node(n.name)
         # Build edges and assign nodes to pipeline node data sources
-        node_names = []
+        node_names = set()
         for n in self.nodes:
             if n.name in node_names:
                 raise ValueError(
                     f"Pipeline node '{n.name}' is declared twice in pipeline '{self.name}'"
                 )
-            node_names += [n.name]
+            node_names.add(n.name)
 
             # for s in n.get_sources(PipelineNodeDataSource):
             for _node_name in n.upstream_node_names:
                 dag.add_edge(_node_name, n.name)
-                if _node_name not in self.nodes_dict:
+                if _node_name not in nodes_dict:
                     raise ValueError(
                         f"Pipeline node data source '{_node_name}' is not defined in pipeline '{self.name}'"
                     )
@@ -550,10 +681,41 @@ class Pipeline(BaseModel, PulumiResource, TerraformResource, PipelineChild):
         return dag
 
     @property
-    def sorted_node_names(self):
+    def _downstream_reads_counts(self) -> dict[str, int]:
+        """Number of pipeline node data sources reading each node"""
+        return self._get_nodes_cache(
+            "downstream_reads_counts", self._build_downstream_reads_counts
+        )
+
+    def _build_downstream_reads_counts(self) -> dict[str, int]:
+        from laktory.models.datasources.pipelinenodedatasource import (
+            PipelineNodeDataSource,
+        )
+
+        counts = {}
+        for node in self.nodes:
+            for s in node.data_sources:
+                if isinstance(s, PipelineNodeDataSource):
+                    counts[s.node_name] = counts.get(s.node_name, 0) + 1
+
+        return counts
+
+    @property
+    def sorted_node_names(self) -> list[str]:
+        """
+        Topologically sorted node names.
+
+        Returns
+        -------
+        :
+            List of topologically sorted node names.
+        """
         import networkx as nx
 
-        return list(nx.topological_sort(self.dag))
+        names = self._get_nodes_cache(
+            "sorted_node_names", lambda: list(nx.topological_sort(self.dag))
+        )
+        return list(names)
 
     @property
     def sorted_nodes(self) -> list[PipelineNode]:
@@ -565,15 +727,76 @@ class Pipeline(BaseModel, PulumiResource, TerraformResource, PipelineChild):
         :
             List of Topologically sorted nodes.
         """
-        node_names = self.sorted_node_names
-        nodes = []
-        for node_name in node_names:
-            for node in self.nodes:
-                if node.name == node_name:
-                    nodes += [node]
-                    break
+        nodes_dict = self.nodes_dict
+        return [nodes_dict[name] for name in self.sorted_node_names]
+
+    def select_nodes(self, select: Union[str, list[str]]) -> list[str]:
+        """
+        Resolve node selectors into topologically sorted node names. Supported
+        selectors are:
+
+        - `node`: the node only
+        - `node+`: the node and all its downstream nodes
+        - `+node`: the node and all its upstream nodes
+        - `+node+`: the node, its upstream and its downstream nodes
+
+        Multiple selectors may be provided as a list or as a comma-separated
+        string, in which case the union of the selections is returned.
+
+        Parameters
+        ----------
+        select:
+            Node selector(s)
 
-        return nodes
+        Returns
+        -------
+        :
+            Selected node names, topologically sorted.
+
+        Examples
+        --------
+        ```py
+        from laktory import models
+
+        pl = models.Pipeline(
+            name="pl-stocks",
+            nodes=[
+                {"name": "brz", "source": {"path": "/tmp/brz/"}},
+                {"name": "slv", "source": {"node_name": "brz"}},
+                {"name": "gld", "source": {"node_name": "slv"}},
+            ],
+        )
+        print(pl.select_nodes("slv+"))
+        # > ['slv', 'gld']
+        print(pl.select_nodes("+slv"))
+        # > ['brz', 'slv']
+        print(pl.select_nodes("brz, gld"))
+        # > ['brz', 'gld']
+        ```
+        """
+        import networkx as nx
+
+        if isinstance(select, str):
+            select = select.split(",")
+
+        dag = self.dag
+        selected = set()
+        for selector in select:
+            selector = selector.strip()
+            if not selector:
+                continue
+            node_name = selector.strip("+")
+            if node_name not in dag.nodes:
+                raise ValueError(
+                    f"Selected node '{node_name}' is not defined in pipeline '{self.name}'"
+                )
+            selected.add(node_name)
+            if selector.startswith("+"):
+                selected |= nx.ancestors(dag, node_name)
+            if selector.endswith("+"):
+                selected |= nx.descendants(dag, node_name)
+
+        return [n for n in self.sorted_node_names if n in selected]
 
     # ----------------------------------------------------------------------- #
     # Data Sources                                                            #
@@ -598,14 +821,97 @@ class Pipeline(BaseModel, PulumiResource, TerraformResource, PipelineChild):
                 spark=spark,
             )
 
+    @property
+    def node_results(self) -> dict[str, PipelineNodeResult]:
+        """
+        Execution result of each node for the last pipeline execution.
+
+        Returns
+        -------
+        :
+            Node results whose keys are the node names.
+        """
+        return self._node_results
+
+    def read_run_state(self) -> PipelineRunState:
+        """
+        Read the run state store from `run_state_path`.
+
+        Returns
+        -------
+        :
+            Run state. Empty if the store does not exist yet.
+        """
+        path = self.run_state_path
+        if not path.exists():
+            return PipelineRunState()
+
+        logger.info(f"Reading pipeline run state from {path}")
+        with open(path, "r") as fp:
+            return PipelineRunState.model_validate_json(fp.read())
+
+    def write_run_state(self, run_state: PipelineRunState) -> None:
+        """
+        Write the run state store to `run_state_path`.
+
+        Parameters
+        ----------
+        run_state:
+            Run state
+        """
+        path = self.run_state_path
+        logger.info(f"Writing pipeline run state to {path}")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as fp:
+            fp.write(run_state.model_dump_json(indent=4))
+
     def execute(
-        self, spark=None, udfs=None, write_sinks=True, full_refresh: bool = False
-    ) -> None:
+        self,
+        spark=None,
+        udfs=None,
+        write_sinks=True,
+        full_refresh: bool = False,
+        max_workers: int = 1,
+        cancel_on_failure: bool = True,
+        skip_unchanged: bool = False,
+        select: Union[str, list[str]] = None,
+        collect_all: bool = False,
+    ) -> dict[str, PipelineNodeResult]:
         """
-        Execute the pipeline (read sources and write sinks) by sequentially
-        executing each node. The selected orchestrator might impact how
+        Execute the pipeline (read sources and write sinks) by executing each
+        node in topological order. The selected orchestrator might impact how
         data sources or sinks are processed.
 
+        When `max_workers` is greater than 1, nodes are executed concurrently
+        on a thread pool. A node is scheduled as soon as all of its upstream
+        nodes have completed. With Spark, all nodes share the same session and
+        their jobs run concurrently on the cluster. With Polars, lazy frames
+        are collected in parallel threads.
+
+        Upon the first node failure, no other node is scheduled and the
+        exception is raised once running nodes have stopped.
+
+        When `skip_unchanged` is `True`, a fingerprint of each node is
+        computed from its configuration and the fingerprints of its data
+        sources (files listing, Delta table version, upstream node
+        fingerprint). Nodes with output sinks whose fingerprint matches the
+        one of their last successful execution, as saved in the run state
+        store, are skipped and downstream nodes read their sinks.
+
+        When `select` is provided, only the selected nodes are executed (see
+        `select_nodes` for the selector syntax). Selected nodes read the
+        output of unselected upstream nodes from their primary sink.
+
+        When `collect_all` is `True` with the Polars backend, the lazy plans
+        of all nodes are built first and all sinks are materialized together
+        with `polars.collect_all`, so that sub-plans shared by multiple
+        sinks and nodes are computed only once per run.
+
+        During the run, pipeline node data sources reads are memoized: all the
+        nodes, SQL expressions and function arguments referencing the same
+        upstream node share the same DataFrame, read once from its output or
+        primary sink.
+
         Parameters
         ----------
         spark:
@@ -617,17 +923,375 @@ class Pipeline(BaseModel, PulumiResource, TerraformResource, PipelineChild):
         full_refresh:
             If `True` all nodes will be completely re-processed by deleting
             existing data and checkpoints before processing.
+        max_workers:
+            Maximum number of nodes executed concurrently. Nodes are executed
+            sequentially when set to 1.
+        cancel_on_failure:
+            If `True`, Spark jobs of nodes still running when another node
+            fails are cancelled. Otherwise, running nodes are allowed to
+            finish. Only applies when `max_workers` is greater than 1.
+        skip_unchanged:
+            If `True`, nodes unchanged since their last successful execution
+            are skipped. Ignored when `write_sinks` is `False`.
+        select:
+            Node selector(s) such as `node`, `node+` (node and downstream
+            nodes) or `+node` (node and upstream nodes). All nodes are
+            executed if `None`.
+        collect_all:
+            If `True` and the DataFrame backend is Polars, sinks of all nodes
+            are collected in a single `polars.collect_all` call once all
+            nodes plans are built. Nodes are executed sequentially.
+
+        Returns
+        -------
+        :
+            Execution result of each node, keyed by node name.
         """
         logger.info("Executing Pipeline")
 
-        for inode, node in enumerate(self.sorted_nodes):
-            node.execute(
-                spark=spark,
-                udfs=udfs,
-                write_sinks=write_sinks,
-                full_refresh=full_refresh,
+        node_names = self.sorted_node_names
+        if select:
+            node_names = self.select_nodes(select)
+            logger.info(f"Selected pipeline nodes: {node_names}")
+            self._validate_unselected_upstreams(node_names)
+
+        self._node_results = {}
+        self._node_fingerprints = {}
+        self._run_state = None
+        if skip_unchanged and write_sinks:
+            self._run_state = self.read_run_state()
+
+            # Unselected nodes sinks were produced by their last execution
+            for node_name, state in self._run_state.nodes.items():
+                if node_name not in node_names:
+                    self._node_fingerprints[node_name] = state.fingerprint
+
+        kwargs = {
+            "spark": spark,
+            "udfs": udfs,
+            "write_sinks": write_sinks,
+            "full_refresh": full_refresh,
+        }
+
+        # Downstream nodes yet to be executed
+        selected = set(node_names)
+        self._pending_downstreams = {
+            n: set(self.dag.successors(n)) & selected for n in node_names
+        }
+
+        self._collect_all = collect_all and write_sinks and self.df_backend == "POLARS"
+        if self._collect_all:
+            max_workers = 1
+
+        self._read_cache = {}
+        self._read_cache_lock = threading.Lock()
+        self._read_cache_key_locks = {}
+
+        try:
+            if max_workers is None or max_workers <= 1:
+                for node_name in node_names:
+                    self._execute_node(self.nodes_dict[node_name], **kwargs)
+                    self._release_upstream_caches(node_name)
+            else:
+                self._execute_concurrent(
+                    node_names=node_names,
+                    max_workers=max_workers,
+                    cancel_on_failure=cancel_on_failure,
+                    **kwargs,
+                )
+            if self._collect_all:
+                self._collect_sinks(node_names)
+        finally:
+            self._collect_all = False
+            self._read_cache = None
+            self._read_cache_key_locks = None
+            for node_name in node_names:
+                self.nodes_dict[node_name].release_cache()
+                if node_name not in self._node_results:
+                    self._node_results[node_name] = PipelineNodeResult(
+                        node_name=node_name, status="CANCELLED"
+                    )
+            for r in self._node_results.values():
+                msg = f"Pipeline node {r.node_name} | status: {r.status}"
+                if r.duration is not None:
+                    msg += f" | duration: {r.duration:.2f} s"
+                logger.info(msg)
+            if self._run_state is not None:
+                self.write_run_state(self._run_state)
+                self._run_state = None
+
+        return self.node_results
+
+    def _collect_sinks(self, node_names: list[str]) -> None:
+        import polars as pl
+
+        nodes = self.nodes_dict
+
+        sinks = []
+        frames = []
+        node_names = [
+            n for n in node_names if self._node_results[n].status == "SUCCEEDED"
+        ]
+        for node_name in node_names:
+            for s, df in nodes[node_name]._sinks_frames:
+                sinks += [s]
+                frames += [df.lazy()]
+
+        if not frames:
+            return
+
+        logger.info(f"Collecting {len(frames)} pipeline sinks together")
+        try:
+            dfs = pl.collect_all(frames)
+            for s, df in zip(sinks, dfs):
+                s.write(df)
+            for node_name in node_names:
+                nodes[node_name].source.commit()
+                result = self._node_results[node_name]
+                result.sinks_metrics = nodes[node_name].sinks_metrics
+        except Exception as e:
+            for node_name in node_names:
+                self._node_results[node_name].status = "FAILED"
+                self._node_results[node_name].error = str(e)
+                if self._run_state is not None:
+                    self._run_state.nodes.pop(node_name, None)
+            raise e
+
+    def _release_upstream_caches(self, node_name: str) -> None:
+        for _node_name in self.dag.predecessors(node_name):
+            pending = self._pending_downstreams.get(_node_name, None)
+            if pending is None:
+                continue
+            pending.discard(node_name)
+            if not pending:
+                self.nodes_dict[_node_name].release_cache()
+
+    def _validate_unselected_upstreams(self, node_names: list[str]) -> None:
+        nodes = self.nodes_dict
+        for node_name in node_names:
+            for _node_name in self.dag.predecessors(node_name):
+                if _node_name in node_names:
+                    continue
+                upstream = nodes[_node_name]
+                if upstream.primary_sink is None and upstream.output_df is None:
+                    raise ValueError(
+                        f"Upstream node '{_node_name}' of selected node '{node_name}' is not selected and has no primary sink to read from."
+                    )
+
+    def _execute_node(self, node: PipelineNode, job_tag: str = None, **kwargs):
+        spark = kwargs.get("spark", None)
+
+        result = PipelineNodeResult(
+            node_name=node.name, start_at=datetime.now(timezone.utc)
+        )
+        self._node_results[node.name] = result
+
+        # Skip unchanged node
+        fingerprint = None
+        if self._run_state is not None:
+            fingerprint = node.get_fingerprint(spark=spark)
+            self._node_fingerprints[node.name] = fingerprint
+            state = self._run_state.nodes.pop(node.name, None)
+            if (
+                fingerprint is not None
+                and state is not None
+                and state.fingerprint == fingerprint
+                and node.has_output_sinks
+                and not kwargs.get("full_refresh", False)
+            ):
+                logger.info(
+                    f"Pipeline node {node.name} unchanged since {state.run_at}. Skipping execution."
+                )
+                self._run_state.nodes[node.name] = state
+                result.status = "SKIPPED"
+                result.end_at = datetime.now(timezone.utc)
+                return
+
+        if job_tag:
+            self._set_spark_job_tag(spark, job_tag)
+
+        try:
+            node.execute(**kwargs)
+        except Exception as e:
+            result.status = "FAILED"
+            result.error = str(e)
+            raise e
+        else:
+            result.status = "SUCCEEDED"
+        finally:
+            result.end_at = datetime.now(timezone.utc)
+            result.sinks_metrics = node.sinks_metrics
+            if job_tag:
+                self._unset_spark_job_tag(spark, job_tag)
+
+        if fingerprint is not None:
+            self._run_state.nodes[node.name] = PipelineNodeRunState(
+                fingerprint=fingerprint, run_at=result.end_at
             )
 
+    def _execute_concurrent(
+        self,
+        node_names: list[str],
+        max_workers: int,
+        cancel_on_failure: bool = True,
+        **kwargs,
+    ):
+        from concurrent.futures import FIRST_COMPLETED
+        from concurrent.futures import ThreadPoolExecutor
+        from concurrent.futures import wait
+
+        spark = kwargs.get("spark", None)
+        dag = self.dag
+        nodes = self.nodes_dict
+
+        # Upstream nodes not yet completed
+        selected = set(node_names)
+        waiting = {n: set(dag.predecessors(n)) & selected for n in node_names}
+        running = {}
+        error = None
+
+        logger.info(f"Executing pipeline nodes with {max_workers} workers")
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="laktory-node"
+        ) as executor:
+
+            def _submit_ready_nodes():
+                for node_name in list(waiting.keys()):
+                    if waiting[node_name]:
+                        continue
+                    del waiting[node_name]
+                    future = executor.submit(
+                        self._execute_node,
+                        nodes[node_name],
+                        job_tag=self._spark_job_tag(node_name),
+                        **kwargs,
+                    )
+                    running[future] = node_name
+
+            _submit_ready_nodes()
+            while running:
+                done, _ = wait(running.keys(), return_when=FIRST_COMPLETED)
+                for future in done:
+                    node_name = running.pop(future)
+                    e = future.exception()
+
+                    if e is not None:
+                        if error is None:
+                            logger.info(
+                                f"Pipeline node {node_name} failed. Stopping pipeline execution."
+                            )
+                            error = e
+                            if cancel_on_failure:
+                                for _node_name in running.values():
+                                    self._cancel_spark_job_tag(
+                                        spark, self._spark_job_tag(_node_name)
+                                    )
+                        elif cancel_on_failure:
+                            self._node_results[node_name].status = "CANCELLED"
+                        continue
+
+                    self._release_upstream_caches(node_name)
+                    for _node_name in dag.successors(node_name):
+                        if _node_name in waiting:
+                            waiting[_node_name].discard(node_name)
+
+                if error is None:
+                    _submit_ready_nodes()
+
+        if error is not None:
+            raise error
+
+    # ----------------------------------------------------------------------- #
+    # Read Cache                                                              #
+    # ----------------------------------------------------------------------- #
+
+    def _cached_read(self, key: tuple, read: Callable) -> Any:
+        """
+        DataFrame returned by `read`, memoized for the duration of the
+        pipeline run.
+
+        Parameters
+        ----------
+        key:
+            Read cache key
+        read:
+            Function reading the DataFrame
+
+        Returns
+        -------
+        :
+            DataFrame
+        """
+        if self._read_cache is None:
+            return read()
+
+        # The run-wide lock only guards the cache dictionaries. Reads are
+        # serialized per key so that distinct sources are read concurrently.
+        with self._read_cache_lock:
+            key_lock = self._read_cache_key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self._read_cache_lock:
+                if key in self._read_cache:
+                    logger.info(f"Reading {key} from pipeline run cache")
+                    return self._read_cache[key]
+            df = read()
+            with self._read_cache_lock:
+                self._read_cache[key] = df
+            return df
+
+    def _is_temp_view_registered(self, name: str, df: Any) -> bool:
+        """
+        Check if `df` has already been registered as temp view `name` during
+        the pipeline run and record it otherwise.
+        """
+        if self._read_cache is None:
+            return False
+
+        key = ("__temp_view", name)
+        with self._read_cache_lock:
+            if self._read_cache.get(key, None) is df:
+                return True
+            self._read_cache[key] = df
+            return False
+
+    # ----------------------------------------------------------------------- #
+    # Spark Jobs                                                              #
+    # ----------------------------------------------------------------------- #
+
+    def _spark_job_tag(self, node_name: str) -> str:
+        return f"laktory-{self.safe_name}-{node_name}"
+
+    @staticmethod
+    def _set_spark_job_tag(spark, tag: str) -> None:
+        if spark is None:
+            return
+        if "connect" in str(type(spark)).lower():
+            spark.addTag(tag)
+        else:
+            spark.sparkContext.setJobGroup(tag, tag, interruptOnCancel=True)
+
+    @staticmethod
+    def _unset_spark_job_tag(spark, tag: str) -> None:
+        if spark is None:
+            return
+        if "connect" in str(type(spark)).lower():
+            spark.removeTag(tag)
+
+    @staticmethod
+    def _cancel_spark_job_tag(spark, tag: str) -> None:
+        if spark is None:
+            return
+        logger.info(f"Cancelling Spark jobs for {tag}")
+        try:
+            if "connect" in str(type(spark)).lower():
+                spark.interruptTag(tag)
+            else:
+                spark.sparkContext.cancelJobGroup(tag)
+        except Exception as e:
+            logger.warning(f"Spark jobs for {tag} could not be cancelled: {e}")
+
     def dag_figure(self) -> Figure:
         """
         [UNDER DEVELOPMENT] Generate a figure representation of the pipeline
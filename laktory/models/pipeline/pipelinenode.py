@@ -1,3 +1,6 @@
+import functools
+import hashlib
+import json
 import os
 import shutil
 import uuid
@@ -17,6 +20,7 @@ from laktory.exceptions import DataQualityExpectationsNotSupported
 from laktory.models.basemodel import BaseModel
 from laktory.models.dataquality.expectation import DataQualityExpectation
 from laktory.models.datasinks import DataSinksUnion
+from laktory.models.datasinks import DataSinkTrigger
 from laktory.models.datasinks import TableDataSink
 from laktory.models.datasources import BaseDataSource
 from laktory.models.datasources import DataSourcesUnion
@@ -45,6 +49,21 @@ class PipelineNode(BaseModel, PipelineChild):
     add_layer_columns:
         If `True` and `layer` not `None` layer-specific columns like timestamps
         are added to the resulting DataFrame.
+    cache_policy:
+        Persistence of the Spark stage DataFrame when it is consumed more than
+        once (expectations checks, sinks writes and downstream nodes reading
+        it in memory). Streaming DataFrames are never persisted.
+            - `NONE`: DataFrame is re-computed by each consumer
+            - `AUTO`: DataFrame is persisted in memory and spilled to disk
+            - `MEMORY`: DataFrame is persisted in memory only
+            - `DISK`: DataFrame is persisted on disk only
+            - `DELTA`: DataFrame is written to a Delta table under the node
+              root path and read back
+        The DataFrame is unpersisted once its last consumer has been executed.
+        With Polars, any policy other than `NONE` marks the lazy frame with
+        `cache()` so that it is computed once when its consumers are
+        collected together (see `Pipeline.execute` `collect_all`).
+        If `None`, the pipeline `cache_policy` is used.
     dlt_template:
         Specify which template (notebook) to use if pipeline is run with
         Databricks Delta Live Tables. If `None` default laktory template
@@ -61,8 +80,22 @@ class PipelineNode(BaseModel, PipelineChild):
     expectations:
         List of expectations for the DataFrame. Can be used as warnings, drop
         invalid records or fail a pipeline.
+    fused_streaming:
+        If `True` and the node DataFrame is a Spark stream, a single
+        `foreachBatch` query checks the expectations, splits each micro-batch
+        into output and quarantine rows and writes all the sinks. Each
+        micro-batch is read and computed only once and a single node
+        checkpoint replaces the expectations and sinks checkpoints.
     layer:
         Layer in the medallion architecture
+    max_sink_workers:
+        Maximum number of sinks written concurrently, each from its own
+        thread. With Spark, the write jobs of the sinks then run in parallel
+        and, when both output and quarantine sinks are written, the stage
+        DataFrame is computed once and split into output and quarantine
+        rows from this single pass. With Polars, output and quarantine
+        DataFrames are collected together. If `None`, sinks are written
+        sequentially.
     name:
         Name given to the node. Required to reference a node in a data source.
     primary_keys:
@@ -90,6 +123,10 @@ class PipelineNode(BaseModel, PipelineChild):
     timestamp_key:
         Name of the column storing a timestamp associated with each row. It is
         used as the default column by the builder when creating watermarks.
+    trigger:
+        Trigger of the streaming queries checking expectations (or of the
+        fused stream) and default trigger of the node sinks. If `None`, all
+        available data is processed.
 
 
     Examples
@@ -156,6 +193,7 @@ class PipelineNode(BaseModel, PipelineChild):
     """
 
     add_layer_columns: bool = True
+    cache_policy: Literal["NONE", "AUTO", "MEMORY", "DISK", "DELTA"] = None
     dlt_template: Union[str, None] = "DEFAULT"
     dataframe_backend: Literal["SPARK", "POLARS"] = None
     description: str = None
@@ -164,18 +202,24 @@ class PipelineNode(BaseModel, PipelineChild):
     transformer: Union[SparkChain, PolarsChain, None] = None
     expectations: list[DataQualityExpectation] = []
     expectations_checkpoint_location: str = None
+    fused_streaming: bool = False
     layer: Literal["BRONZE", "SILVER", "GOLD"] = None
+    max_sink_workers: int = None
     name: Union[str, None] = None
     primary_keys: list[str] = None
     sinks: list[DataSinksUnion] = None
     root_path: str = None
     source: DataSourcesUnion
     timestamp_key: str = None
+    trigger: DataSinkTrigger = None
     _view_definition: str = None
     _stage_df: Any = None
     _output_df: Any = None
     _quarantine_df: Any = None
     _source_columns: list[str] = []
+    _cached_df: Any = None
+    _cached_location: Path = None
+    _streaming_query: Any = None
 
     @model_validator(mode="before")
     @classmethod
@@ -254,6 +298,19 @@ class PipelineNode(BaseModel, PipelineChild):
                 )
         return self
 
+    @model_validator(mode="after")
+    def validate_incremental(self):
+        if self.source is None or not self.source.incremental:
+            return self
+
+        # A full read fallback returns every row as an insert
+        for s in self.sinks or []:
+            if getattr(s, "mode", None) == "APPEND":
+                raise ValueError(
+                    f"Node '{self.name}' with an incremental source does not support 'APPEND' sink mode. A full read of the source, on the first run or after a vacuum, would duplicate the rows already written. Use 'MERGE' or 'OVERWRITE' instead."
+                )
+        return self
+
     @model_validator(mode="after")
     def validate_expectations(self):
         if self.source.as_stream:
@@ -503,10 +560,49 @@ class PipelineNode(BaseModel, PipelineChild):
 
         return None
 
+    @property
+    def _cache_location(self) -> Path:
+        if self._root_path:
+            return Path(self._root_path) / "cache"
+
+        return None
+
+    @property
+    def _node_checkpoint_location(self) -> Path:
+        if self._root_path:
+            return Path(self._root_path) / "checkpoints/node"
+
+        return None
+
     @property
     def checks(self):
         return [e.check for e in self.expectations]
 
+    @property
+    def _trigger(self) -> DataSinkTrigger:
+        if self.trigger:
+            return self.trigger
+        return DataSinkTrigger()
+
+    @property
+    def streaming_queries(self) -> list:
+        """
+        Streaming queries started by the last execution of the node. Queries
+        are still active when the trigger `await_termination` is `False`.
+        """
+        queries = []
+        if self._streaming_query is not None:
+            queries += [self._streaming_query]
+        for s in self.all_sinks:
+            if s.streaming_query is not None:
+                queries += [s.streaming_query]
+        return queries
+
+    @property
+    def sinks_metrics(self) -> list:
+        """Write metrics of the sinks written by the last execution"""
+        return [s.metrics for s in self.all_sinks if s.metrics is not None]
+
     # ----------------------------------------------------------------------- #
     # Transformations                                                         #
     # ----------------------------------------------------------------------- #
@@ -686,6 +782,15 @@ class PipelineNode(BaseModel, PipelineChild):
 
         return names
 
+    @property
+    def downstream_reads_count(self) -> int:
+        """Number of pipeline node data sources reading the current node"""
+        pl = self.parent_pipeline
+        if pl is None:
+            return 0
+
+        return pl._downstream_reads_counts.get(self.name, 0)
+
     # ----------------------------------------------------------------------- #
     # Data Sources                                                            #
     # ----------------------------------------------------------------------- #
@@ -708,6 +813,38 @@ class PipelineNode(BaseModel, PipelineChild):
 
         return sources
 
+    # ----------------------------------------------------------------------- #
+    # Fingerprint                                                             #
+    # ----------------------------------------------------------------------- #
+
+    def get_fingerprint(self, spark=None) -> Union[str, None]:
+        """
+        Fingerprint of the node combining the hash of its configuration and
+        the fingerprints of all its data sources. Two executions with the same
+        fingerprint are expected to produce the same output. User-defined
+        functions code is not included.
+
+        Parameters
+        ----------
+        spark:
+            Spark context
+
+        Returns
+        -------
+        :
+            Fingerprint or `None` if any of the data sources can't be
+            fingerprinted.
+        """
+        config = json.dumps(self.model_dump(), sort_keys=True, default=str)
+        parts = [hashlib.sha256(config.encode()).hexdigest()]
+        for s in self.data_sources:
+            fingerprint = s.get_fingerprint(spark=spark)
+            if fingerprint is None:
+                return None
+            parts += [fingerprint]
+
+        return hashlib.sha256("|".join(parts).encode()).hexdigest()
+
     # ----------------------------------------------------------------------- #
     # Execution                                                               #
     # ----------------------------------------------------------------------- #
@@ -717,48 +854,52 @@ class PipelineNode(BaseModel, PipelineChild):
         if self.has_sinks:
             for s in self.sinks:
                 s.purge(spark=spark)
-        if self._expectations_checkpoint_location:
-            if os.path.exists(self._expectations_checkpoint_location):
-                logger.info(
-                    f"Deleting expectations checkpoint at {self._expectations_checkpoint_location}",
-                )
-                shutil.rmtree(self._expectations_checkpoint_location)
+        for path in [
+            self._expectations_checkpoint_location,
+            self._node_checkpoint_location,
+            self._cache_location,
+        ]:
+            if path:
+                self._purge_path(path, spark=spark)
+
+    def _purge_path(self, path: Path, spark=None):
+        if os.path.exists(path):
+            logger.info(
+                f"Deleting {path}",
+            )
+            shutil.rmtree(path)
 
-            if spark is None:
-                return
+        if spark is None:
+            return
 
-            try:
-                from pyspark.dbutils import DBUtils
-            except ModuleNotFoundError:
-                return
+        try:
+            from pyspark.dbutils import DBUtils
+        except ModuleNotFoundError:
+            return
 
-            dbutils = DBUtils(spark)
+        dbutils = DBUtils(spark)
 
-            _path = self._expectations_checkpoint_location.as_posix()
-            try:
-                dbutils.fs.ls(
-                    _path
-                )  # TODO: Figure out why this does not work with databricks connect
-                logger.info(
-                    f"Deleting checkpoint at dbfs {_path}",
-                )
-                dbutils.fs.rm(_path, True)
-
-            except Exception as e:
-                if "java.io.FileNotFoundException" in str(e):
-                    pass
-                elif "databricks.sdk.errors.platform.ResourceDoesNotExist" in str(
-                    type(e)
-                ):
-                    pass
-                elif "databricks.sdk.errors.platform.InvalidParameterValue" in str(
-                    type(e)
-                ):
-                    # TODO: Figure out why this is happening. It seems that the databricks SDK
-                    #       modify the path before sending to REST API.
-                    logger.warn(f"dbutils could not delete checkpoint {_path}: {e}")
-                else:
-                    raise e
+        _path = path.as_posix()
+        try:
+            dbutils.fs.ls(
+                _path
+            )  # TODO: Figure out why this does not work with databricks connect
+            logger.info(
+                f"Deleting dbfs {_path}",
+            )
+            dbutils.fs.rm(_path, True)
+
+        except Exception as e:
+            if "java.io.FileNotFoundException" in str(e):
+                pass
+            elif "databricks.sdk.errors.platform.ResourceDoesNotExist" in str(type(e)):
+                pass
+            elif "databricks.sdk.errors.platform.InvalidParameterValue" in str(type(e)):
+                # TODO: Figure out why this is happening. It seems that the databricks SDK
+                #       modify the path before sending to REST API.
+                logger.warn(f"dbutils could not delete {_path}: {e}")
+            else:
+                raise e
 
     def execute(
         self,
@@ -807,6 +948,12 @@ class PipelineNode(BaseModel, PipelineChild):
         if full_refresh:
             self.purge(spark)
 
+        # Reset streaming queries and metrics
+        self._streaming_query = None
+        for s in self.all_sinks:
+            s._streaming_query = None
+            s._metrics = None
+
         # Read Source
         self._stage_df = self.source.read(spark)
 
@@ -844,23 +991,246 @@ class PipelineNode(BaseModel, PipelineChild):
             if transformer.nodes:
                 self._stage_df = transformer.execute(self._stage_df, udfs=udfs)
 
+        # Check expectations and write sinks in a single streaming query
+        if self._is_fused_stream(write_sinks):
+            self._execute_fused_stream()
+            return self._output_df
+
+        # Persist stage DataFrame used by multiple consumers
+        self.release_cache()
+        self._persist_stage_df(write_sinks)
+
         # Check expectations
         self.check_expectations()
 
         # Output and Quarantine to Sinks
-        if write_sinks:
-            for s in self.output_sinks:
-                if self.is_view:
-                    s.write(view_definition=self._view_definition, spark=spark)
-                    self._output_df = s.as_source().read(spark=spark)
-                else:
-                    s.write(self._output_df)
-            if self._quarantine_df is not None:
-                for s in self.quarantine_sinks:
-                    s.write(self._quarantine_df)
+        if write_sinks and self._defer_sinks:
+            logger.info("Sinks writing deferred to pipeline collection.")
+        elif write_sinks:
+            self._write_sinks(spark)
+            self.source.commit()
+
+        # Release cache if not read by downstream nodes
+        if self.downstream_reads_count == 0:
+            self.release_cache()
 
         return self._output_df
 
+    # ----------------------------------------------------------------------- #
+    # Sinks                                                                   #
+    # ----------------------------------------------------------------------- #
+
+    def _write_sinks(self, spark=None) -> None:
+        if self.is_view:
+            for s in self.output_sinks:
+                s.write(view_definition=self._view_definition, spark=spark)
+                self._output_df = s.as_source().read(spark=spark)
+            return
+
+        frames = self._sinks_frames
+        workers = min(self.max_sink_workers or 1, len(frames))
+        if workers <= 1:
+            for s, df in frames:
+                s.write(df)
+            return
+
+        frames = self._split_sinks_frames(frames)
+
+        logger.info(
+            f"Writing {len(frames)} sinks of node {self.name} with {workers} workers"
+        )
+        self._write_sinks_concurrent(
+            [functools.partial(s.write, df) for s, df in frames], workers
+        )
+
+    def _split_sinks_frames(self, frames: list[tuple]) -> list[tuple]:
+        """
+        Compute output and quarantine DataFrames from a single pass over the
+        stage DataFrame.
+        """
+        df = self._stage_df
+        has_quarantine = self._quarantine_df is not None and self.quarantine_sinks
+
+        # Polars output and quarantine frames are collected together, sharing
+        # the computation of the stage frame
+        if "polars" in str(type(df)).lower():
+            import polars as pl
+
+            lazy_frames = {}
+            for _, _df in frames:
+                lazy_frames[id(_df)] = _df.lazy()
+            dfs = pl.collect_all(list(lazy_frames.values()))
+            dfs = dict(zip(lazy_frames.keys(), dfs))
+
+            # A DataFrame can't be written from multiple threads at once.
+            # Clones share the same data.
+            return [(s, dfs[id(_df)].clone()) for s, _df in frames]
+
+        # Spark stage DataFrame is persisted while output and quarantine sinks
+        # are written so that it is read and transformed once
+        if has_quarantine and not df.isStreaming and self._cached_df is None:
+            from pyspark import StorageLevel
+
+            logger.info(
+                f"Caching stage DataFrame of node {self.name} to split output and quarantine rows"
+            )
+            self._cached_df = df.persist(StorageLevel.MEMORY_AND_DISK)
+
+        return frames
+
+    def _write_sinks_concurrent(self, writes: list[Callable], workers: int) -> None:
+        """Run sinks write functions from a pool of threads"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        # Spark job group or tags of the calling thread (set by the pipeline
+        # to cancel the node jobs) are not inherited by the writer threads
+        spark = getattr(self._stage_df, "sparkSession", None)
+        job_group = None
+        job_tags = []
+        if spark is not None:
+            if "connect" in str(type(spark)).lower():
+                job_tags = list(spark.getTags())
+            else:
+                job_group = spark.sparkContext.getLocalProperty("spark.jobGroup.id")
+
+        def _write(write):
+            if job_group:
+                spark.sparkContext.setJobGroup(
+                    job_group, job_group, interruptOnCancel=True
+                )
+            for tag in job_tags:
+                spark.addTag(tag)
+            try:
+                write()
+            finally:
+                for tag in job_tags:
+                    spark.removeTag(tag)
+
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix=f"laktory-{self.name}-sink"
+        ) as executor:
+            futures = [executor.submit(_write, write) for write in writes]
+            for future in futures:
+                future.result()
+
+    # ----------------------------------------------------------------------- #
+    # Cache                                                                   #
+    # ----------------------------------------------------------------------- #
+
+    @property
+    def _defer_sinks(self) -> bool:
+        pl = self.parent_pipeline
+        if pl is None or not pl._collect_all:
+            return False
+        return "polars" in str(type(self._stage_df)).lower()
+
+    @property
+    def _sinks_frames(self) -> list[tuple]:
+        """Sinks paired with the DataFrame they are written from"""
+        frames = [(s, self._output_df) for s in self.output_sinks]
+        if self._quarantine_df is not None:
+            frames += [(s, self._quarantine_df) for s in self.quarantine_sinks]
+        return frames
+
+    @property
+    def _cache_policy(self) -> str:
+        if self.cache_policy is not None:
+            return self.cache_policy
+
+        pl = self.parent_pipeline
+        if pl is not None:
+            return pl.cache_policy
+
+        return "NONE"
+
+    def _stage_consumers_count(self, write_sinks: bool) -> int:
+        count = self.downstream_reads_count
+
+        if [
+            e
+            for e in self.expectations
+            if not (self.is_dlt_run and e.is_dlt_compatible)
+        ]:
+            count += 1
+
+        if write_sinks:
+            count += len(self.output_sinks)
+            if self.expectations:
+                count += len(self.quarantine_sinks)
+
+        return count
+
+    def _persist_stage_df(self, write_sinks: bool) -> None:
+        policy = self._cache_policy
+        df = self._stage_df
+
+        if policy == "NONE" or self.is_view:
+            return
+
+        is_polars_lazy = (
+            "polars" in str(type(df)).lower() and "lazy" in str(type(df)).lower()
+        )
+        if not is_polars_lazy:
+            if "spark" not in str(type(df)).lower() or df.isStreaming:
+                return
+
+        count = self._stage_consumers_count(write_sinks)
+        if count < 2:
+            return
+
+        logger.info(
+            f"Caching stage DataFrame of node {self.name} with policy {policy} ({count} consumers)"
+        )
+
+        # Polars shared sub-plan is computed once when collected together
+        if is_polars_lazy:
+            self._stage_df = df.cache()
+            return
+
+        if policy == "DELTA":
+            if self._cache_location is None:
+                raise ValueError(
+                    f"'DELTA' cache policy of node {self.name} requires a root path."
+                )
+            path = str(self._cache_location)
+            (
+                df.write.mode("OVERWRITE")
+                .format("delta")
+                .option("overwriteSchema", "true")
+                .save(path)
+            )
+            self._stage_df = df.sparkSession.read.format("delta").load(path)
+            self._cached_df = self._stage_df
+            self._cached_location = self._cache_location
+            return
+
+        from pyspark import StorageLevel
+
+        level = {
+            "AUTO": StorageLevel.MEMORY_AND_DISK,
+            "MEMORY": StorageLevel.MEMORY_ONLY,
+            "DISK": StorageLevel.DISK_ONLY,
+        }[policy]
+        self._stage_df = df.persist(level)
+        self._cached_df = self._stage_df
+
+    def release_cache(self) -> None:
+        """
+        Unpersist the stage DataFrame cached according to `cache_policy` or
+        delete its Delta cache table. Called by the pipeline once all
+        downstream nodes have been executed.
+        """
+        if self._cached_df is None:
+            return
+
+        logger.info(f"Releasing cached stage DataFrame of node {self.name}")
+        if self._cached_location is not None:
+            self._purge_path(self._cached_location, spark=self._cached_df.sparkSession)
+            self._cached_location = None
+        else:
+            self._cached_df.unpersist()
+        self._cached_df = None
+
     def check_expectations(self):
         """
         Check expectations, raise errors, warnings where required and build
@@ -875,8 +1245,6 @@ class PipelineNode(BaseModel, PipelineChild):
 
         # Data Quality Checks
         is_streaming = getattr(self._stage_df, "isStreaming", False)
-        qfilter = None  # Quarantine filter
-        kfilter = None  # Keep filter
         if not self.expectations:
             self._output_df = self._stage_df
             self._quarantine_df = None
@@ -885,16 +1253,20 @@ class PipelineNode(BaseModel, PipelineChild):
         logger.info("Checking Data Quality Expectations")
 
         def _batch_check(df, node):
-            for e in node.expectations:
-                is_dlt_managed = node.is_dlt_run and e.is_dlt_compatible
-
-                # Run Check
-                if not is_dlt_managed:
-                    e.run_check(
-                        df,
-                        raise_or_warn=True,
-                        node=node,
-                    )
+            # Expectations managed by DLT are not checked
+            expectations = [
+                e
+                for e in node.expectations
+                if not (node.is_dlt_run and e.is_dlt_compatible)
+            ]
+
+            # Run all checks in a single pass
+            DataQualityExpectation.run_checks(
+                expectations,
+                df,
+                raise_or_warn=True,
+                node=node,
+            )
 
         def _stream_check(batch_df, batch_id, node):
             _batch_check(
@@ -912,17 +1284,12 @@ class PipelineNode(BaseModel, PipelineChild):
                 raise ValueError(
                     f"Expectations Checkpoint not specified for node '{self.name}'"
                 )
-            query = (
-                self._stage_df.writeStream.foreachBatch(
-                    lambda batch_df, batch_id: _stream_check(batch_df, batch_id, self)
-                )
-                .trigger(availableNow=True)
-                .options(
-                    checkpointLocation=self._expectations_checkpoint_location,
-                )
-                .start()
+            writer = self._stage_df.writeStream.foreachBatch(
+                lambda batch_df, batch_id: _stream_check(batch_df, batch_id, self)
+            ).options(
+                checkpointLocation=self._expectations_checkpoint_location,
             )
-            query.awaitTermination()
+            self._streaming_query = self._trigger.start(writer, for_each_batch=True)
 
         else:
             _batch_check(
@@ -931,6 +1298,25 @@ class PipelineNode(BaseModel, PipelineChild):
             )
 
         # Build Filters
+        kfilter, qfilter = self._get_expectations_filters()
+
+        if qfilter is not None:
+            logger.info("Building quarantine DataFrame")
+            self._quarantine_df = self._stage_df.filter(qfilter)
+        else:
+            self._quarantine_df = self._stage_df.filter("False")
+
+        if kfilter is not None:
+            logger.info("Dropping invalid rows")
+            self._output_df = self._stage_df.filter(kfilter)
+        else:
+            self._output_df = self._stage_df
+
+    def _get_expectations_filters(self) -> tuple:
+        """Build keep and quarantine filters from expectations"""
+        qfilter = None  # Quarantine filter
+        kfilter = None  # Keep filter
+
         for e in self.expectations:
             is_dlt_managed = self.is_dlt_run and e.is_dlt_compatible
 
@@ -951,14 +1337,103 @@ class PipelineNode(BaseModel, PipelineChild):
                 else:
                     qfilter = qfilter & _filter
 
-        if qfilter is not None:
-            logger.info("Building quarantine DataFrame")
-            self._quarantine_df = self._stage_df.filter(qfilter)
-        else:
-            self._quarantine_df = self._stage_df.filter("False")
+        return kfilter, qfilter
+
+    # ----------------------------------------------------------------------- #
+    # Fused Streaming                                                         #
+    # ----------------------------------------------------------------------- #
+
+    def _is_fused_stream(self, write_sinks: bool) -> bool:
+        return (
+            self.fused_streaming
+            and write_sinks
+            and self.has_sinks
+            and not self.is_orchestrator_dlt
+            and getattr(self._stage_df, "isStreaming", False)
+        )
+
+    def _execute_fused_stream(self) -> None:
+        """
+        Check expectations, split output and quarantine rows and write all
+        sinks from a single `foreachBatch` streaming query.
+        """
+        if self._node_checkpoint_location is None:
+            raise ValueError(f"Checkpoint not specified for node '{self.name}'")
+
+        for s in self.all_sinks:
+            if s.mode not in ["APPEND", "COMPLETE", "MERGE", "OVERWRITE_PARTITIONS"]:
+                raise ValueError(
+                    f"Sink mode '{s.mode}' is not supported for fused streaming of node '{self.name}'. Use 'APPEND', 'COMPLETE', 'MERGE' or 'OVERWRITE_PARTITIONS'."
+                )
+
+        # Filters are built once and applied to each micro-batch
+        for e in self.expectations:
+            e._dataframe_backend = "SPARK"
+        kfilter, qfilter = self._get_expectations_filters()
+
+        def _process_batch(batch_df, batch_id):
+            logger.info(f"Processing batch {batch_id} of node {self.name}")
+
+            # Micro-batch is cached as it is used by checks and each sink
+            batch_df = batch_df.persist()
+            try:
+                DataQualityExpectation.run_checks(
+                    self.expectations,
+                    batch_df,
+                    raise_or_warn=True,
+                    node=self,
+                )
+
+                output_df = batch_df
+                if kfilter is not None:
+                    output_df = batch_df.filter(kfilter)
+                frames = [(s, output_df) for s in self.output_sinks]
 
+                if self.quarantine_sinks:
+                    quarantine_df = batch_df.filter("False")
+                    if qfilter is not None:
+                        quarantine_df = batch_df.filter(qfilter)
+                    frames += [(s, quarantine_df) for s in self.quarantine_sinks]
+
+                writes = [
+                    functools.partial(self._write_fused_batch, s, df, batch_id)
+                    for s, df in frames
+                ]
+                workers = min(self.max_sink_workers or 1, len(writes))
+                if workers > 1:
+                    self._write_sinks_concurrent(writes, workers)
+                else:
+                    for write in writes:
+                        write()
+            finally:
+                batch_df.unpersist()
+
+        logger.info(f"Executing node {self.name} as a fused stream")
+        writer = self._stage_df.writeStream.foreachBatch(_process_batch).options(
+            checkpointLocation=self._node_checkpoint_location,
+        )
+        self._streaming_query = self._trigger.start(writer, for_each_batch=True)
+
+        # Streaming DataFrames for downstream nodes
+        self._output_df = self._stage_df
         if kfilter is not None:
-            logger.info("Dropping invalid rows")
             self._output_df = self._stage_df.filter(kfilter)
-        else:
-            self._output_df = self._stage_df
+        self._quarantine_df = self._stage_df.filter("False")
+        if qfilter is not None:
+            self._quarantine_df = self._stage_df.filter(qfilter)
+
+    def _write_fused_batch(self, sink, df, batch_id: int) -> None:
+        mode = sink.mode
+        if mode == "COMPLETE":
+            mode = "OVERWRITE"
+
+        # Idempotent Delta writes in case a micro-batch is replayed
+        _sink = sink
+        if mode != "MERGE" and sink.format == "DELTA":
+            write_options = dict(sink.write_options)
+            write_options["txnAppId"] = f"{self.name}-{sink._uuid}"
+            write_options["txnVersion"] = str(batch_id)
+            _sink = sink.model_copy(update={"write_options": write_options})
+
+        _sink.write(df, mode=mode)
+        sink._metrics = _sink.metrics
@@ -25,11 +25,18 @@ class BaseChain(BaseModel, PipelineChild):
     dataframe_backend: Literal["SPARK", "POLARS"] = None
     nodes: list[Union[BaseChainNode, "BaseChain"]]
     _columns: list[list[str]] = []
+    _fused_columns: list[list[str]] = []
 
     @property
     def columns(self):
+        """Input columns of each chain node"""
         return self._columns
 
+    @property
+    def fused_columns(self):
+        """Input columns of each fused chain node"""
+        return self._fused_columns
+
     @property
     def upstream_node_names(self) -> list[str]:
         """Pipeline node names required to apply transformer"""
@@ -58,11 +65,66 @@ class BaseChain(BaseModel, PipelineChild):
     # Execution                                                               #
     # ----------------------------------------------------------------------- #
 
+    def _fuse_nodes(self) -> list[tuple]:
+        """
+        Chain nodes with consecutive column nodes merged into a single node,
+        each returned with the list of original nodes it has been built from.
+        """
+        fused = []
+        for node in self.nodes:
+            if (
+                fused
+                and isinstance(node, BaseChainNode)
+                and node.is_column
+                and isinstance(fused[-1][0], BaseChainNode)
+                and fused[-1][0].is_column
+            ):
+                _node, originals = fused[-1]
+                columns = _node._with_columns + node._with_columns
+                _node = type(node)(
+                    dataframe_backend=node.dataframe_backend,
+                    with_columns=[c.model_copy() for c in columns],
+                )
+                _node.parent = self
+                fused[-1] = (_node, originals + [node])
+            else:
+                fused += [(node, [node])]
+        return fused
+
+    @property
+    def fused_nodes(self) -> list[Union[BaseChainNode, "BaseChain"]]:
+        """
+        Chain nodes with consecutive column nodes merged into a single node so
+        that independent columns are built in a single projection.
+        """
+        return [node for node, _ in self._fuse_nodes()]
+
+    @property
+    def summary(self) -> str:
+        """Short description of the operations applied by the chain"""
+        return "chain(" + " -> ".join([n.summary for n in self.fused_nodes]) + ")"
+
     def execute(self, df, udfs=None) -> AnyDataFrame:
         logger.info(f"Executing {self.df_backend} chain")
 
-        for inode, node in enumerate(self.nodes):
-            self._columns += [df.columns]
+        fused = self._fuse_nodes()
+        logger.info(
+            f"Fused {len(self.nodes)} chain nodes into {len(fused)}:\n"
+            + "\n".join([f"{i}: {n.summary}" for i, (n, _) in enumerate(fused)])
+        )
+
+        for inode, (node, originals) in enumerate(fused):
+            self._fused_columns += [df.columns]
+
+            # Input columns of the original nodes, each column node appending
+            # its new columns
+            columns = list(df.columns)
+            for o in originals:
+                self._columns += [list(columns)]
+                if len(originals) > 1:
+                    for c in o._with_columns:
+                        if c.name not in columns:
+                            columns += [c.name]
 
             tnode = type(node)
             logger.info(
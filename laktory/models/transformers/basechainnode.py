@@ -98,6 +98,44 @@ class ChainNodeColumn(BaseModel, PipelineChild):
     def eval(self, udfs=None, dataframe_backend=None):
         return self.expr.eval(udfs=udfs, dataframe_backend=dataframe_backend)
 
+    def references(self, names: set[str]) -> bool:
+        """
+        Check if the column expression (potentially) references any of the
+        given column names. Wildcards, selectors and column references that
+        are not given as names (e.g. `pl.col(pl.Float64)`) can't be resolved
+        and are considered to reference all columns.
+        """
+        if not names:
+            return False
+
+        value = self.expr.value
+        for s in [
+            "*",
+            "^",
+            "all(",
+            "exclude(",
+            "nth(",
+            "first(",
+            "last(",
+            "cs.",
+            "selectors",
+            "dtype",
+        ]:
+            if s in value:
+                return True
+
+        for m in re.finditer(r"(?<!\w)col\((.*?)\)", value):
+            if not re.fullmatch(
+                r"\s*(['\"])[^'\"]*\1(\s*,\s*(['\"])[^'\"]*\3)*\s*", m[1]
+            ):
+                return True
+
+        for name in names:
+            if re.search(rf"(?<!\w){re.escape(name)}(?!\w)", value):
+                return True
+
+        return False
+
 
 class BaseChainNodeSQLExpr(BaseModel, PipelineChild):
     """
@@ -279,6 +317,35 @@ class BaseChainNode(BaseModel, PipelineChild):
     def is_column(self):
         return len(self._with_columns) > 0
 
+    @property
+    def column_batches(self) -> list[list[ChainNodeColumn]]:
+        """
+        Node columns grouped into batches of independent columns that can be
+        built in a single projection. A column referencing or overwriting a
+        column built in the current batch starts a new batch.
+        """
+        batches = []
+        names = set()
+        for c in self._with_columns:
+            if not batches or c.name in names or c.references(names):
+                batches += [[]]
+                names = set()
+            batches[-1] += [c]
+            names.add(c.name)
+        return batches
+
+    @property
+    def summary(self) -> str:
+        """Short description of the operations applied by the node"""
+        if self.is_column:
+            return " -> ".join(
+                "with_columns(" + ", ".join([c.name for c in batch]) + ")"
+                for batch in self.column_batches
+            )
+        if self.sql_expr:
+            return "sql_expr"
+        return f"{self.func_name}()"
+
     # ----------------------------------------------------------------------- #
     # Data Sources                                                            #
     # ----------------------------------------------------------------------- #
@@ -232,16 +232,19 @@ class PolarsChainNode(BaseChainNode):
             udfs = []
         udfs = {f.__name__: f for f in udfs}
 
-        # Build Columns
+        # Build Columns (independent columns in a single projection)
         if self._with_columns:
-            for column in self._with_columns:
-                logger.info(
-                    f"Building column {column.name} as {column.expr or column.sql_expr}"
-                )
-                _col = column.eval(udfs=udfs, dataframe_backend="POLARS")
-                if column.type:
-                    _col = _col.cast(DATATYPES_MAP[column.type])
-                df = df.with_columns(**{column.name: _col})
+            for columns in self.column_batches:
+                _cols = {}
+                for column in columns:
+                    logger.info(
+                        f"Building column {column.name} as {column.expr or column.sql_expr}"
+                    )
+                    _col = column.eval(udfs=udfs, dataframe_backend="POLARS")
+                    if column.type:
+                        _col = _col.cast(DATATYPES_MAP[column.type])
+                    _cols[column.name] = _col
+                df = df.with_columns(**_cols)
             return df
 
         # From SQL expression
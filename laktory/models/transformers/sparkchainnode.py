@@ -88,9 +88,14 @@ class SparkChainNodeSQLExpr(BaseChainNodeSQLExpr):
 
         # Create views
         df.createOrReplaceTempView(df_id)
+        pipeline = self.parent_pipeline
         for source in self.data_sources:
             _df = source.read(spark=_spark)
-            _df.createOrReplaceTempView(f"nodes__{source.node.name}")
+            view_name = f"nodes__{source.node.name}"
+            # Upstream nodes views are registered once per pipeline run
+            if pipeline and pipeline._is_temp_view_registered(view_name, _df):
+                continue
+            _df.createOrReplaceTempView(view_name)
 
         # Run query
         _df = None
@@ -264,16 +269,19 @@ class SparkChainNode(BaseChainNode):
             udfs = []
         udfs = {f.__name__: f for f in udfs}
 
-        # Build Columns
+        # Build Columns (independent columns in a single projection)
         if self._with_columns:
-            for column in self._with_columns:
-                logger.info(
-                    f"Building column {column.name} as {column.expr or column.sql_expr}"
-                )
-                _col = column.eval(udfs=udfs, dataframe_backend="SPARK")
-                if column.type:
-                    _col = _col.cast(DATATYPES_MAP[column.type])
-                df = df.withColumns({column.name: _col})
+            for columns in self.column_batches:
+                _cols = {}
+                for column in columns:
+                    logger.info(
+                        f"Building column {column.name} as {column.expr or column.sql_expr}"
+                    )
+                    _col = column.eval(udfs=udfs, dataframe_backend="SPARK")
+                    if column.type:
+                        _col = _col.cast(DATATYPES_MAP[column.type])
+                    _cols[column.name] = _col
+                df = df.withColumns(_cols)
             return df
 
         # From SQL expression
@@ -2,6 +2,7 @@
 
 dbutils.widgets.text("pipeline_name", "pl-stocks-job")
 dbutils.widgets.text("node_name", "")
+dbutils.widgets.text("select", "")
 dbutils.widgets.text("full_refresh", "False")
 dbutils.widgets.text("install_dependencies", "True")
 
@@ -48,6 +49,7 @@ notebook_path = (
 laktory_root = "/Workspace" + notebook_path.split("/jobs/")[0]
 pl_name = dbutils.widgets.get("pipeline_name")
 node_name = dbutils.widgets.get("node_name")
+select = dbutils.widgets.get("select")
 full_refresh = dbutils.widgets.get("full_refresh").lower() == "true"
 filepath = f"{laktory_root}/pipelines/{pl_name}/config.json"
 with open(filepath, "r") as fp:
@@ -71,4 +73,4 @@ for udf in pl.udfs:
 if node_name:
     pl.nodes_dict[node_name].execute(spark=spark, udfs=udfs, full_refresh=full_refresh)
 else:
-    pl.execute(spark=spark, udfs=udfs, full_refresh=full_refresh)
+    pl.execute(spark=spark, udfs=udfs, full_refresh=full_refresh, select=select or None)
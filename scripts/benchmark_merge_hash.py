@@ -0,0 +1,86 @@
+"""
+Compare CDC merge throughput of the available `hash_function` strategies.
+
+Usage: python scripts/benchmark_merge_hash.py [n_rows] [n_updates]
+"""
+
+import shutil
+import sys
+import tempfile
+import time
+
+import pyspark.sql.functions as F
+from delta import configure_spark_with_delta_pip
+from pyspark.sql import SparkSession
+
+from laktory import models
+
+n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+n_updates = int(sys.argv[2]) if len(sys.argv) > 2 else 100_000
+
+builder = (
+    SparkSession.builder.appName("BenchmarkMergeHash")
+    .config("spark.sql.extensions", "io.delta.sql.DeltaSparkSessionExtension")
+    .config(
+        "spark.sql.catalog.spark_catalog",
+        "org.apache.spark.sql.delta.catalog.DeltaCatalog",
+    )
+)
+spark = configure_spark_with_delta_pip(builder).getOrCreate()
+spark.sparkContext.setLogLevel("ERROR")
+
+
+def build_df(n, offset=0, version=0):
+    return (
+        spark.range(offset, offset + n)
+        .withColumn("key_str", F.concat(F.lit("k"), F.col("id") % 1000))
+        .withColumn("key_date", F.date_add(F.lit("2024-01-01"), F.col("id") % 365))
+        .withColumn("value", F.rand(seed=version))
+        .withColumn("label", F.when(F.col("id") % 10 == 0, None).otherwise("x"))
+        .withColumn("version", F.lit(version))
+    )
+
+
+# Half updates of existing keys, half new keys
+initial = build_df(n_rows).cache()
+updates = build_df(n_updates, offset=n_rows - n_updates // 2, version=1).cache()
+initial.count()
+updates.count()
+
+results = []
+for scd_type in [1, 2]:
+    for hash_function in ["SHA2", "XXHASH64", "MD5", "NONE"]:
+        path = tempfile.mkdtemp(prefix="laktory-merge-hash-")
+        sink = models.FileDataSink(
+            mode="MERGE",
+            path=path,
+            merge_cdc_options=models.DataSinkMergeCDCOptions(
+                primary_keys=["id", "key_str", "key_date"],
+                order_by="version",
+                hash_function=hash_function,
+                scd_type=scd_type,
+            ),
+        )
+
+        t0 = time.time()
+        sink.write(initial)
+        t1 = time.time()
+        sink.write(updates)
+        t2 = time.time()
+
+        results += [
+            {
+                "scd_type": scd_type,
+                "hash_function": hash_function,
+                "initial_rows_per_s": n_rows / (t1 - t0),
+                "update_rows_per_s": n_updates / (t2 - t1),
+            }
+        ]
+        shutil.rmtree(path)
+
+print(f"{'scd':>3} {'hash_function':>13} {'initial rows/s':>15} {'update rows/s':>14}")
+for r in results:
+    print(
+        f"{r['scd_type']:>3} {r['hash_function']:>13} "
+        f"{r['initial_rows_per_s']:>15,.0f} {r['update_rows_per_s']:>14,.0f}"
+    )
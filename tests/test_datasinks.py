@@ -12,6 +12,7 @@ from laktory._testing import df_slv
 from laktory._testing import df_slv_polars
 from laktory._testing import df_slv_stream
 from laktory._testing import spark
+from laktory.models import DataSinkTrigger
 from laktory.models import FileDataSink
 from laktory.models import TableDataSink
 
@@ -116,6 +117,39 @@ def test_file_data_sink_stream():
     assert not os.path.exists(sink._checkpoint_location)
 
 
+def test_file_data_sink_stream_trigger():
+    dirpath = paths.tmp / "df_slv_sink_stream_trigger/"
+    if dirpath.exists():
+        shutil.rmtree(dirpath)
+
+    # Trigger
+    trigger = DataSinkTrigger(type="PROCESSING_TIME", interval="10 seconds")
+    assert trigger.kwargs == {"processingTime": "10 seconds"}
+    assert DataSinkTrigger().kwargs == {"availableNow": True}
+    with pytest.raises(ValueError):
+        DataSinkTrigger(type="CONTINUOUS")
+
+    # Write without awaiting termination
+    sink = FileDataSink(
+        path=dirpath / "data",
+        checkpoint_location=str(dirpath / "checkpoint"),
+        format="PARQUET",
+        mode="APPEND",
+        trigger={"type": "ONCE", "await_termination": False},
+    )
+    sink.write(df_slv_stream)
+    query = sink.streaming_query
+    query.awaitTermination()
+
+    # Test
+    assert not query.isActive
+    assert spark.read.parquet(str(dirpath / "data")).count() == df_slv.count()
+
+    # Cleanup
+    sink.purge()
+    assert not os.path.exists(sink.path)
+
+
 def test_file_data_sink_polars_parquet():
     filepath = paths.tmp / "df_slv_polars_sink.parquet"
 
@@ -147,6 +181,42 @@ def test_file_data_sink_polars_parquet():
     assert not os.path.exists(sink.path)
 
 
+def test_file_data_sink_polars_streaming():
+    import polars as pl
+
+    dirpath = paths.tmp / "df_slv_polars_sink_streaming"
+    if dirpath.exists():
+        shutil.rmtree(dirpath)
+
+    for fmt in ["CSV", "PARQUET", "JSONL"]:
+        # Write lazy frame with streaming engine
+        sink = FileDataSink(
+            path=str(dirpath / f"df.{fmt.lower()}"),
+            format=fmt,
+            streaming_chunk_size=10,
+        )
+        sink.write(df_slv_polars.lazy())
+
+        # Plan not supported by streaming engine
+        sink.write(
+            df_slv_polars.lazy().with_columns(
+                max_close=pl.col("close").max().over("symbol")
+            )
+        )
+
+        # Read back
+        source = sink.as_source()
+        source.dataframe_backend = "POLARS"
+        df = source.read().collect()
+
+        # Test
+        assert df.height == df_slv.count()
+        assert df.columns == df_slv.columns + ["max_close"]
+
+    # Cleanup
+    shutil.rmtree(dirpath)
+
+
 def test_file_data_sink_polars_delta():
     dirpath = paths.tmp / "df_slv_polars_sink.delta"
     if dirpath.exists():
@@ -172,11 +242,232 @@ def test_file_data_sink_polars_delta():
     assert df.height == df_slv.count() * 2
     assert df.columns == df_slv.columns
 
+    # Test metrics
+    metrics = sink.metrics
+    assert metrics.mode == "append"
+    assert metrics.commits == 1
+    assert metrics.rows_inserted == df_slv.count()
+    assert metrics.files_added == 1
+    assert metrics.duration > 0
+
     # Cleanup
     sink.purge()
     assert not os.path.exists(sink.path)
 
 
+def test_file_data_sink_polars_delta_metrics(monkeypatch):
+    from deltalake import write_deltalake
+
+    dirpath = paths.tmp / "df_slv_polars_sink_metrics.delta"
+    if dirpath.exists():
+        shutil.rmtree(dirpath)
+
+    sink = FileDataSink(
+        path=dirpath,
+        format="DELTA",
+        mode="APPEND",
+    )
+    sink.write(df_slv_polars)
+
+    # Concurrent writer committing during the write
+    _write_polars = FileDataSink._write_polars
+
+    def write_polars(self, df, mode=None):
+        _write_polars(self, df, mode=mode)
+        write_deltalake(str(dirpath), df.head(1).to_arrow(), mode="append")
+
+    monkeypatch.setattr(FileDataSink, "_write_polars", write_polars)
+    sink.write(df_slv_polars)
+
+    # Test
+    metrics = sink.metrics
+    assert metrics.commits == 1
+    assert metrics.rows_inserted == df_slv.count()
+
+    # Cleanup
+    sink.purge()
+
+
+def test_file_data_sink_polars_delta_maintenance():
+    from deltalake import DeltaTable
+
+    dirpath = paths.tmp / "df_slv_polars_sink_maintenance.delta"
+    if dirpath.exists():
+        shutil.rmtree(dirpath)
+
+    sink = FileDataSink(
+        path=dirpath,
+        format="DELTA",
+        mode="APPEND",
+        maintenance={
+            "optimize_every_n_runs": 3,
+            "zorder_by": ["symbol"],
+            "vacuum_retention_hours": 168,
+            "optimize_write": True,
+        },
+    )
+
+    def operations():
+        return [c["operation"] for c in DeltaTable(sink.path).history()]
+
+    # Not enough runs for optimize
+    sink.write(df_slv_polars)
+    sink.write(df_slv_polars)
+    assert "OPTIMIZE" not in operations()
+    assert "SET TBLPROPERTIES" in operations()
+    configuration = DeltaTable(sink.path).metadata().configuration
+    assert configuration["delta.autoOptimize.optimizeWrite"] == "true"
+
+    # Optimize and vacuum
+    sink.write(df_slv_polars)
+    assert operations().count("OPTIMIZE") == 1
+    assert len(DeltaTable(sink.path).files()) == 1
+
+    # Throttled after optimize
+    sink.write(df_slv_polars)
+    assert operations().count("OPTIMIZE") == 1
+    assert operations().count("SET TBLPROPERTIES") == 1
+    assert sink.maintenance._commits.commits == 1
+
+    # Commits since last OPTIMIZE read from history by a new sink
+    sink = FileDataSink.model_validate(sink.model_dump(exclude_unset=True))
+    sink.write(df_slv_polars)
+    assert sink.maintenance._commits.commits == 2
+    assert operations().count("OPTIMIZE") == 1
+
+    # Read back
+    df = DeltaTable(sink.path).to_pyarrow_table()
+    assert df.num_rows == df_slv.count() * 5
+
+    # Cleanup
+    sink.purge()
+
+
+def test_file_data_sink_partition_by():
+    dirpath = paths.tmp / "df_slv_sink_partitioned/"
+    if dirpath.exists():
+        shutil.rmtree(dirpath)
+
+    # Spark
+    sink = FileDataSink(
+        path=dirpath,
+        format="PARQUET",
+        mode="OVERWRITE",
+        partition_by=["symbol"],
+    )
+    sink.write(df_slv)
+    symbols = df_slv.select("symbol").distinct().count()
+    assert len([f for f in os.listdir(dirpath) if f.startswith("symbol=")]) == symbols
+    df = sink.as_source().read(spark=spark)
+    assert df.count() == df_slv.count()
+    sink.purge()
+
+    # Polars Parquet
+    sink = FileDataSink(
+        path=dirpath,
+        format="PARQUET",
+        partition_by=["symbol"],
+    )
+    sink.write(df_slv_polars)
+    assert len([f for f in os.listdir(dirpath) if f.startswith("symbol=")]) == symbols
+    source = sink.as_source()
+    source.dataframe_backend = "POLARS"
+    df = source.read().collect()
+    assert df.height == df_slv.count()
+    assert sorted(df.columns) == sorted(df_slv.columns)
+    sink.purge()
+
+    # Polars Delta
+    sink = FileDataSink(
+        path=dirpath,
+        format="DELTA",
+        mode="OVERWRITE",
+        partition_by=["symbol"],
+    )
+    sink.write(df_slv_polars)
+    assert len([f for f in os.listdir(dirpath) if f.startswith("symbol=")]) == symbols
+    sink.purge()
+
+    # Not supported
+    with pytest.raises(ValueError):
+        FileDataSink(path=dirpath, partition_by=["symbol"], cluster_by=["symbol"])
+    with pytest.raises(ValueError):
+        FileDataSink(path=dirpath, format="PARQUET", cluster_by=["symbol"])
+
+
+def test_file_data_sink_overwrite_partitions():
+    import polars as pl
+
+    dirpath = paths.tmp / "df_slv_sink_overwrite_partitions/"
+    if dirpath.exists():
+        shutil.rmtree(dirpath)
+
+    symbol = df_slv.select("symbol").first()[0]
+    n = df_slv.count()
+    n_symbol = df_slv.filter(F.col("symbol") == symbol).count()
+
+    # Spark
+    sink = FileDataSink(
+        path=dirpath,
+        format="PARQUET",
+        mode="OVERWRITE",
+        partition_by=["symbol"],
+    )
+    sink.write(df_slv)
+    sink.write(
+        df_slv.filter(F.col("symbol") == symbol).limit(1),
+        mode="OVERWRITE_PARTITIONS",
+    )
+    df = sink.as_source().read(spark=spark)
+    assert df.count() == n - n_symbol + 1
+    sink.purge()
+
+    # Polars Delta
+    sink = FileDataSink(
+        path=dirpath,
+        format="DELTA",
+        mode="OVERWRITE_PARTITIONS",
+        partition_by=["symbol"],
+    )
+    sink.write(df_slv_polars)
+    sink.write(df_slv_polars.filter(pl.col("symbol") == symbol).head(1))
+    assert sink._get_replace_where(
+        df_slv_polars.filter(pl.col("symbol") == symbol), sink.mode
+    ) == (f"symbol IN ('{symbol}')")
+    assert sink.metrics.rows_inserted == 1
+    assert sink.metrics.files_removed == 1
+    source = sink.as_source()
+    source.dataframe_backend = "POLARS"
+    assert source.read().collect().height == n - n_symbol + 1
+
+    # Explicit predicate
+    sink.replace_where = f"symbol <> '{symbol}'"
+    sink.write(df_slv_polars.filter(pl.col("symbol") != symbol).head(1))
+    assert source.read().collect().height == 2
+    sink.purge()
+
+    # Non-finite partition values
+    sink = FileDataSink(
+        path=dirpath,
+        format="DELTA",
+        mode="OVERWRITE_PARTITIONS",
+        partition_by=["p"],
+    )
+    df = pl.DataFrame({"p": [float("nan"), 1.0, float("inf")], "v": [1, 2, 3]})
+    sink.write(df)
+    assert sink._get_replace_where(df.tail(1), sink.mode) == (
+        "p IN (CAST('Infinity' AS DOUBLE))"
+    )
+    sink.write(df.filter(pl.col("v") != 2).with_columns(v=pl.col("v") * 10))
+    df = pl.read_delta(str(dirpath)).sort("v")
+    assert df["v"].to_list() == [2, 10, 30]
+    sink.purge()
+
+    # Partitions required
+    with pytest.raises(ValueError):
+        FileDataSink(path=dirpath, mode="OVERWRITE_PARTITIONS")
+
+
 def test_table_data_sink():
     # Write as overwrite
     sink = TableDataSink(
@@ -277,6 +568,8 @@ if __name__ == "__main__":
     test_file_data_sink_delta()
     test_file_data_sink_stream()
     test_file_data_sink_polars_parquet()
+    test_file_data_sink_polars_streaming()
     test_file_data_sink_polars_delta()
+    # test_file_data_sink_polars_delta_metrics()
     test_table_data_sink()
     test_view_data_sink()
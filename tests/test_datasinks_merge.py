@@ -1,5 +1,6 @@
 import datetime
 import shutil
+import sys
 import uuid
 from pathlib import Path
 
@@ -262,6 +263,50 @@ def test_basic():
     assert "S3" not in df1["symbol"].unique().tolist()  # deleted symbol
     assert (df1["from"] == "source").sum() == 7  # 6 new + 1 updates
 
+    # Test metrics
+    metrics = sink.metrics
+    assert metrics.commits == 1
+    assert metrics.rows_inserted == 6
+    assert metrics.rows_updated == 1
+    assert metrics.rows_deleted == 3
+
+    # Cleanup
+    shutil.rmtree(path)
+
+
+def test_prune():
+    path, df = build_target()
+
+    sink = models.FileDataSink(
+        mode="MERGE",
+        path=str(path),
+        merge_cdc_options=models.DataSinkMergeCDCOptions(
+            primary_keys=["symbol", "date"],
+            delete_where="source._is_deleted = true",
+            exclude_columns=["_is_deleted"],
+            merge_target_filter="symbol != 'S9'",
+            prune_columns=["date", "symbol"],
+            prune_max_values=3,
+        ),
+    )
+
+    # Pruning predicates
+    dfs = get_basic_source()
+    filters = [str(f[1]) for f in sink.merge_cdc_options._get_prune_filters(dfs)]
+    assert filters == [
+        "Column<'(NOT (symbol = S9))'>",
+        "Column<'((date >= DATE '2024-11-01') AND (date <= DATE '2024-11-05'))'>",
+        "Column<'(symbol IN (S0, S1, S2))'>",
+    ]
+
+    # Merge source
+    sink.write(dfs)
+
+    # Test Merge
+    df1 = read(path).toPandas()
+    assert len(df1) == 9 + 6 - 3  # 9 initial + 6 new - 3 deletes
+    assert (df1["from"] == "source").sum() == 7  # 6 new + 1 updates
+
     # Cleanup
     shutil.rmtree(path)
 
@@ -435,10 +480,166 @@ def test_scd2():
     assert df1["__end_at"].count() == 4  # 3 updates + 1 delete
     assert df1.loc[where]["__end_at"].fillna(-1).tolist() == [2, 3, 4, -1]
 
+    # Each batch is committed with a single MERGE
+    history = spark.sql(f"DESCRIBE HISTORY delta.`{path}`").toPandas()
+    assert history["operation"].tolist().count("MERGE") == 2
+    assert len(history) == 3  # create + 2 merges
+
     # Cleanup
     shutil.rmtree(path)
 
 
+def test_scd2_replay():
+    path, df = build_target(write_target=False, index=1)
+
+    sink = models.FileDataSink(
+        mode="MERGE",
+        path=str(path),
+        merge_cdc_options=models.DataSinkMergeCDCOptions(
+            primary_keys=["symbol", "date"],
+            exclude_columns=["_is_deleted"],
+            delete_where="_is_deleted = true",
+            order_by="index",
+            scd_type=2,
+            start_at_column_name="start_at",
+        ),
+    )
+    sink.write(df.drop("from"))
+    sink.write(get_scd2_source())
+
+    # Replay an expired version (close=2.0) with a newer index
+    dfs = spark.createDataFrame(
+        pd.DataFrame(
+            [
+                {
+                    "date": "2024-11-03",
+                    "symbol": "S2",
+                    "close": 2.0,
+                    "open": 2.00,
+                    "index": 5,
+                    "_is_deleted": False,
+                },
+            ]
+        )
+    )
+    dfs = dfs.withColumn("date", F.col("date").cast("date"))
+    dfs = dfs.withColumn("index", F.col("index").cast(T.IntegerType()))
+    sink.write(dfs)
+
+    # Test: replayed version is inserted as the new current row
+    df1 = read(path).sort("date", "symbol", "start_at").toPandas()
+    where = (df1["symbol"] == "S2") & (df1["date"] == datetime.date(2024, 11, 3))
+    assert len(df1) == df.count() + 4
+    assert df1.loc[where]["__end_at"].fillna(-1).tolist() == [2, 3, 4, 5, -1]
+    assert df1.loc[where]["close"].tolist() == [0.0, 2.0, 3.0, 4.0, 2.0]
+
+    # Test: replaying the current version is a no-op
+    sink.write(dfs.withColumn("index", F.lit(6).cast(T.IntegerType())))
+    df2 = read(path).toPandas()
+    assert len(df2) == len(df1)
+
+    # Cleanup
+    shutil.rmtree(path)
+
+
+def test_hash_function():
+    hash_types = {
+        "XXHASH64": "bigint",
+        "MD5": "binary",
+        "NONE": None,
+    }
+
+    for hash_function, hash_type in hash_types.items():
+        # SCD Type 1
+        path, df = build_target(write_target=False)
+        sink = models.FileDataSink(
+            mode="MERGE",
+            path=str(path),
+            merge_cdc_options=models.DataSinkMergeCDCOptions(
+                primary_keys=["symbol", "date"],
+                delete_where="source._is_deleted = true",
+                exclude_columns=["_is_deleted"],
+                hash_function=hash_function,
+            ),
+        )
+        sink.write(df)
+        sink.write(get_basic_source())
+        df1 = read(path)
+        assert dict(df1.dtypes).get("__hash_keys") == hash_type
+        df1 = df1.toPandas()
+        assert len(df1) == 9 + 6 - 3  # 9 initial + 6 new - 3 deletes
+        assert (df1["from"] == "source").sum() == 7  # 6 new + 1 updates
+        shutil.rmtree(path)
+
+        # SCD Type 2
+        path, df = build_target(write_target=False, index=1)
+        sink = models.FileDataSink(
+            mode="MERGE",
+            path=str(path),
+            merge_cdc_options=models.DataSinkMergeCDCOptions(
+                primary_keys=["symbol", "date"],
+                exclude_columns=["_is_deleted"],
+                delete_where="_is_deleted = true",
+                hash_function=hash_function,
+                order_by="index",
+                scd_type=2,
+                start_at_column_name="start_at",
+            ),
+        )
+        sink.write(df.drop("from"))
+        sink.write(get_scd2_source())
+        df1 = read(path)
+        assert dict(df1.dtypes).get("__hash_cols") == hash_type
+        df1 = df1.sort("date", "symbol", "start_at").toPandas()
+        where = (df1["symbol"] == "S2") & (df1["date"] == datetime.date(2024, 11, 3))
+        assert len(df1) == df.count() + 3
+        assert df1.loc[where]["__end_at"].fillna(-1).tolist() == [2, 3, 4, -1]
+
+        # New keys are inserted
+        dfs = get_scd2_source().filter(F.col("symbol") == "S2")
+        sink.write(dfs.withColumn("symbol", F.lit("S3")))
+        df2 = read(path).filter(F.col("symbol") == "S3").toPandas()
+        assert len(df2) == 3
+        assert df2["__end_at"].isnull().sum() == 1
+        shutil.rmtree(path)
+
+
+def test_hash_parity(monkeypatch):
+    import polars as pl
+
+    data = {
+        "symbol": ["S0", "S1", None],
+        "count": [1, None, 3],
+        "close": [0.42, 1.0, None],
+        "is_open": [True, False, None],
+        "date": [datetime.date(2024, 11, 1), None, datetime.date(2024, 11, 3)],
+        "created_at": [
+            datetime.datetime(2024, 11, 1, 10, 0, 0),
+            datetime.datetime(2024, 11, 2, 10, 30, 0, 500000),
+            datetime.datetime(2024, 11, 3, 10, 30, 0, 123),
+        ],
+    }
+    columns = list(data.keys())
+
+    # Spark
+    df = spark.createDataFrame(
+        list(zip(*data.values())),
+        schema="symbol string, count int, close double, is_open boolean, date date, created_at timestamp_ntz",
+    )
+    hashes = df.select(F.sha2(F.concat_ws("~", *columns), 256).alias("h"))
+    hashes = [row.h for row in hashes.collect()]
+
+    # Polars
+    dfp = pl.DataFrame(data, schema_overrides={"count": pl.Int32})
+    options = models.DataSinkMergeCDCOptions(primary_keys=columns)
+    options._source_schema = dfp.schema
+    assert dfp.select(options._hash_polars(columns))[:, 0].to_list() == hashes
+
+    # Polars without native hash
+    monkeypatch.setitem(sys.modules, "polars_hash", None)
+    assert dfp.select(options._hash_polars(columns))[:, 0].to_list() == hashes
+
+
 def test_null_updates():
     path, _ = build_target()
 
@@ -498,6 +699,122 @@ def test_null_updates():
     shutil.rmtree(path)
 
 
+def test_polars():
+    import polars as pl
+    from deltalake import DeltaTable
+
+    def to_polars(df):
+        return pl.from_pandas(df.toPandas())
+
+    def read_polars(path):
+        return pl.read_delta(str(path))
+
+    # SCD Type 1
+    path, df = build_target(write_target=False)
+    sink = models.FileDataSink(
+        mode="MERGE",
+        path=str(path),
+        merge_cdc_options=models.DataSinkMergeCDCOptions(
+            primary_keys=["symbol", "date"],
+            delete_where="source._is_deleted = true",
+            exclude_columns=["_is_deleted"],
+            prune_columns=["date"],
+        ),
+    )
+    sink.write(to_polars(df).lazy())
+    df0 = read_polars(path)
+    assert df0.columns == ["symbol", "date", "close", "open", "from", "__hash_keys"]
+    assert len(df0) == 9
+
+    # Same hash as Spark
+    hashes = df.select(
+        F.sha2(F.concat_ws("~", "symbol", "date"), 256).alias("h")
+    ).toPandas()
+    assert sorted(df0["__hash_keys"].to_list()) == sorted(hashes["h"].tolist())
+
+    sink.write(to_polars(get_basic_source()))
+    df1 = read_polars(path)
+    assert len(df1) == 9 + 6 - 3  # 9 initial + 6 new - 3 deletes
+    assert (df1["from"] == "source").sum() == 7  # 6 new + 1 updates
+    metrics = sink.metrics
+    assert metrics.commits == 1
+    assert metrics.source_rows == 10
+    assert metrics.rows_inserted == 6
+    assert metrics.rows_updated == 1
+    assert metrics.rows_deleted == 3
+    shutil.rmtree(path)
+
+    # Ignore null updates
+    path, df = build_target(write_target=False)
+    sink = models.FileDataSink(
+        mode="MERGE",
+        path=str(path),
+        merge_cdc_options=models.DataSinkMergeCDCOptions(
+            primary_keys=["symbol", "date"],
+            exclude_columns=["_is_deleted"],
+            ignore_null_updates=True,
+        ),
+    )
+    sink.write(to_polars(df))
+    dfs = pl.DataFrame(
+        {
+            "date": [datetime.date(2024, 11, 3)],
+            "symbol": ["S2"],
+            "close": [None],
+            "open": [2.0],
+            "from": ["source"],
+        },
+        schema_overrides={"close": pl.Float64},
+    )
+    sink.write(dfs)
+    row = read_polars(path).filter(pl.col("from") == "source").row(0, named=True)
+    assert row["close"] == 0.0
+    assert row["open"] == 2.0
+    shutil.rmtree(path)
+
+    # SCD Type 2
+    path, df = build_target(write_target=False, index=1)
+    sink = models.FileDataSink(
+        mode="MERGE",
+        path=str(path),
+        merge_cdc_options=models.DataSinkMergeCDCOptions(
+            primary_keys=["symbol", "date"],
+            exclude_columns=["_is_deleted"],
+            delete_where="_is_deleted = true",
+            order_by="index",
+            scd_type=2,
+            start_at_column_name="start_at",
+        ),
+    )
+    sink.write(to_polars(df.drop("from")).with_columns(pl.col("index").cast(pl.Int32)))
+    sink.write(to_polars(get_scd2_source()))
+    df1 = read_polars(path).sort("date", "symbol", "start_at")
+    where = (pl.col("symbol") == "S2") & (pl.col("date") == datetime.date(2024, 11, 3))
+    assert len(df1) == df.count() + 3  # 3 updates | 1 delete does not add new row
+    assert df1["__end_at"].count() == 4  # 3 updates + 1 delete
+    assert df1.filter(where)["__end_at"].fill_null(-1).to_list() == [2, 3, 4, -1]
+    operations = [h["operation"] for h in DeltaTable(str(path)).history()]
+    assert operations.count("MERGE") == 2  # single commit per batch
+
+    # Replayed expired version is inserted as the new current row
+    dfs = pl.DataFrame(
+        {
+            "date": [datetime.date(2024, 11, 3)],
+            "symbol": ["S2"],
+            "close": [2.0],
+            "open": [2.0],
+            "index": [5],
+            "_is_deleted": [False],
+        },
+        schema_overrides={"index": pl.Int32},
+    )
+    sink.write(dfs)
+    df1 = read_polars(path).sort("date", "symbol", "start_at")
+    assert df1.filter(where)["__end_at"].fill_null(-1).to_list() == [2, 3, 4, 5, -1]
+    assert df1.filter(where)["close"].to_list() == [0.0, 2.0, 3.0, 4.0, 2.0]
+    shutil.rmtree(path)
+
+
 def test_stream():
     path, _ = build_target()
 
@@ -614,6 +931,8 @@ if __name__ == "__main__":
     # test_outdated()
     test_delete_non_existent()
     # test_scd2()
+    # test_scd2_replay()
+    # test_hash_parity()
     # test_null_updates()
     # test_stream()
     # test_dlt_kwargs()
@@ -1,4 +1,5 @@
 import pandas as pd
+import pytest
 
 from laktory._testing import Paths
 from laktory._testing import spark
@@ -242,6 +243,350 @@ def test_file_data_source_polars():
     assert df.height == 20
 
 
+def test_file_data_source_polars_incremental():
+    import shutil
+
+    import polars as pl
+
+    from laktory import models
+
+    root = paths.tmp / "file_data_source_polars_incremental"
+    if root.exists():
+        shutil.rmtree(root)
+    landing = root / "landing"
+    landing.mkdir(parents=True)
+
+    def add_file(i):
+        pl.DataFrame({"id": [i, i], "value": [1.0, 2.0]}).write_ndjson(
+            landing / f"{i:03d}.json"
+        )
+
+    node = models.PipelineNode(
+        name="brz",
+        dataframe_backend="POLARS",
+        root_path=root / "brz",
+        source=models.FileDataSource(
+            path=landing,
+            format="JSONL",
+            as_stream=True,
+            max_files_per_trigger=2,
+        ),
+        sinks=[
+            models.FileDataSink(path=root / "brz.delta", format="DELTA", mode="APPEND")
+        ],
+    )
+    source = node.source
+    sink = node.sinks[0]
+
+    def read():
+        return pl.read_delta(str(sink.path)).sort("id")["id"].to_list()
+
+    # First run limited to 2 files
+    for i in range(3):
+        add_file(i)
+    node.execute()
+    assert read() == [0, 0, 1, 1]
+    assert (sink._checkpoint_location / "sources" / "files.json").exists()
+
+    # Only new files are read
+    node.execute()
+    assert read() == [0, 0, 1, 1, 2, 2]
+
+    # No new files
+    node.execute()
+    assert node.output_df.collect().height == 0
+    assert read() == [0, 0, 1, 1, 2, 2]
+
+    # Files are not committed if the sink write fails
+    add_file(3)
+    sink.mode = "ERROR"
+    try:
+        node.execute()
+    except Exception:
+        pass
+    assert source._read_files_checkpoint().keys() == {
+        str(landing / f"{i:03d}.json") for i in range(3)
+    }
+    sink.mode = "APPEND"
+    node.execute()
+    assert read() == [0, 0, 1, 1, 2, 2, 3, 3]
+
+    # Cleanup
+    shutil.rmtree(root)
+
+
+def test_file_data_source_polars_incremental_transformer():
+    import shutil
+
+    import polars as pl
+
+    from laktory import models
+
+    root = paths.tmp / "file_data_source_polars_incremental_transformer"
+    if root.exists():
+        shutil.rmtree(root)
+    landing = root / "landing"
+    landing.mkdir(parents=True)
+    pl.DataFrame({"id": [0, 1], "value": [1.0, 2.0]}).write_ndjson(landing / "000.json")
+
+    # Incremental read is only supported for the node source
+    node = models.PipelineNode(
+        name="slv",
+        dataframe_backend="POLARS",
+        root_path=root / "slv",
+        source=models.FileDataSource(path=landing, format="JSONL"),
+        transformer={
+            "nodes": [
+                {
+                    "func_name": "join",
+                    "func_kwargs": {
+                        "other": {
+                            "path": str(landing),
+                            "format": "JSONL",
+                            "as_stream": True,
+                        },
+                        "on": "id",
+                    },
+                }
+            ]
+        },
+        sinks=[
+            models.FileDataSink(path=root / "slv.delta", format="DELTA", mode="APPEND")
+        ],
+    )
+    with pytest.raises(ValueError, match="only supported for the source"):
+        node.execute()
+
+    # Cleanup
+    shutil.rmtree(root)
+
+
+def test_file_data_source_polars_delta_incremental():
+    import shutil
+
+    import polars as pl
+    from deltalake import DeltaTable
+
+    from laktory import models
+
+    root = paths.tmp / "file_data_source_polars_delta_incremental"
+    if root.exists():
+        shutil.rmtree(root)
+    table_path = str(root / "source.delta")
+
+    pl.DataFrame({"id": [0, 1], "value": [1.0, 2.0]}).write_delta(
+        table_path,
+        delta_write_options={"configuration": {"delta.enableChangeDataFeed": "true"}},
+    )
+
+    node = models.PipelineNode(
+        name="slv",
+        dataframe_backend="POLARS",
+        root_path=root / "slv",
+        source=models.FileDataSource(
+            path=table_path,
+            format="DELTA",
+            incremental=True,
+        ),
+        sinks=[
+            models.FileDataSink(
+                path=root / "slv.delta",
+                format="DELTA",
+                mode="MERGE",
+                merge_cdc_options={
+                    "primary_keys": ["id"],
+                    "order_by": "_commit_version",
+                    "delete_where": "_change_type = 'delete'",
+                },
+            )
+        ],
+    )
+    source = node.source
+
+    def read_sink():
+        return pl.read_delta(str(root / "slv.delta")).sort("id")
+
+    def read():
+        return node.output_df.collect().sort("_commit_version", "id")
+
+    # First run reads the full table
+    node.execute()
+    df = read()
+    assert df["id"].to_list() == [0, 1]
+    assert df["_change_type"].to_list() == ["insert", "insert"]
+    assert source._read_checkpoint("delta.json") == {"version": 0}
+
+    # Only changes are read
+    pl.DataFrame({"id": [2], "value": [3.0]}).write_delta(table_path, mode="append")
+    DeltaTable(table_path).delete("id = 0")
+    node.execute()
+    df = read()
+    assert df["id"].to_list() == [2, 0]
+    assert df["_change_type"].to_list() == ["insert", "delete"]
+    assert source._read_checkpoint("delta.json") == {"version": 2}
+
+    assert read_sink()["id"].to_list() == [1, 2]
+
+    # No changes
+    node.execute()
+    assert read().height == 0
+    assert read_sink()["id"].to_list() == [1, 2]
+
+    # Full read after vacuum
+    DeltaTable(table_path).vacuum(
+        retention_hours=0, enforce_retention_duration=False, dry_run=False
+    )
+    node.execute()
+    df = read()
+    assert df["id"].to_list() == [1, 2]
+    assert df["_change_type"].to_list() == ["insert"] * 2
+    assert read_sink()["id"].to_list() == [1, 2]
+
+    # Cleanup
+    shutil.rmtree(root)
+
+
+def test_file_data_source_incremental_validation():
+    from laktory import models
+
+    # Incremental read is not supported as stream
+    with pytest.raises(ValueError, match="not supported as stream"):
+        FileDataSource(
+            path="./source.delta", format="DELTA", incremental=True, as_stream=True
+        )
+
+    # Full read fallback would duplicate rows of an append sink
+    with pytest.raises(ValueError, match="'APPEND' sink mode"):
+        models.PipelineNode(
+            name="slv",
+            source=FileDataSource(
+                path="./source.delta", format="DELTA", incremental=True
+            ),
+            sinks=[
+                models.FileDataSink(path="./slv.delta", format="DELTA", mode="APPEND")
+            ],
+        )
+
+
+def test_file_data_source_polars_hive():
+    import shutil
+
+    import polars as pl
+
+    root = paths.tmp / "file_data_source_polars_hive"
+    if root.exists():
+        shutil.rmtree(root)
+
+    df = pl.DataFrame(
+        {
+            "value": [1.0, 2.0, 3.0, 4.0],
+            "year": [2023, 2023, 2024, 2024],
+            "symbol": ["AAPL", "GOOGL", "AAPL", "GOOGL"],
+        }
+    )
+    df.write_parquet(root / "parquet", partition_by=["year", "symbol"])
+    for (year, symbol), _df in df.group_by(["year", "symbol"]):
+        dirpath = root / "csv" / f"year={year}" / f"symbol={symbol}"
+        dirpath.mkdir(parents=True)
+        _df.drop("year", "symbol").write_csv(dirpath / "data.csv")
+    (root / "csv" / "_SUCCESS").touch()
+
+    # Parquet: partitions pruned by Polars scan
+    source = FileDataSource(
+        path=root / "parquet",
+        format="PARQUET",
+        dataframe_backend="POLARS",
+        filter="symbol = 'AAPL'",
+        selects=["value", "year"],
+    )
+    df0 = source.read()
+    plan = df0.explain()
+    assert "symbol=AAPL" in plan and "symbol=GOOGL" not in plan
+    df0 = df0.collect()
+    assert df0.columns == ["value", "year"]
+    assert df0["value"].to_list() == [1.0, 3.0]
+
+    # CSV: partitions pruned by source
+    source = FileDataSource(
+        path=root / "csv",
+        format="CSV",
+        dataframe_backend="POLARS",
+        filter="year = 2024",
+    )
+    df1 = source.read()
+    plan = df1.explain()
+    assert "year=2024" in plan and "year=2023" not in plan
+    df1 = df1.collect().sort("value")
+    assert df1.schema["year"] == pl.Int64
+    assert df1["symbol"].to_list() == ["AAPL", "GOOGL"]
+
+    # Cleanup
+    shutil.rmtree(root)
+
+
+def test_file_data_source_polars_incremental_hive():
+    import shutil
+
+    import polars as pl
+
+    from laktory import models
+
+    root = paths.tmp / "file_data_source_polars_incremental_hive"
+    if root.exists():
+        shutil.rmtree(root)
+
+    def add_file(fmt, symbol, x):
+        dirpath = root / fmt / f"symbol={symbol}"
+        dirpath.mkdir(parents=True, exist_ok=True)
+        df = pl.DataFrame({"x": [x]})
+        if fmt == "parquet":
+            df.write_parquet(dirpath / f"{x}.parquet")
+        else:
+            df.write_csv(dirpath / f"{x}.csv")
+
+    for fmt in ["parquet", "csv"]:
+        add_file(fmt, "A", 0)
+        add_file(fmt, "B", 1)
+        node = models.PipelineNode(
+            name=f"brz_{fmt}",
+            dataframe_backend="POLARS",
+            root_path=root / f"brz_{fmt}",
+            source=models.FileDataSource(
+                path=root / fmt,
+                format=fmt.upper(),
+                as_stream=True,
+            ),
+            sinks=[
+                models.FileDataSink(
+                    path=root / f"brz_{fmt}.delta", format="DELTA", mode="APPEND"
+                )
+            ],
+        )
+
+        # Same columns as a static read
+        static = models.FileDataSource(
+            path=root / fmt, format=fmt.upper(), dataframe_backend="POLARS"
+        )
+        columns = static.read().collect_schema().names()
+        assert columns == ["x", "symbol"]
+        node.execute()
+        assert node.output_df.collect_schema().names() == columns
+
+        # Only new files are read, with their partition
+        add_file(fmt, "C", 2)
+        node.execute()
+        df = node.output_df.collect()
+        assert df.columns == columns
+        assert df.rows() == [(2, "C")]
+
+        # No new files
+        node.execute()
+        assert node.output_df.collect_schema().names() == columns
+
+    # Cleanup
+    shutil.rmtree(root)
+
+
 def test_memory_data_source(df0=df0):
     source = MemoryDataSource(
         df=df0,
@@ -303,6 +648,58 @@ def test_memory_data_source_from_dict():
     assert df.collect().to_pandas().equals(df_ref)
 
 
+def test_memory_data_source_arrow(monkeypatch):
+    import pyarrow as pa
+    import pyspark
+    from pyspark.sql import SparkSession
+
+    df_ref = pd.DataFrame({"x": [1, 2, 3], "y": ["a", "b", "c"]})
+    table = pa.Table.from_pandas(df_ref, preserve_index=False)
+
+    # Polars
+    for df in [table, table.to_batches()[0], df_ref]:
+        source = MemoryDataSource(df=df, dataframe_backend="POLARS")
+        df = source.read()
+        assert df.collect().to_pandas().equals(df_ref)
+
+    # Spark conversions with Arrow. Spark 4 natively converts pyarrow Tables.
+    is_spark3 = int(pyspark.__version__.split(".")[0]) < 4
+    arrow_calls = []
+    _create = SparkSession._create_from_pandas_with_arrow
+
+    def create_from_pandas_with_arrow(self, *args, **kwargs):
+        df = _create(self, *args, **kwargs)
+        arrow_calls.append(args[0])
+        return df
+
+    monkeypatch.setattr(
+        SparkSession, "_create_from_pandas_with_arrow", create_from_pandas_with_arrow
+    )
+
+    # Spark
+    conf = "spark.sql.execution.arrow.pyspark.enabled"
+    arrow_enabled = spark.conf.get(conf, None)
+    for df in [table, df_ref]:
+        source = MemoryDataSource(df=df, dataframe_backend="SPARK")
+        df = source.read(spark)
+        assert df.toPandas().equals(df_ref)
+    assert spark.conf.get(conf, None) == arrow_enabled
+    assert len(arrow_calls) == (2 if is_spark3 else 1)
+
+    # Spark - chunked conversion
+    arrow_calls.clear()
+    source = MemoryDataSource(df=table, dataframe_backend="SPARK", spark_chunk_size=1)
+    df = source.read(spark)
+    assert df.schema.simpleString() == "struct<x:bigint,y:string>"
+    assert df.toPandas().sort_values("x").reset_index(drop=True).equals(df_ref)
+    if is_spark3:
+        assert [len(pdf) for pdf in arrow_calls] == [1, 1, 1]
+
+    # Invalid type
+    with pytest.raises(ValueError):
+        MemoryDataSource(df=[1, 2, 3])
+
+
 def test_table_data_source():
     source = TableDataSource(
         catalog_name="dev",
@@ -4,6 +4,7 @@ from pyspark.sql import functions as F
 from laktory import models
 from laktory._testing import Paths
 from laktory._testing import df_slv as df
+from laktory._testing import df_slv_polars
 from laktory.exceptions import DataQualityCheckFailedError
 
 paths = Paths(__file__)
@@ -123,6 +124,59 @@ def test_expectations_empty():
     assert dqe.quarantine_filter is None
 
 
+def test_expectations_batch():
+    def get_expectations():
+        return [
+            models.DataQualityExpectation(
+                name="price less than 300", expr="F.col('close') < 300"
+            ),
+            models.DataQualityExpectation(
+                name="price higher than 10",
+                expr="close > 127",
+                tolerance={"rel": 0.05},
+            ),
+            models.DataQualityExpectation(
+                name="price less than 900", expr="F.col('close') < 900"
+            ),
+            models.DataQualityExpectation(
+                name="rows count", expr="COUNT(*) > 50", type="AGGREGATE"
+            ),
+        ]
+
+    # Spark
+    dqes = get_expectations()
+    checks = models.DataQualityExpectation.run_checks(dqes, df)
+    assert [c.rows_count for c in checks] == [80, 80, 80, 80]
+    assert [c.fails_count for c in checks] == [20, 3, 0, None]
+    assert [c.status for c in checks] == ["FAIL", "PASS", "PASS", "PASS"]
+    assert [e.check for e in dqes] == checks
+
+    # Same results as individual checks
+    for e, c in zip(get_expectations(), checks):
+        assert e.run_check(df) == c
+
+    # Empty
+    checks = models.DataQualityExpectation.run_checks(
+        get_expectations()[:3], df.filter("close < 0")
+    )
+    assert [c.rows_count for c in checks] == [0, 0, 0]
+    assert [c.status for c in checks] == ["PASS", "PASS", "PASS"]
+
+    # Polars
+    dqes = [
+        models.DataQualityExpectation(name="price less than 300", expr="close < 300"),
+        models.DataQualityExpectation(
+            name="price higher than 10",
+            expr="pl.col('close') > 127",
+            tolerance={"rel": 0.05},
+        ),
+    ]
+    checks = models.DataQualityExpectation.run_checks(dqes, df_slv_polars.lazy())
+    assert [c.rows_count for c in checks] == [80, 80]
+    assert [c.fails_count for c in checks] == [20, 3]
+    assert [c.status for c in checks] == ["FAIL", "PASS"]
+
+
 def test_expectations_exceptions_warnings():
     # No Failure
     dqe = models.DataQualityExpectation(
@@ -156,4 +210,5 @@ if __name__ == "__main__":
     test_expectations_rel()
     test_expectations_agg()
     test_expectations_empty()
+    test_expectations_batch()
     test_expectations_exceptions_warnings()
@@ -109,6 +109,49 @@ def test_quarantine():
     assert q["close"].min() >= 330
 
 
+def test_quarantine_sinks_concurrent():
+    node_path = (
+        testdir_path / "tmp" / "test_quarantine_sinks_concurrent" / str(uuid.uuid4())
+    )
+
+    node = get_node()
+    node.max_sink_workers = 2
+    node.expectations = [
+        models.DataQualityExpectation(
+            name="max price",
+            expr="close < 330",
+            action="QUARANTINE",
+        )
+    ]
+    node.sinks = [
+        models.FileDataSink(
+            path=str(node_path / "output"),
+            format="PARQUET",
+            mode="OVERWRITE",
+        ),
+        models.FileDataSink(
+            path=str(node_path / "quarantine"),
+            format="PARQUET",
+            mode="OVERWRITE",
+            is_quarantine=True,
+        ),
+    ]
+    node.execute(spark=spark)
+
+    # Stage DataFrame computed once for both sinks and released
+    assert node._cached_df is None
+    o = node.sinks[0].read(spark=spark).toPandas()
+    q = node.sinks[1].read(spark=spark).toPandas()
+    assert len(o) == 72
+    assert len(q) == 8
+    assert o["close"].max() < 330
+    assert q["close"].min() >= 330
+    assert len(node.sinks_metrics) == 2
+
+    # Cleanup
+    shutil.rmtree(node_path)
+
+
 def test_fail():
     node = get_node()
     node.expectations = [
@@ -265,6 +308,84 @@ def test_streaming_multi():
     # #     node.execute(spark=spark)
 
 
+def test_streaming_fused():
+    node_path = (
+        testdir_path / "tmp" / "test_pipeline_node_expectations" / str(uuid.uuid4())
+    )
+
+    # Create Stream Source
+    source, source_path = get_source(node_path)
+    source.filter("index<40").write.format("delta").mode("OVERWRITE").save(source_path)
+
+    # Get Node
+    node = get_node()
+    node.root_path = node_path / "root"
+    node.fused_streaming = True
+    node.max_sink_workers = 2
+    node.source = models.FileDataSource(
+        path=source_path,
+        format="DELTA",
+        as_stream=True,
+    )
+    node.expectations = [
+        models.DataQualityExpectation(
+            name="max price",
+            expr="close < 330",
+            action="QUARANTINE",
+        ),
+        models.DataQualityExpectation(
+            name="not amazon",
+            expr="symbol != 'AMZN'",
+            action="DROP",
+        ),
+    ]
+    node.sinks = [
+        models.FileDataSink(
+            path=str(node_path / "slv_stock_prices"),
+            format="DELTA",
+            mode="APPEND",
+        ),
+        models.FileDataSink(
+            path=str(node_path / "slv_stock_prices_quarantine"),
+            format="DELTA",
+            mode="APPEND",
+            is_quarantine=True,
+        ),
+    ]
+
+    # Execute
+    node.execute(spark=spark)
+    assert node.checks[0].rows_count == 40
+    assert node.checks[1].rows_count == 40
+    assert node.checks[1].fails_count == 20
+
+    # Update source
+    source.filter("index>=40").write.format("delta").mode("append").save(source_path)
+    node.execute(spark=spark)
+    assert node.checks[0].rows_count == 40
+    assert node.checks[0].fails_count == 8
+
+    # Test
+    df = source.select(
+        F.col("data.symbol").alias("symbol"), F.col("data.close").alias("close")
+    )
+    o = spark.read.format("DELTA").load(node.output_sinks[0].path)
+    q = spark.read.format("DELTA").load(node.quarantine_sinks[0].path)
+    assert o.count() == df.filter("close < 330 AND symbol != 'AMZN'").count()
+    assert q.count() == df.filter("close >= 330").count()
+    assert (node_path / "root" / "checkpoints" / "node").exists()
+
+    # Full refresh re-processes the complete source
+    node.execute(spark=spark, full_refresh=True)
+    o = spark.read.format("DELTA").load(node.output_sinks[0].path)
+    q = spark.read.format("DELTA").load(node.quarantine_sinks[0].path)
+    assert o.count() == df.filter("close < 330 AND symbol != 'AMZN'").count()
+    assert q.count() == df.filter("close >= 330").count()
+
+    # Cleanup
+    shutil.rmtree(node_path)
+
+
 def test_expectations_invalid():
     with pytest.raises(DataQualityExpectationsNotSupported):
         models.PipelineNode(
@@ -174,7 +174,10 @@ def test_pipeline_dlt():
         "dataframe_backend": None,
         "drops": None,
         "filter": None,
+        "incremental": False,
         "limit": None,
+        "max_bytes_per_trigger": None,
+        "max_files_per_trigger": None,
         "renames": None,
         "sample": None,
         "selects": None,
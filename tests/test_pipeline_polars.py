@@ -1,9 +1,12 @@
 import io
 import shutil
+import threading
 import uuid
 from pathlib import Path
 
+import networkx as nx
 import pandas as pd
+import pytest
 
 from laktory import models
 from laktory._testing import Paths
@@ -15,8 +18,9 @@ OPEN_FIGURES = False
 testdir_path = Path(__file__).parent
 
 
-def get_pl(clean_path=False):
-    pl_path = testdir_path / "tmp" / "test_pipeline_polars" / str(uuid.uuid4())
+def get_pl(clean_path=False, pl_path=None):
+    if pl_path is None:
+        pl_path = testdir_path / "tmp" / "test_pipeline_polars" / str(uuid.uuid4())
 
     with open(paths.data / "pl-polars-local.yaml", "r") as fp:
         data = fp.read()
@@ -52,6 +56,41 @@ def test_df_backend():
             assert s.df_backend == "POLARS"
 
 
+def test_dag_cache():
+    pl, _ = get_pl()
+
+    # Cached
+    dag = pl.dag
+    assert pl.dag is dag
+    assert pl.nodes_dict is pl.nodes_dict
+    assert pl.sorted_node_names == list(nx.topological_sort(dag))
+    assert [n.name for n in pl.sorted_nodes] == pl.sorted_node_names
+
+    # Invalidated when a node is added
+    node = models.PipelineNode(
+        name="gld_stock_prices_copy",
+        source={"node_name": "gld_stock_prices"},
+        dataframe_backend="POLARS",
+    )
+    pl.nodes = pl.nodes + [node]
+    assert pl.dag is not dag
+    assert len(pl.dag.nodes) == 6
+    assert pl.sorted_node_names[-1] == "gld_stock_prices_copy"
+    assert "gld_stock_prices_copy" in pl.nodes_dict
+    dag = pl.dag
+
+    # Invalidated when a node is renamed
+    pl.nodes[-1].name = "gld_stock_prices_2"
+    assert pl.dag is not dag
+    assert "gld_stock_prices_2" in pl.nodes_dict
+    assert "gld_stock_prices_copy" not in pl.dag.nodes
+
+    # Invalidated when nodes are removed
+    pl.nodes = pl.nodes[:-1]
+    assert len(pl.dag.nodes) == 5
+    assert "gld_stock_prices_2" not in pl.nodes_dict
+
+
 def test_execute():
     pl, pl_path = get_pl(clean_path=True)
 
@@ -99,6 +138,206 @@ def test_execute():
     shutil.rmtree(pl_path)
 
 
+def test_execute_concurrent():
+    pl, pl_path = get_pl(clean_path=True)
+
+    # Run
+    results = pl.execute(max_workers=4)
+
+    # Test
+    assert list(results.keys()) == pl.sorted_node_names
+    assert [r.status for r in results.values()] == ["SUCCEEDED"] * 5
+    df = (
+        pl.nodes_dict["gld_stock_prices"]
+        .output_df.collect()
+        .to_pandas()
+        .round(0)
+        .sort_values("symbol")
+        .reset_index(drop=True)
+    )
+    assert df.equals(gld_target)
+
+    # Failure
+    pl, _ = get_pl()
+    pl.nodes_dict["brz_stock_meta"].source.path = str(pl_path / "missing.parquet")
+    with pytest.raises(Exception):
+        pl.execute(max_workers=4)
+    results = pl.node_results
+    assert results["brz_stock_meta"].status == "FAILED"
+    assert results["brz_stock_meta"].error is not None
+    assert results["slv_stock_meta"].status == "CANCELLED"
+    assert results["gld_stock_prices"].status == "CANCELLED"
+
+    # Cleanup
+    shutil.rmtree(pl_path)
+
+
+def test_execute_collect_all():
+    pl, pl_path = get_pl(clean_path=True)
+    pl.cache_policy = "AUTO"
+
+    # Run
+    results = pl.execute(collect_all=True)
+
+    # Test
+    assert [r.status for r in results.values()] == ["SUCCEEDED"] * 5
+    assert "CACHE" in pl.nodes_dict["brz_stock_prices"].stage_df.explain()
+    df = pl.nodes_dict["brz_stock_prices"].primary_sink.read().collect()
+    assert df.height == 80
+    metrics = results["brz_stock_prices"].sinks_metrics[0]
+    assert metrics.source_rows == 80
+    assert metrics.rows_inserted == 80
+    df = pl.nodes_dict["slv_stock_prices"].primary_sink.read().collect()
+    assert df.height == 52
+    df = (
+        pl.nodes_dict["gld_stock_prices"]
+        .primary_sink.read()
+        .collect()
+        .to_pandas()
+        .round(0)
+        .sort_values("symbol")
+        .reset_index(drop=True)
+    )
+    assert df.equals(gld_target)
+
+    # Cleanup
+    shutil.rmtree(pl_path)
+
+
+def test_execute_read_cache():
+    pl, pl_path = get_pl(clean_path=True)
+    pl.execute()
+    assert pl._read_cache is None
+
+    # Upstream node read from sink on each read outside of a run
+    pl, _ = get_pl(pl_path=pl_path)
+    source = pl.nodes_dict["gld_stock_prices"].source
+    assert source.read() is not source.read()
+
+    # Upstream node read once during a run
+    pl._read_cache = {}
+    pl._read_cache_lock = threading.Lock()
+    pl._read_cache_key_locks = {}
+    df = source.read()
+    assert source.read() is df
+    assert list(pl._read_cache.keys()) == [
+        ("slv_stock_prices", False, "POLARS", None, None)
+    ]
+
+    # Distinct keys are read concurrently
+    barrier = threading.Barrier(2, timeout=10)
+
+    def read(key):
+        return pl._cached_read(key, lambda: barrier.wait())
+
+    threads = [threading.Thread(target=read, args=((k,),)) for k in ["a", "b"]]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert not barrier.broken
+    assert pl._read_cache[("a",)] in [0, 1]
+
+    # Cleanup
+    shutil.rmtree(pl_path)
+
+
+def test_execute_skip_unchanged():
+    pl, pl_path = get_pl(clean_path=True)
+    pl.root_path = pl_path
+
+    # First run
+    results = pl.execute(skip_unchanged=True)
+    assert [r.status for r in results.values()] == ["SUCCEEDED"] * 5
+    assert pl.run_state_path.exists()
+    assert len(pl.read_run_state().nodes) == 5
+
+    # Second run
+    pl, _ = get_pl(pl_path=pl_path)
+    pl.root_path = pl_path
+    results = pl.execute(skip_unchanged=True)
+    assert [r.status for r in results.values()] == ["SKIPPED"] * 5
+
+    # Updated node configuration
+    pl, _ = get_pl(pl_path=pl_path)
+    pl.root_path = pl_path
+    node = pl.nodes_dict["slv_stock_meta"]
+    node.source.selects = ["symbol2", "currency", "first_traded"]
+    results = pl.execute(skip_unchanged=True)
+    assert {k: r.status for k, r in results.items()} == {
+        "brz_stock_prices": "SKIPPED",
+        "brz_stock_meta": "SKIPPED",
+        "slv_stock_meta": "SUCCEEDED",
+        "slv_stock_prices": "SUCCEEDED",
+        "gld_stock_prices": "SUCCEEDED",
+    }
+    df = (
+        pl.nodes_dict["gld_stock_prices"]
+        .output_df.collect()
+        .to_pandas()
+        .round(0)
+        .sort_values("symbol")
+        .reset_index(drop=True)
+    )
+    assert df.equals(gld_target)
+
+    # Cleanup
+    shutil.rmtree(pl_path)
+
+
+def test_select_nodes():
+    pl, _ = get_pl()
+
+    assert pl.select_nodes("slv_stock_prices") == ["slv_stock_prices"]
+    assert pl.select_nodes("slv_stock_prices+") == [
+        "slv_stock_prices",
+        "gld_stock_prices",
+    ]
+    assert pl.select_nodes("+slv_stock_prices") == [
+        "brz_stock_prices",
+        "brz_stock_meta",
+        "slv_stock_meta",
+        "slv_stock_prices",
+    ]
+    assert pl.select_nodes(["+slv_stock_meta", "gld_stock_prices"]) == [
+        "brz_stock_meta",
+        "slv_stock_meta",
+        "gld_stock_prices",
+    ]
+    assert pl.select_nodes("brz_stock_meta+, brz_stock_prices") == pl.sorted_node_names
+    with pytest.raises(ValueError):
+        pl.select_nodes("slv_stock_volumes+")
+
+
+def test_execute_select():
+    pl, pl_path = get_pl(clean_path=True)
+    pl.execute()
+
+    # Downstream nodes with upstream nodes read from sinks
+    pl, _ = get_pl(pl_path=pl_path)
+    results = pl.execute(select="slv_stock_prices+")
+    assert list(results.keys()) == ["slv_stock_prices", "gld_stock_prices"]
+    assert pl.nodes_dict["brz_stock_prices"].output_df is None
+    assert pl.nodes_dict["slv_stock_meta"].output_df is None
+    df = (
+        pl.nodes_dict["gld_stock_prices"]
+        .output_df.collect()
+        .to_pandas()
+        .round(0)
+        .sort_values("symbol")
+        .reset_index(drop=True)
+    )
+    assert df.equals(gld_target)
+
+    # Upstream nodes
+    pl, _ = get_pl(pl_path=pl_path)
+    results = pl.execute(select="+slv_stock_meta", max_workers=2)
+    assert list(results.keys()) == ["brz_stock_meta", "slv_stock_meta"]
+
+    # Cleanup
+    shutil.rmtree(pl_path)
+
+
 def test_sql_join():
     # Get Pipeline
     pl, pl_path = get_pl(clean_path=True)
@@ -141,5 +380,11 @@ def test_sql_join():
 
 if __name__ == "__main__":
     test_df_backend()
+    test_dag_cache()
     test_execute()
+    test_execute_concurrent()
+    test_execute_collect_all()
+    test_execute_skip_unchanged()
+    test_select_nodes()
+    test_execute_select()
     test_sql_join()
@@ -314,6 +314,98 @@ def test_sql_join():
     ]
 
 
+def test_cache_policy():
+    pl_path = testdir_path / "tmp" / "test_pipeline_spark" / str(uuid.uuid4())
+
+    pl = models.Pipeline(
+        name="pl-cache",
+        cache_policy="AUTO",
+        root_path=pl_path / "root",
+        nodes=[
+            {
+                "name": "slv",
+                "source": {"table_name": "brz", "mock_df": df_brz},
+                "transformer": {
+                    "nodes": [
+                        {
+                            "with_columns": [
+                                {"name": "symbol", "expr": "data.symbol"},
+                                {"name": "close", "expr": "data.close"},
+                            ]
+                        }
+                    ]
+                },
+                "expectations": [
+                    {"name": "max price", "expr": "close < 330", "action": "DROP"}
+                ],
+                "sinks": [
+                    {
+                        "path": str(pl_path / "slv"),
+                        "format": "PARQUET",
+                        "mode": "OVERWRITE",
+                    }
+                ],
+            },
+            {"name": "gld1", "source": {"node_name": "slv"}},
+            {"name": "gld2", "source": {"node_name": "slv"}, "cache_policy": "NONE"},
+        ],
+    )
+    slv = pl.nodes_dict["slv"]
+    gld2 = pl.nodes_dict["gld2"]
+
+    # Consumers: expectations, sink and 2 downstream nodes
+    assert slv.downstream_reads_count == 2
+    assert slv._stage_consumers_count(write_sinks=True) == 4
+    assert gld2._cache_policy == "NONE"
+
+    # Cached until downstream nodes are executed
+    slv.execute(spark=spark)
+    assert slv.stage_df.is_cached
+    assert slv._cached_df is not None
+
+    # Released once downstream nodes are executed
+    pl.execute(spark=spark)
+    assert slv._cached_df is None
+    assert not slv.stage_df.is_cached
+    assert pl.nodes_dict["gld1"].output_df.count() == 72
+    assert spark.read.parquet(str(pl_path / "slv")).count() == 72
+
+    # Cleanup
+    shutil.rmtree(pl_path)
+
+
+def test_cache_policy_delta():
+    pl_path = testdir_path / "tmp" / "test_pipeline_spark" / str(uuid.uuid4())
+
+    pl = models.Pipeline(
+        name="pl-cache-delta",
+        cache_policy="DELTA",
+        root_path=pl_path / "root",
+        nodes=[
+            {"name": "slv", "source": {"table_name": "brz", "mock_df": df_brz}},
+            {"name": "gld1", "source": {"node_name": "slv"}},
+            {"name": "gld2", "source": {"node_name": "slv"}},
+        ],
+    )
+    slv = pl.nodes_dict["slv"]
+
+    # Delta cache table deleted once released
+    slv.execute(spark=spark)
+    assert slv._cached_df is not None
+    assert slv._cache_location.exists()
+    slv.release_cache()
+    assert slv._cached_df is None
+    assert not slv._cache_location.exists()
+
+    # Released by the pipeline once downstream nodes are executed
+    pl.execute(spark=spark)
+    assert slv._cached_df is None
+    assert not slv._cache_location.exists()
+
+    # Cleanup
+    shutil.rmtree(pl_path)
+
+
 if __name__ == "__main__":
     test_dag()
     test_children()
@@ -321,3 +413,5 @@ if __name__ == "__main__":
     test_execute()
     test_execute_node()
     test_sql_join()
+    test_cache_policy()
+    test_cache_policy_delta()
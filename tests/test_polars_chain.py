@@ -311,6 +311,84 @@ def test_nested(df0=df0):
     ]
 
 
+def test_fusion(df0=df0):
+    sc = models.PolarsChain(
+        nodes=[
+            {"with_column": {"name": "y", "type": "double", "expr": "pl.col('x') + 1"}},
+            {"with_column": {"name": "z", "type": "double", "expr": "pl.col('a') + 1"}},
+            {
+                "with_columns": [
+                    {"name": "y2", "type": "double", "expr": "pl.col('y') * 2"},
+                    {"name": "w", "type": "double", "expr": "pl.col('b') + 1"},
+                ]
+            },
+            {"func_name": "drop", "func_args": ["a"]},
+            {"with_column": {"name": "v", "type": "double", "expr": "pl.col('c')"}},
+        ]
+    )
+
+    # Fused nodes and projections
+    nodes = sc.fused_nodes
+    assert len(nodes) == 3
+    assert [[c.name for c in b] for b in nodes[0].column_batches] == [
+        ["y", "z"],
+        ["y2", "w"],
+    ]
+    assert sc.summary == (
+        "chain(with_columns(y, z) -> with_columns(y2, w) -> drop() -> with_columns(v))"
+    )
+
+    # Execute Chain
+    df = sc.execute(df0)
+
+    # Test
+    assert df.columns == [
+        "x",
+        "b",
+        "c",
+        "n",
+        "pi",
+        "p",
+        "word",
+        "y",
+        "z",
+        "y2",
+        "w",
+        "v",
+    ]
+    assert df["y2"].to_list() == [4.0, 6.0, 8.0]
+    cols = ["x", "a", "b", "c", "n", "pi", "p", "word"]
+    assert sc.columns == [
+        cols,
+        cols + ["y"],
+        cols + ["y", "z"],
+        cols + ["y", "z", "y2", "w"],
+        df.columns[:-1],
+    ]
+    assert sc.fused_columns == [sc.columns[0], sc.columns[3], sc.columns[4]]
+
+    # Fused nodes keep the chain as parent
+    assert nodes[0].parent is sc
+
+    # Dtype selectors can't be resolved and start a new projection
+    sc = models.PolarsChain(
+        nodes=[
+            {"with_column": {"name": "y", "type": "double", "expr": "pl.col('x')"}},
+            {
+                "with_column": {
+                    "name": "m",
+                    "type": "double",
+                    "expr": "pl.max_horizontal(pl.col(pl.Float64))",
+                }
+            },
+        ]
+    )
+    assert [[c.name for c in b] for b in sc.fused_nodes[0].column_batches] == [
+        ["y"],
+        ["m"],
+    ]
+
+
 # TODO: Re-enable when coalesce is ready
 def atest_exceptions():
     return
@@ -356,4 +434,5 @@ if __name__ == "__main__":
     test_column()
     test_udfs()
     test_nested()
+    test_fusion()
     # atest_exceptions()
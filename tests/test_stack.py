@@ -415,6 +415,7 @@ def test_stack_model():
             "pipelines": {
                 "pl-custom-name": {
                     "dataframe_backend": None,
+                    "cache_policy": "NONE",
                     "databricks_job": None,
                     "databricks_dlt": {
                         "dataframe_backend": None,
@@ -494,6 +495,7 @@ def test_stack_model():
                         {
                             "dataframe_backend": None,
                             "add_layer_columns": True,
+                            "cache_policy": None,
                             "dlt_template": None,
                             "description": None,
                             "drop_duplicates": None,
@@ -501,7 +503,9 @@ def test_stack_model():
                             "transformer": None,
                             "expectations": [],
                             "expectations_checkpoint_location": None,
+                            "fused_streaming": False,
                             "layer": None,
+                            "max_sink_workers": None,
                             "name": "first_node",
                             "primary_keys": None,
                             "sinks": None,
@@ -512,7 +516,10 @@ def test_stack_model():
                                 "broadcast": False,
                                 "drops": None,
                                 "filter": None,
+                                "incremental": False,
                                 "limit": None,
+                                "max_bytes_per_trigger": None,
+                                "max_files_per_trigger": None,
                                 "renames": None,
                                 "sample": None,
                                 "selects": None,
@@ -524,6 +531,7 @@ def test_stack_model():
                                 "schema_location": None,
                             },
                             "timestamp_key": None,
+                            "trigger": None,
                         }
                     ],
                     "orchestrator": "DATABRICKS_DLT",